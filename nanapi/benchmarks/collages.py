@@ -0,0 +1,153 @@
+"""Compare the bitset packer of _find_positions with the previous availability matrix scan.
+
+python -m nanapi.benchmarks.collages --sizes 100 1000 5000
+"""
+
+import argparse
+import math
+import random
+import timeit
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+from nanapi.utils.collages import ALImage, _find_positions  # pyright: ignore[reportPrivateUsage]
+
+type Sizes = list[tuple[int, int, int, list[int]]]
+
+
+def find_positions_matrix(
+    sizes: Sizes, nb_rows: int, nb_columns: int
+) -> tuple[list[tuple[int, int]], npt.NDArray[Any]]:
+    """Previous implementation of _find_positions, as reference."""
+    availability_matrix = np.ones((nb_rows, nb_columns), dtype=bool)
+    positions: list[tuple[int, int]] = [(0, 0) for _ in range(len(sizes))]
+
+    # We reverse the list to delete from the end
+    sizes.reverse()
+
+    i = 0
+    while i < availability_matrix.shape[0]:
+        j = 0
+        while j < availability_matrix.shape[1]:
+            curr_size_i = len(sizes) - 1
+            found_position = False
+            while not found_position and curr_size_i >= 0:
+                found_position = True
+                (index, width, height, individual_sizes) = sizes[curr_size_i]
+                while i + height - 1 >= availability_matrix.shape[0]:
+                    # Last lines, need to make the matrix bigger
+                    new_row = np.ones((1, availability_matrix.shape[1]))
+                    availability_matrix = np.vstack((availability_matrix, new_row))
+                if j + width - 1 < availability_matrix.shape[1]:
+                    for i_i in range(height):
+                        for j_i in range(width):
+                            if not availability_matrix[i + i_i, j + j_i]:
+                                found_position = False
+                else:
+                    found_position = False
+
+                if found_position:
+                    positions[index] = (i, j)
+                    curr_width = 0
+                    for individual_size in individual_sizes:
+                        for i_i in range(individual_size):
+                            for j_i in range(curr_width, curr_width + individual_size):
+                                availability_matrix[i + i_i, j + j_i] = False
+                        curr_width += individual_size
+                    del sizes[curr_size_i]
+                else:
+                    curr_size_i -= 1
+
+            j += 1
+        i += 1
+
+        if i == availability_matrix.shape[0] and sizes:
+            # No more line, need to make the matrix bigger
+            new_row = np.ones((1, availability_matrix.shape[1]))
+            availability_matrix = np.vstack((availability_matrix, new_row))
+
+    # Cleaning
+    h, w = availability_matrix.shape
+    for i in range(availability_matrix.shape[0]):
+        if availability_matrix[i].all():
+            h = i
+            break
+
+    for i in range(availability_matrix.shape[1]):
+        if availability_matrix[:, i].all():
+            w = i
+            break
+
+    availability_matrix = availability_matrix[:h, :w]
+
+    return positions, availability_matrix
+
+
+def make_collection(nb_tiles: int, rnd: random.Random) -> tuple[Sizes, int, int]:
+    # mostly single waifus, some custom position groups and ascended 2×, 4× and 8× tiles
+    zooms = [1] * 80 + [2] * 15 + [4] * 4 + [8]
+    groups: list[list[int]] = []
+    for _ in range(nb_tiles):
+        zoom = rnd.choice(zooms)
+        if groups and rnd.random() < 0.1:
+            groups[-1].append(zoom)
+        else:
+            groups.append([zoom])
+
+    sizes = [(i, sum(g), max(g), g) for i, g in enumerate(groups)]
+    n_imgs = sum(zoom**2 for g in groups for zoom in g)
+    total_est_height = math.sqrt(9 / 16 * ALImage.WIDTH * ALImage.HEIGHT * n_imgs)
+    nb_rows = round(total_est_height / ALImage.HEIGHT)
+    nb_columns = max(math.ceil(n_imgs / nb_rows), max(s[1] for s in sizes))
+    return sizes, nb_rows, nb_columns
+
+
+def copy_sizes(sizes: Sizes) -> Sizes:
+    return [(i, w, h, list(s)) for i, w, h, s in sizes]
+
+
+def bench(nb_tiles: int, number: int, reference: bool, rnd: random.Random):
+    sizes, nb_rows, nb_columns = make_collection(nb_tiles, rnd)
+
+    bitset = timeit.timeit(
+        lambda: _find_positions(copy_sizes(sizes), nb_rows, nb_columns), number=number
+    )
+    line = f'{nb_tiles:>8}  {len(sizes):>7}  {bitset / number * 1e3:>12.1f}'
+
+    if reference:
+        matrix = timeit.timeit(
+            lambda: find_positions_matrix(copy_sizes(sizes), nb_rows, nb_columns), number=1
+        )
+        line += f'  {matrix * 1e3:>12.1f}'
+
+        # sanity check: both give the same layout
+        positions, (h, w) = _find_positions(copy_sizes(sizes), nb_rows, nb_columns)
+        ref_positions, ref_matrix = find_positions_matrix(copy_sizes(sizes), nb_rows, nb_columns)
+        assert positions == ref_positions and (h, w) == ref_matrix.shape
+
+    print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare collage packing methods.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 1000, 5000])
+    parser.add_argument('--number', type=int, default=5, help='packings per measure')
+    parser.add_argument(
+        '--no-reference', action='store_true', help='skip the slow previous implementation'
+    )
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    rnd = random.Random(args.seed)
+    header = f'{"tiles":>8}  {"groups":>7}  {"bitset (ms)":>12}'
+    if not args.no_reference:
+        header += f'  {"matrix (ms)":>12}'
+    print(header)
+    for nb_tiles in args.sizes:
+        bench(nb_tiles, args.number, not args.no_reference, rnd)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+"""Compare Generator.choice with AliasSampler for drawing rolls from a pool.
+
+python -m nanapi.benchmarks.rolls --sizes 1000 10000 50000 --nb 10
+"""
+
+import argparse
+import timeit
+
+import numpy as np
+
+from nanapi.models.waicolle import E, S
+from nanapi.utils.waicolle import RATES, RNG, AliasSampler, CharaPool
+
+
+def make_pool(size: int):
+    tiers = RNG.choice([rank.tier for rank in RATES], size=size).astype(np.int8)
+    pool = CharaPool(np.arange(size, dtype=np.int32), tiers)
+    return pool.probas(RATES, E, S)
+
+
+def bench(size: int, nb: int, number: int):
+    charas, probas = make_pool(size)
+
+    build = timeit.timeit(lambda: AliasSampler(charas, probas), number=5) / 5
+    sampler = AliasSampler(charas, probas)
+    choice = timeit.timeit(lambda: RNG.choice(charas, size=nb, p=probas), number=number)  # pyright: ignore[reportUnknownLambdaType]
+    alias = timeit.timeit(lambda: sampler.sample(RNG, nb), number=number)
+    print(
+        f'{size:>8}  {choice / number * 1e6:>12.1f}  '
+        f'{alias / number * 1e6:>11.1f}  {build * 1e3:>16.1f}'
+    )
+
+    # sanity check: the alias tables draw from the pool distribution
+    draws = sampler.sample(RNG, 200 * size)
+    observed = np.bincount(draws, minlength=size) / len(draws)
+    print(f'{"":>8}  max deviation from probas: {np.max(np.abs(observed - probas)):.2e}')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare roll sampling methods.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 50000])
+    parser.add_argument('--nb', type=int, default=10, help='characters per roll')
+    parser.add_argument('--number', type=int, default=1000, help='rolls per measure')
+    args = parser.parse_args()
+
+    print(f'{"pool":>8}  {"choice (µs)":>12}  {"alias (µs)":>11}  {"alias build (ms)":>16}')
+    for size in args.sizes:
+        bench(size, args.nb, args.number)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+"""Measure the startup time of a worker.
+
+Runs `python -X importtime` on the app module in fresh interpreters and reports the
+median import time per module and per package, then the time needed to build the
+deferred query adapters.
+
+    python -m nanapi.benchmarks.startup --runs 5 --top 30
+"""
+
+import argparse
+import importlib
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+
+
+def import_times(module: str) -> dict[str, tuple[int, int]]:
+    """Return the self and cumulative import times (µs) of each module."""
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times: dict[str, tuple[int, int]] = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        self_us, cumulative_us, name = line.removeprefix('import time:').split('|')
+        if not self_us.strip().isdigit():
+            # header
+            continue
+        times[name.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+
+def package(name: str, depth: int) -> str:
+    return '.'.join(name.split('.')[:depth])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure the startup time of a worker.')
+    parser.add_argument('--module', default='nanapi.fastapi')
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--top', type=int, default=30)
+    parser.add_argument('--depth', type=int, default=3, help='package grouping depth')
+    args = parser.parse_args()
+
+    runs = [import_times(args.module) for _ in range(args.runs)]
+    self_times = defaultdict[str, list[int]](list)
+    for run in runs:
+        for name, (self_us, _) in run.items():
+            self_times[name].append(self_us)
+    medians = {name: statistics.median(times) for name, times in self_times.items()}
+
+    total = statistics.median(run[args.module][1] for run in runs)
+    print(f'{args.module}: {total / 1000:.1f} ms (median of {args.runs} runs)\n')
+
+    print(f'{"self (ms)":>10}  module')
+    for name, self_us in sorted(medians.items(), key=lambda kv: kv[1], reverse=True)[: args.top]:
+        print(f'{self_us / 1000:>10.1f}  {name}')
+
+    packages = defaultdict[str, float](float)
+    for name, self_us in medians.items():
+        packages[package(name, args.depth)] += self_us
+    print(f'\n{"self (ms)":>10}  package')
+    for name, self_us in sorted(packages.items(), key=lambda kv: kv[1], reverse=True)[: args.top]:
+        print(f'{self_us / 1000:>10.1f}  {name}')
+
+    importlib.import_module(args.module)
+    from nanapi.utils.database import query_adapters
+
+    adapters = list(query_adapters())
+    begin = time.perf_counter()
+    for adapter in adapters:
+        adapter.rebuild()
+    duration = time.perf_counter() - begin
+    print(f'\n{len(adapters)} query adapters built in {duration * 1000:.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
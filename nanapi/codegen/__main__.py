@@ -0,0 +1,20 @@
+"""gel-pydantic-codegen with the query module template of nanapi.
+
+Its template is copied to template.py.jinja, changed to build the list and optional result
+adapters with defer_build: they are then built on first use instead of at import, see
+nanapi.utils.database.warm_adapters.
+
+python -m nanapi.codegen nanapi/database/
+"""
+
+from pathlib import Path
+
+from gel_pydantic_codegen.__main__ import cli
+from gel_pydantic_codegen.generator import Generator
+
+# the FileSystemLoader of the package directory, looked up after this one
+loader = Generator.jinja_env.loader
+loader.searchpath.insert(0, str(Path(__file__).parent))  # pyright: ignore[reportAttributeAccessIssue, reportOptionalMemberAccess, reportUnknownMemberType]
+
+if __name__ == '__main__':
+    cli()
@@ -3,7 +3,7 @@
 from uuid import UUID
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 delete ai::Skill filter .id = <uuid>$id
@@ -14,7 +14,9 @@ class SkillDeleteByIdResult(BaseModel):
     id: UUID
 
 
-adapter = TypeAdapter[SkillDeleteByIdResult | None](SkillDeleteByIdResult | None)
+adapter = TypeAdapter[SkillDeleteByIdResult | None](
+    SkillDeleteByIdResult | None, config=ConfigDict(defer_build=True)
+)
 
 
 async def skill_delete_by_id(
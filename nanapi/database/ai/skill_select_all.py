@@ -3,7 +3,7 @@
 from uuid import UUID
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 select ai::Skill { * } filter .client = global client
@@ -17,7 +17,9 @@ class SkillSelectAllResult(BaseModel):
     name: str
 
 
-adapter = TypeAdapter[list[SkillSelectAllResult]](list[SkillSelectAllResult])
+adapter = TypeAdapter[list[SkillSelectAllResult]](
+    list[SkillSelectAllResult], config=ConfigDict(defer_build=True)
+)
 
 
 async def skill_select_all(
@@ -2,7 +2,7 @@
 # pyright: strict
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -30,7 +30,9 @@ class AccountSelectResult(BaseModel):
     username: str
 
 
-adapter = TypeAdapter[list[AccountSelectResult]](list[AccountSelectResult])
+adapter = TypeAdapter[list[AccountSelectResult]](
+    list[AccountSelectResult], config=ConfigDict(defer_build=True)
+)
 
 
 async def account_select(
@@ -5,7 +5,7 @@ from uuid import UUID
 
 import orjson
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -33,7 +33,9 @@ class SettingsMergeResult(BaseModel):
     id: UUID
 
 
-adapter = TypeAdapter[list[SettingsMergeResult]](list[SettingsMergeResult])
+adapter = TypeAdapter[list[SettingsMergeResult]](
+    list[SettingsMergeResult], config=ConfigDict(defer_build=True)
+)
 
 
 async def settings_merge(
@@ -2,7 +2,7 @@
 # pyright: strict
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 select amq::Setting { key, value }
@@ -15,7 +15,9 @@ class SettingsSelectAllResult(BaseModel):
     value: str
 
 
-adapter = TypeAdapter[list[SettingsSelectAllResult]](list[SettingsSelectAllResult])
+adapter = TypeAdapter[list[SettingsSelectAllResult]](
+    list[SettingsSelectAllResult], config=ConfigDict(defer_build=True)
+)
 
 
 async def settings_select_all(
@@ -5,7 +5,7 @@ from uuid import UUID
 
 import orjson
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -54,7 +54,9 @@ class AccountReplaceEntriesResult(BaseModel):
     id: UUID
 
 
-adapter = TypeAdapter[list[AccountReplaceEntriesResult]](list[AccountReplaceEntriesResult])
+adapter = TypeAdapter[list[AccountReplaceEntriesResult]](
+    list[AccountReplaceEntriesResult], config=ConfigDict(defer_build=True)
+)
 
 
 async def account_replace_entries(
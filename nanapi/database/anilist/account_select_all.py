@@ -3,7 +3,7 @@
 from enum import StrEnum
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 select anilist::Account {
@@ -31,7 +31,9 @@ class AccountSelectAllResult(BaseModel):
     username: str
 
 
-adapter = TypeAdapter[list[AccountSelectAllResult]](list[AccountSelectAllResult])
+adapter = TypeAdapter[list[AccountSelectAllResult]](
+    list[AccountSelectAllResult], config=ConfigDict(defer_build=True)
+)
 
 
 async def account_select_all(
@@ -2,7 +2,7 @@
 # pyright: strict
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 select anilist::Media {
@@ -17,7 +17,9 @@ class AnimeSelectIdsUpcomingResult(BaseModel):
     id_al: int
 
 
-adapter = TypeAdapter[list[AnimeSelectIdsUpcomingResult]](list[AnimeSelectIdsUpcomingResult])
+adapter = TypeAdapter[list[AnimeSelectIdsUpcomingResult]](
+    list[AnimeSelectIdsUpcomingResult], config=ConfigDict(defer_build=True)
+)
 
 
 async def anime_select_ids_upcoming(
@@ -4,7 +4,7 @@ from typing import Literal, NamedTuple
 from uuid import UUID
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -53,7 +53,9 @@ class CEdgeMergeMultipleResult(BaseModel):
     id: UUID
 
 
-adapter = TypeAdapter[list[CEdgeMergeMultipleResult]](list[CEdgeMergeMultipleResult])
+adapter = TypeAdapter[list[CEdgeMergeMultipleResult]](
+    list[CEdgeMergeMultipleResult], config=ConfigDict(defer_build=True)
+)
 
 
 async def c_edge_merge_multiple(
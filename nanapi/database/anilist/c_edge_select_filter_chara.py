@@ -3,7 +3,7 @@
 from enum import StrEnum
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -132,7 +132,9 @@ class CEdgeSelectFilterCharaResult(BaseModel):
     voice_actors: list[CEdgeSelectFilterCharaResultVoiceActors]
 
 
-adapter = TypeAdapter[list[CEdgeSelectFilterCharaResult]](list[CEdgeSelectFilterCharaResult])
+adapter = TypeAdapter[list[CEdgeSelectFilterCharaResult]](
+    list[CEdgeSelectFilterCharaResult], config=ConfigDict(defer_build=True)
+)
 
 
 async def c_edge_select_filter_chara(
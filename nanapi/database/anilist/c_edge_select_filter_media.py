@@ -3,7 +3,7 @@
 from enum import StrEnum
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -111,7 +111,9 @@ class CEdgeSelectFilterMediaResult(BaseModel):
     voice_actors: list[CEdgeSelectFilterMediaResultVoiceActors]
 
 
-adapter = TypeAdapter[list[CEdgeSelectFilterMediaResult]](list[CEdgeSelectFilterMediaResult])
+adapter = TypeAdapter[list[CEdgeSelectFilterMediaResult]](
+    list[CEdgeSelectFilterMediaResult], config=ConfigDict(defer_build=True)
+)
 
 
 async def c_edge_select_filter_media(
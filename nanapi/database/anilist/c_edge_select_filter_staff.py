@@ -3,7 +3,7 @@
 from enum import StrEnum
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -141,7 +141,9 @@ class CEdgeSelectFilterStaffResult(BaseModel):
     media: CEdgeSelectFilterStaffResultMedia
 
 
-adapter = TypeAdapter[list[CEdgeSelectFilterStaffResult]](list[CEdgeSelectFilterStaffResult])
+adapter = TypeAdapter[list[CEdgeSelectFilterStaffResult]](
+    list[CEdgeSelectFilterStaffResult], config=ConfigDict(defer_build=True)
+)
 
 
 async def c_edge_select_filter_staff(
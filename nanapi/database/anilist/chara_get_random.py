@@ -3,7 +3,7 @@
 from enum import StrEnum
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 select anilist::Character {
@@ -57,7 +57,9 @@ class CharaGetRandomResult(BaseModel):
     site_url: str
 
 
-adapter = TypeAdapter[CharaGetRandomResult | None](CharaGetRandomResult | None)
+adapter = TypeAdapter[CharaGetRandomResult | None](
+    CharaGetRandomResult | None, config=ConfigDict(defer_build=True)
+)
 
 
 async def chara_get_random(
@@ -5,7 +5,7 @@ from uuid import UUID
 
 import orjson
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -68,7 +68,9 @@ class CharaMergeMultipleResult(BaseModel):
     id: UUID
 
 
-adapter = TypeAdapter[list[CharaMergeMultipleResult]](list[CharaMergeMultipleResult])
+adapter = TypeAdapter[list[CharaMergeMultipleResult]](
+    list[CharaMergeMultipleResult], config=ConfigDict(defer_build=True)
+)
 
 
 async def chara_merge_multiple(
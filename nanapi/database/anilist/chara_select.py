@@ -3,7 +3,7 @@
 from enum import StrEnum
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -57,7 +57,9 @@ class CharaSelectResult(BaseModel):
     site_url: str
 
 
-adapter = TypeAdapter[list[CharaSelectResult]](list[CharaSelectResult])
+adapter = TypeAdapter[list[CharaSelectResult]](
+    list[CharaSelectResult], config=ConfigDict(defer_build=True)
+)
 
 
 async def chara_select(
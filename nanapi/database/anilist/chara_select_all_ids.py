@@ -2,7 +2,7 @@
 # pyright: strict
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 select anilist::Character { id_al, last_update }
@@ -15,7 +15,9 @@ class CharaSelectAllIdsResult(BaseModel):
     last_update: int
 
 
-adapter = TypeAdapter[list[CharaSelectAllIdsResult]](list[CharaSelectAllIdsResult])
+adapter = TypeAdapter[list[CharaSelectAllIdsResult]](
+    list[CharaSelectAllIdsResult], config=ConfigDict(defer_build=True)
+)
 
 
 async def chara_select_all_ids(
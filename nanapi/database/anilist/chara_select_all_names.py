@@ -2,7 +2,7 @@
 # pyright: strict
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 select anilist::Character {
@@ -24,7 +24,9 @@ class CharaSelectAllNamesResult(BaseModel):
     name_user_preferred: str
 
 
-adapter = TypeAdapter[list[CharaSelectAllNamesResult]](list[CharaSelectAllNamesResult])
+adapter = TypeAdapter[list[CharaSelectAllNamesResult]](
+    list[CharaSelectAllNamesResult], config=ConfigDict(defer_build=True)
+)
 
 
 async def chara_select_all_names(
@@ -3,7 +3,7 @@
 from enum import StrEnum
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -60,7 +60,9 @@ class CharaSelectBirthdayResult(BaseModel):
     site_url: str
 
 
-adapter = TypeAdapter[list[CharaSelectBirthdayResult]](list[CharaSelectBirthdayResult])
+adapter = TypeAdapter[list[CharaSelectBirthdayResult]](
+    list[CharaSelectBirthdayResult], config=ConfigDict(defer_build=True)
+)
 
 
 async def chara_select_birthday(
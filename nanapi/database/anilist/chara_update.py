@@ -3,7 +3,7 @@
 from uuid import UUID
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -23,7 +23,9 @@ class CharaUpdateResult(BaseModel):
     id: UUID
 
 
-adapter = TypeAdapter[list[CharaUpdateResult]](list[CharaUpdateResult])
+adapter = TypeAdapter[list[CharaUpdateResult]](
+    list[CharaUpdateResult], config=ConfigDict(defer_build=True)
+)
 
 
 async def chara_update(
@@ -4,7 +4,7 @@ from enum import StrEnum
 from typing import Literal
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -67,7 +67,9 @@ class EntrySelectAllResult(BaseModel):
     status: AnilistEntryStatus
 
 
-adapter = TypeAdapter[list[EntrySelectAllResult]](list[EntrySelectAllResult])
+adapter = TypeAdapter[list[EntrySelectAllResult]](
+    list[EntrySelectAllResult], config=ConfigDict(defer_build=True)
+)
 
 
 async def entry_select_all(
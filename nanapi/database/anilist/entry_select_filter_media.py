@@ -3,7 +3,7 @@
 from enum import StrEnum
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -46,7 +46,9 @@ class EntrySelectFilterMediaResult(BaseModel):
     status: AnilistEntryStatus
 
 
-adapter = TypeAdapter[list[EntrySelectFilterMediaResult]](list[EntrySelectFilterMediaResult])
+adapter = TypeAdapter[list[EntrySelectFilterMediaResult]](
+    list[EntrySelectFilterMediaResult], config=ConfigDict(defer_build=True)
+)
 
 
 async def entry_select_filter_media(
@@ -3,15 +3,15 @@
 from uuid import UUID
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
   url := <str>$url,
-  data := <str>$data,
+  digest := <str>$digest,
 insert anilist::Image {
   url := url,
-  data := data,
+  digest := digest,
 }
 unless conflict;
 """
@@ -21,18 +21,20 @@ class ImageSaveResult(BaseModel):
     id: UUID
 
 
-adapter = TypeAdapter[ImageSaveResult | None](ImageSaveResult | None)
+adapter = TypeAdapter[ImageSaveResult | None](
+    ImageSaveResult | None, config=ConfigDict(defer_build=True)
+)
 
 
 async def image_save(
     executor: AsyncIOExecutor,
     *,
     url: str,
-    data: str,
+    digest: str,
 ) -> ImageSaveResult | None:
     resp = await executor.query_single_json(  # pyright: ignore[reportUnknownMemberType]
         EDGEQL_QUERY,
         url=url,
-        data=data,
+        digest=digest,
     )
     return adapter.validate_json(resp, strict=False)
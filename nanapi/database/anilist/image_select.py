@@ -2,13 +2,14 @@
 # pyright: strict
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
   urls := <array<str>>$urls,
 select anilist::Image {
   url,
+  digest,
   data,
 }
 filter .url in array_unpack(urls)
@@ -16,11 +17,14 @@ filter .url in array_unpack(urls)
 
 
 class ImageSelectResult(BaseModel):
-    data: str
+    data: str | None
+    digest: str | None
     url: str
 
 
-adapter = TypeAdapter[list[ImageSelectResult]](list[ImageSelectResult])
+adapter = TypeAdapter[list[ImageSelectResult]](
+    list[ImageSelectResult], config=ConfigDict(defer_build=True)
+)
 
 
 async def image_select(
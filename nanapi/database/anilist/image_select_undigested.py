@@ -0,0 +1,39 @@
+# Generated by gel-pydantic-codegen
+# pyright: strict
+from uuid import UUID
+
+from gel import AsyncIOExecutor
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+
+EDGEQL_QUERY = r"""
+with
+  batch_size := <int64>$batch_size,
+select anilist::Image {
+  id,
+  data,
+}
+filter exists .data
+limit batch_size
+"""
+
+
+class ImageSelectUndigestedResult(BaseModel):
+    id: UUID
+    data: str | None
+
+
+adapter = TypeAdapter[list[ImageSelectUndigestedResult]](
+    list[ImageSelectUndigestedResult], config=ConfigDict(defer_build=True)
+)
+
+
+async def image_select_undigested(
+    executor: AsyncIOExecutor,
+    *,
+    batch_size: int,
+) -> list[ImageSelectUndigestedResult]:
+    resp = await executor.query_json(  # pyright: ignore[reportUnknownMemberType]
+        EDGEQL_QUERY,
+        batch_size=batch_size,
+    )
+    return adapter.validate_json(resp, strict=False)
@@ -0,0 +1,48 @@
+# Generated by gel-pydantic-codegen
+# pyright: strict
+from uuid import UUID
+
+from gel import AsyncIOExecutor
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+
+EDGEQL_QUERY = r"""
+with
+  url := <str>$url,
+  zoom := <int32>$zoom,
+  enhancers := <str>$enhancers,
+  digest := <str>$digest,
+insert anilist::ImageTile {
+  url := url,
+  zoom := zoom,
+  enhancers := enhancers,
+  digest := digest,
+}
+unless conflict;
+"""
+
+
+class ImageTileSaveResult(BaseModel):
+    id: UUID
+
+
+adapter = TypeAdapter[ImageTileSaveResult | None](
+    ImageTileSaveResult | None, config=ConfigDict(defer_build=True)
+)
+
+
+async def image_tile_save(
+    executor: AsyncIOExecutor,
+    *,
+    url: str,
+    zoom: int,
+    enhancers: str,
+    digest: str,
+) -> ImageTileSaveResult | None:
+    resp = await executor.query_single_json(  # pyright: ignore[reportUnknownMemberType]
+        EDGEQL_QUERY,
+        url=url,
+        zoom=zoom,
+        enhancers=enhancers,
+        digest=digest,
+    )
+    return adapter.validate_json(resp, strict=False)
@@ -0,0 +1,41 @@
+# Generated by gel-pydantic-codegen
+# pyright: strict
+
+from gel import AsyncIOExecutor
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+
+EDGEQL_QUERY = r"""
+with
+  urls := <array<str>>$urls,
+select anilist::ImageTile {
+  url,
+  zoom,
+  enhancers,
+  digest,
+}
+filter .url in array_unpack(urls)
+"""
+
+
+class ImageTileSelectResult(BaseModel):
+    url: str
+    zoom: int
+    enhancers: str
+    digest: str
+
+
+adapter = TypeAdapter[list[ImageTileSelectResult]](
+    list[ImageTileSelectResult], config=ConfigDict(defer_build=True)
+)
+
+
+async def image_tile_select(
+    executor: AsyncIOExecutor,
+    *,
+    urls: list[str],
+) -> list[ImageTileSelectResult]:
+    resp = await executor.query_json(  # pyright: ignore[reportUnknownMemberType]
+        EDGEQL_QUERY,
+        urls=urls,
+    )
+    return adapter.validate_json(resp, strict=False)
@@ -0,0 +1,42 @@
+# Generated by gel-pydantic-codegen
+# pyright: strict
+from typing import Any
+from uuid import UUID
+
+import orjson
+from gel import AsyncIOExecutor
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+
+EDGEQL_QUERY = r"""
+with
+  digests := <json>$digests,
+for image in json_array_unpack(digests) union (
+  update anilist::Image
+  filter .id = <uuid>image['id']
+  set {
+    digest := <str>image['digest'],
+    data := {},
+  }
+)
+"""
+
+
+class ImageUpdateDigestsResult(BaseModel):
+    id: UUID
+
+
+adapter = TypeAdapter[list[ImageUpdateDigestsResult]](
+    list[ImageUpdateDigestsResult], config=ConfigDict(defer_build=True)
+)
+
+
+async def image_update_digests(
+    executor: AsyncIOExecutor,
+    *,
+    digests: Any,
+) -> list[ImageUpdateDigestsResult]:
+    resp = await executor.query_json(  # pyright: ignore[reportUnknownMemberType]
+        EDGEQL_QUERY,
+        digests=orjson.dumps(digests).decode(),
+    )
+    return adapter.validate_json(resp, strict=False)
@@ -5,7 +5,7 @@ from uuid import UUID
 
 import orjson
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -112,7 +112,9 @@ class MediaMergeMultipleResult(BaseModel):
     id: UUID
 
 
-adapter = TypeAdapter[list[MediaMergeMultipleResult]](list[MediaMergeMultipleResult])
+adapter = TypeAdapter[list[MediaMergeMultipleResult]](
+    list[MediaMergeMultipleResult], config=ConfigDict(defer_build=True)
+)
 
 
 async def media_merge_multiple(
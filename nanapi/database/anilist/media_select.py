@@ -3,7 +3,7 @@
 from enum import StrEnum
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -78,7 +78,9 @@ class MediaSelectResult(BaseModel):
     type: AnilistMediaType
 
 
-adapter = TypeAdapter[list[MediaSelectResult]](list[MediaSelectResult])
+adapter = TypeAdapter[list[MediaSelectResult]](
+    list[MediaSelectResult], config=ConfigDict(defer_build=True)
+)
 
 
 async def media_select(
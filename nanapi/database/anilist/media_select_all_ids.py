@@ -3,7 +3,7 @@
 from enum import StrEnum
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 select anilist::Media {
@@ -28,7 +28,9 @@ class MediaSelectAllIdsResult(BaseModel):
     type: AnilistMediaType
 
 
-adapter = TypeAdapter[list[MediaSelectAllIdsResult]](list[MediaSelectAllIdsResult])
+adapter = TypeAdapter[list[MediaSelectAllIdsResult]](
+    list[MediaSelectAllIdsResult], config=ConfigDict(defer_build=True)
+)
 
 
 async def media_select_all_ids(
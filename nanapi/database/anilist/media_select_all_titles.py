@@ -3,7 +3,7 @@
 from enum import StrEnum
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 select anilist::Media {
@@ -32,7 +32,9 @@ class MediaSelectAllTitlesResult(BaseModel):
     type: AnilistMediaType
 
 
-adapter = TypeAdapter[list[MediaSelectAllTitlesResult]](list[MediaSelectAllTitlesResult])
+adapter = TypeAdapter[list[MediaSelectAllTitlesResult]](
+    list[MediaSelectAllTitlesResult], config=ConfigDict(defer_build=True)
+)
 
 
 async def media_select_all_titles(
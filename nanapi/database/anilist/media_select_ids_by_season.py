@@ -3,7 +3,7 @@
 from typing import Literal
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -28,7 +28,9 @@ class MediaSelectIdsBySeasonResult(BaseModel):
     id_al: int
 
 
-adapter = TypeAdapter[list[MediaSelectIdsBySeasonResult]](list[MediaSelectIdsBySeasonResult])
+adapter = TypeAdapter[list[MediaSelectIdsBySeasonResult]](
+    list[MediaSelectIdsBySeasonResult], config=ConfigDict(defer_build=True)
+)
 
 
 async def media_select_ids_by_season(
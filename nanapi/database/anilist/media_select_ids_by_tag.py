@@ -2,7 +2,7 @@
 # pyright: strict
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -19,7 +19,9 @@ class MediaSelectIdsByTagResult(BaseModel):
     id_al: int
 
 
-adapter = TypeAdapter[list[MediaSelectIdsByTagResult]](list[MediaSelectIdsByTagResult])
+adapter = TypeAdapter[list[MediaSelectIdsByTagResult]](
+    list[MediaSelectIdsByTagResult], config=ConfigDict(defer_build=True)
+)
 
 
 async def media_select_ids_by_tag(
@@ -2,7 +2,7 @@
 # pyright: strict
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 select anilist::Media {
@@ -18,7 +18,9 @@ class MediaSelectTopHResult(BaseModel):
     id_al: int
 
 
-adapter = TypeAdapter[list[MediaSelectTopHResult]](list[MediaSelectTopHResult])
+adapter = TypeAdapter[list[MediaSelectTopHResult]](
+    list[MediaSelectTopHResult], config=ConfigDict(defer_build=True)
+)
 
 
 async def media_select_top_h(
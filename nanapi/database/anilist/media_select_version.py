@@ -0,0 +1,36 @@
+# Generated by gel-pydantic-codegen
+# pyright: strict
+from datetime import datetime
+
+from gel import AsyncIOExecutor
+from pydantic import BaseModel, TypeAdapter
+
+EDGEQL_QUERY = r"""
+with
+  ids_al := <array<int32>>$ids_al,
+  items := (select anilist::Media filter .id_al in array_unpack(ids_al)),
+select {
+  count := count(items),
+  updated_at := max(items.updated_at),
+}
+"""
+
+
+class MediaSelectVersionResult(BaseModel):
+    count: int
+    updated_at: datetime | None
+
+
+adapter = TypeAdapter[MediaSelectVersionResult](MediaSelectVersionResult)
+
+
+async def media_select_version(
+    executor: AsyncIOExecutor,
+    *,
+    ids_al: list[int],
+) -> MediaSelectVersionResult:
+    resp = await executor.query_single_json(  # pyright: ignore[reportUnknownMemberType]
+        EDGEQL_QUERY,
+        ids_al=ids_al,
+    )
+    return adapter.validate_json(resp, strict=False)
@@ -5,7 +5,7 @@ from uuid import UUID
 
 import orjson
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -40,7 +40,9 @@ class StaffCEdgeMergeResult(BaseModel):
     id: UUID
 
 
-adapter = TypeAdapter[list[StaffCEdgeMergeResult]](list[StaffCEdgeMergeResult])
+adapter = TypeAdapter[list[StaffCEdgeMergeResult]](
+    list[StaffCEdgeMergeResult], config=ConfigDict(defer_build=True)
+)
 
 
 async def staff_c_edge_merge(
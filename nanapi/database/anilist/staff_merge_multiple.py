@@ -5,7 +5,7 @@ from uuid import UUID
 
 import orjson
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -74,7 +74,9 @@ class StaffMergeMultipleResult(BaseModel):
     id: UUID
 
 
-adapter = TypeAdapter[list[StaffMergeMultipleResult]](list[StaffMergeMultipleResult])
+adapter = TypeAdapter[list[StaffMergeMultipleResult]](
+    list[StaffMergeMultipleResult], config=ConfigDict(defer_build=True)
+)
 
 
 async def staff_merge_multiple(
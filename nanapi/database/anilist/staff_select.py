@@ -2,7 +2,7 @@
 # pyright: strict
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -47,7 +47,9 @@ class StaffSelectResult(BaseModel):
     site_url: str
 
 
-adapter = TypeAdapter[list[StaffSelectResult]](list[StaffSelectResult])
+adapter = TypeAdapter[list[StaffSelectResult]](
+    list[StaffSelectResult], config=ConfigDict(defer_build=True)
+)
 
 
 async def staff_select(
@@ -2,7 +2,7 @@
 # pyright: strict
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 select anilist::Staff { id_al, last_update }
@@ -15,7 +15,9 @@ class StaffSelectAllIdsResult(BaseModel):
     last_update: int
 
 
-adapter = TypeAdapter[list[StaffSelectAllIdsResult]](list[StaffSelectAllIdsResult])
+adapter = TypeAdapter[list[StaffSelectAllIdsResult]](
+    list[StaffSelectAllIdsResult], config=ConfigDict(defer_build=True)
+)
 
 
 async def staff_select_all_ids(
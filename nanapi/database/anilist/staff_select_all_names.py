@@ -2,7 +2,7 @@
 # pyright: strict
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 select anilist::Staff {
@@ -22,7 +22,9 @@ class StaffSelectAllNamesResult(BaseModel):
     name_user_preferred: str
 
 
-adapter = TypeAdapter[list[StaffSelectAllNamesResult]](list[StaffSelectAllNamesResult])
+adapter = TypeAdapter[list[StaffSelectAllNamesResult]](
+    list[StaffSelectAllNamesResult], config=ConfigDict(defer_build=True)
+)
 
 
 async def staff_select_all_names(
@@ -5,7 +5,7 @@ from uuid import UUID
 
 import orjson
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -77,7 +77,9 @@ class StaffUpdateMultipleResult(BaseModel):
     id: UUID
 
 
-adapter = TypeAdapter[list[StaffUpdateMultipleResult]](list[StaffUpdateMultipleResult])
+adapter = TypeAdapter[list[StaffUpdateMultipleResult]](
+    list[StaffUpdateMultipleResult], config=ConfigDict(defer_build=True)
+)
 
 
 async def staff_update_multiple(
@@ -5,7 +5,7 @@ from uuid import UUID
 
 import orjson
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -41,7 +41,9 @@ class TagMergeMultipleResult(BaseModel):
     id: UUID
 
 
-adapter = TypeAdapter[list[TagMergeMultipleResult]](list[TagMergeMultipleResult])
+adapter = TypeAdapter[list[TagMergeMultipleResult]](
+    list[TagMergeMultipleResult], config=ConfigDict(defer_build=True)
+)
 
 
 async def tag_merge_multiple(
@@ -2,7 +2,7 @@
 # pyright: strict
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 select anilist::Tag {
@@ -23,7 +23,9 @@ class TagSelectResult(BaseModel):
     name: str
 
 
-adapter = TypeAdapter[list[TagSelectResult]](list[TagSelectResult])
+adapter = TypeAdapter[list[TagSelectResult]](
+    list[TagSelectResult], config=ConfigDict(defer_build=True)
+)
 
 
 async def tag_select(
@@ -5,7 +5,7 @@ from enum import StrEnum
 from uuid import UUID
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -67,7 +67,9 @@ class GuildEventDeleteResult(BaseModel):
     url: str | None
 
 
-adapter = TypeAdapter[GuildEventDeleteResult | None](GuildEventDeleteResult | None)
+adapter = TypeAdapter[GuildEventDeleteResult | None](
+    GuildEventDeleteResult | None, config=ConfigDict(defer_build=True)
+)
 
 
 async def guild_event_delete(
@@ -3,7 +3,7 @@
 from uuid import UUID
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -34,7 +34,9 @@ class GuildEventParticipantAddResult(BaseModel):
     id: UUID
 
 
-adapter = TypeAdapter[GuildEventParticipantAddResult | None](GuildEventParticipantAddResult | None)
+adapter = TypeAdapter[GuildEventParticipantAddResult | None](
+    GuildEventParticipantAddResult | None, config=ConfigDict(defer_build=True)
+)
 
 
 async def guild_event_participant_add(
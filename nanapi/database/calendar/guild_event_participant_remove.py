@@ -3,7 +3,7 @@
 from uuid import UUID
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -22,7 +22,7 @@ class GuildEventParticipantRemoveResult(BaseModel):
 
 
 adapter = TypeAdapter[GuildEventParticipantRemoveResult | None](
-    GuildEventParticipantRemoveResult | None
+    GuildEventParticipantRemoveResult | None, config=ConfigDict(defer_build=True)
 )
 
 
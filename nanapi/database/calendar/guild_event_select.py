@@ -5,7 +5,7 @@ from enum import StrEnum
 from uuid import UUID
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -67,7 +67,9 @@ class GuildEventSelectResult(BaseModel):
     url: str | None
 
 
-adapter = TypeAdapter[list[GuildEventSelectResult]](list[GuildEventSelectResult])
+adapter = TypeAdapter[list[GuildEventSelectResult]](
+    list[GuildEventSelectResult], config=ConfigDict(defer_build=True)
+)
 
 
 async def guild_event_select(
@@ -3,7 +3,7 @@
 from uuid import UUID
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -17,7 +17,9 @@ class UserCalendarDeleteResult(BaseModel):
     id: UUID
 
 
-adapter = TypeAdapter[UserCalendarDeleteResult | None](UserCalendarDeleteResult | None)
+adapter = TypeAdapter[UserCalendarDeleteResult | None](
+    UserCalendarDeleteResult | None, config=ConfigDict(defer_build=True)
+)
 
 
 async def user_calendar_delete(
@@ -3,7 +3,7 @@
 from uuid import UUID
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -26,7 +26,9 @@ class UserCalendarSelectResult(BaseModel):
     user: UserCalendarSelectResultUser
 
 
-adapter = TypeAdapter[UserCalendarSelectResult | None](UserCalendarSelectResult | None)
+adapter = TypeAdapter[UserCalendarSelectResult | None](
+    UserCalendarSelectResult | None, config=ConfigDict(defer_build=True)
+)
 
 
 async def user_calendar_select(
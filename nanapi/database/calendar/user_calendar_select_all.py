@@ -3,7 +3,7 @@
 from uuid import UUID
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 select calendar::UserCalendar { ** }
@@ -23,7 +23,9 @@ class UserCalendarSelectAllResult(BaseModel):
     user: UserCalendarSelectAllResultUser
 
 
-adapter = TypeAdapter[list[UserCalendarSelectAllResult]](list[UserCalendarSelectAllResult])
+adapter = TypeAdapter[list[UserCalendarSelectAllResult]](
+    list[UserCalendarSelectAllResult], config=ConfigDict(defer_build=True)
+)
 
 
 async def user_calendar_select_all(
@@ -3,7 +3,7 @@
 from uuid import UUID
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -23,7 +23,9 @@ class ClientGetByUsernameResult(BaseModel):
     username: str
 
 
-adapter = TypeAdapter[ClientGetByUsernameResult | None](ClientGetByUsernameResult | None)
+adapter = TypeAdapter[ClientGetByUsernameResult | None](
+    ClientGetByUsernameResult | None, config=ConfigDict(defer_build=True)
+)
 
 
 async def client_get_by_username(
@@ -3,7 +3,7 @@
 from uuid import UUID
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -22,7 +22,9 @@ class MessageBulkDeleteResult(BaseModel):
     id: UUID
 
 
-adapter = TypeAdapter[list[MessageBulkDeleteResult]](list[MessageBulkDeleteResult])
+adapter = TypeAdapter[list[MessageBulkDeleteResult]](
+    list[MessageBulkDeleteResult], config=ConfigDict(defer_build=True)
+)
 
 
 async def message_bulk_delete(
@@ -4,7 +4,7 @@ from typing import Any
 from uuid import UUID
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -82,7 +82,9 @@ class MessageBulkInsertResult(BaseModel):
     id: UUID
 
 
-adapter = TypeAdapter[list[MessageBulkInsertResult]](list[MessageBulkInsertResult])
+adapter = TypeAdapter[list[MessageBulkInsertResult]](
+    list[MessageBulkInsertResult], config=ConfigDict(defer_build=True)
+)
 
 
 async def message_bulk_insert(
@@ -4,7 +4,7 @@ from typing import Any
 from uuid import UUID
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -27,7 +27,9 @@ class MessageBulkUpdateNoindexResult(BaseModel):
     id: UUID
 
 
-adapter = TypeAdapter[list[MessageBulkUpdateNoindexResult]](list[MessageBulkUpdateNoindexResult])
+adapter = TypeAdapter[list[MessageBulkUpdateNoindexResult]](
+    list[MessageBulkUpdateNoindexResult], config=ConfigDict(defer_build=True)
+)
 
 
 async def message_bulk_update_noindex(
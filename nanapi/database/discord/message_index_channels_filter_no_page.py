@@ -2,7 +2,7 @@
 # pyright: strict
 
 from gel import AsyncIOExecutor
-from pydantic import TypeAdapter
+from pydantic import ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -17,7 +17,7 @@ select distinct messages.channel_id
 """
 
 
-adapter = TypeAdapter[list[str]](list[str])
+adapter = TypeAdapter[list[str]](list[str], config=ConfigDict(defer_build=True))
 
 
 async def message_index_channels_filter_no_page(
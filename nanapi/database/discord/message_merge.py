@@ -5,7 +5,7 @@ from uuid import UUID
 
 import orjson
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -44,7 +44,9 @@ class MessageMergeResult(BaseModel):
     id: UUID
 
 
-adapter = TypeAdapter[MessageMergeResult | None](MessageMergeResult | None)
+adapter = TypeAdapter[MessageMergeResult | None](
+    MessageMergeResult | None, config=ConfigDict(defer_build=True)
+)
 
 
 async def message_merge(
@@ -4,7 +4,7 @@ from datetime import datetime
 from typing import Any
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -29,7 +29,9 @@ class MessageSelectFilterNoPageResult(BaseModel):
     data: Any
 
 
-adapter = TypeAdapter[list[MessageSelectFilterNoPageResult]](list[MessageSelectFilterNoPageResult])
+adapter = TypeAdapter[list[MessageSelectFilterNoPageResult]](
+    list[MessageSelectFilterNoPageResult], config=ConfigDict(defer_build=True)
+)
 
 
 async def message_select_filter_no_page(
@@ -3,7 +3,7 @@
 from uuid import UUID
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 delete discord::MessagePage filter .client = global client and not exists .messages
@@ -14,7 +14,9 @@ class PageDeleteEmptyResult(BaseModel):
     id: UUID
 
 
-adapter = TypeAdapter[list[PageDeleteEmptyResult]](list[PageDeleteEmptyResult])
+adapter = TypeAdapter[list[PageDeleteEmptyResult]](
+    list[PageDeleteEmptyResult], config=ConfigDict(defer_build=True)
+)
 
 
 async def page_delete_empty(
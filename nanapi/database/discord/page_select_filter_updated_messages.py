@@ -5,7 +5,7 @@ from typing import Any
 from uuid import UUID
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 select discord::MessagePage {
@@ -33,7 +33,7 @@ class PageSelectFilterUpdatedMessagesResult(BaseModel):
 
 
 adapter = TypeAdapter[list[PageSelectFilterUpdatedMessagesResult]](
-    list[PageSelectFilterUpdatedMessagesResult]
+    list[PageSelectFilterUpdatedMessagesResult], config=ConfigDict(defer_build=True)
 )
 
 
@@ -5,7 +5,7 @@ from typing import Any
 from uuid import UUID
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -32,7 +32,9 @@ class PageSelectLastResult(BaseModel):
     to_timestamp: datetime | None
 
 
-adapter = TypeAdapter[PageSelectLastResult | None](PageSelectLastResult | None)
+adapter = TypeAdapter[PageSelectLastResult | None](
+    PageSelectLastResult | None, config=ConfigDict(defer_build=True)
+)
 
 
 async def page_select_last(
@@ -3,7 +3,7 @@
 from uuid import UUID
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -27,7 +27,9 @@ class PageUpdateResult(BaseModel):
     id: UUID
 
 
-adapter = TypeAdapter[PageUpdateResult | None](PageUpdateResult | None)
+adapter = TypeAdapter[PageUpdateResult | None](
+    PageUpdateResult | None, config=ConfigDict(defer_build=True)
+)
 
 
 async def page_update(
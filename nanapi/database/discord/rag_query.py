@@ -4,7 +4,7 @@ from datetime import datetime
 from typing import Any, NamedTuple
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 select ext::ai::search(discord::MessagePage {
@@ -31,7 +31,9 @@ class RagQueryResult(NamedTuple):
     distance: float
 
 
-adapter = TypeAdapter[list[RagQueryResult]](list[RagQueryResult])
+adapter = TypeAdapter[list[RagQueryResult]](
+    list[RagQueryResult], config=ConfigDict(defer_build=True)
+)
 
 
 async def rag_query(
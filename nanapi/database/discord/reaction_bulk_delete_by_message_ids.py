@@ -3,7 +3,7 @@
 from uuid import UUID
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -19,7 +19,7 @@ class ReactionBulkDeleteByMessageIdsResult(BaseModel):
 
 
 adapter = TypeAdapter[list[ReactionBulkDeleteByMessageIdsResult]](
-    list[ReactionBulkDeleteByMessageIdsResult]
+    list[ReactionBulkDeleteByMessageIdsResult], config=ConfigDict(defer_build=True)
 )
 
 
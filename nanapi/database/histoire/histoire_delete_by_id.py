@@ -3,7 +3,7 @@
 from uuid import UUID
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 delete histoire::Histoire filter .id = <uuid>$id
@@ -14,7 +14,9 @@ class HistoireDeleteByIdResult(BaseModel):
     id: UUID
 
 
-adapter = TypeAdapter[HistoireDeleteByIdResult | None](HistoireDeleteByIdResult | None)
+adapter = TypeAdapter[HistoireDeleteByIdResult | None](
+    HistoireDeleteByIdResult | None, config=ConfigDict(defer_build=True)
+)
 
 
 async def histoire_delete_by_id(
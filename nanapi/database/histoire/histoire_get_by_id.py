@@ -3,7 +3,7 @@
 from uuid import UUID
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 select histoire::Histoire {
@@ -23,7 +23,9 @@ class HistoireGetByIdResult(BaseModel):
     title: str
 
 
-adapter = TypeAdapter[HistoireGetByIdResult | None](HistoireGetByIdResult | None)
+adapter = TypeAdapter[HistoireGetByIdResult | None](
+    HistoireGetByIdResult | None, config=ConfigDict(defer_build=True)
+)
 
 
 async def histoire_get_by_id(
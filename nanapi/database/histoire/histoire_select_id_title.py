@@ -3,7 +3,7 @@
 from uuid import UUID
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 select histoire::Histoire { id, title }
@@ -16,7 +16,9 @@ class HistoireSelectIdTitleResult(BaseModel):
     title: str
 
 
-adapter = TypeAdapter[list[HistoireSelectIdTitleResult]](list[HistoireSelectIdTitleResult])
+adapter = TypeAdapter[list[HistoireSelectIdTitleResult]](
+    list[HistoireSelectIdTitleResult], config=ConfigDict(defer_build=True)
+)
 
 
 async def histoire_select_id_title(
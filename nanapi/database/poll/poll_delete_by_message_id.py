@@ -3,7 +3,7 @@
 from uuid import UUID
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 delete poll::Poll filter .message_id = <str>$message_id
@@ -14,7 +14,9 @@ class PollDeleteByMessageIdResult(BaseModel):
     id: UUID
 
 
-adapter = TypeAdapter[PollDeleteByMessageIdResult | None](PollDeleteByMessageIdResult | None)
+adapter = TypeAdapter[PollDeleteByMessageIdResult | None](
+    PollDeleteByMessageIdResult | None, config=ConfigDict(defer_build=True)
+)
 
 
 async def poll_delete_by_message_id(
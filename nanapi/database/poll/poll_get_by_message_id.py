@@ -2,7 +2,7 @@
 # pyright: strict
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -46,7 +46,9 @@ class PollGetByMessageIdResult(BaseModel):
     question: str
 
 
-adapter = TypeAdapter[PollGetByMessageIdResult | None](PollGetByMessageIdResult | None)
+adapter = TypeAdapter[PollGetByMessageIdResult | None](
+    PollGetByMessageIdResult | None, config=ConfigDict(defer_build=True)
+)
 
 
 async def poll_get_by_message_id(
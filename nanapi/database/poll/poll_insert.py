@@ -5,7 +5,7 @@ from uuid import UUID
 
 import orjson
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -42,7 +42,9 @@ class PollInsertResult(BaseModel):
     id: UUID
 
 
-adapter = TypeAdapter[list[PollInsertResult]](list[PollInsertResult])
+adapter = TypeAdapter[list[PollInsertResult]](
+    list[PollInsertResult], config=ConfigDict(defer_build=True)
+)
 
 
 async def poll_insert(
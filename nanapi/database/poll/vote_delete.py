@@ -3,7 +3,7 @@
 from uuid import UUID
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -20,7 +20,9 @@ class VoteDeleteResult(BaseModel):
     id: UUID
 
 
-adapter = TypeAdapter[VoteDeleteResult | None](VoteDeleteResult | None)
+adapter = TypeAdapter[VoteDeleteResult | None](
+    VoteDeleteResult | None, config=ConfigDict(defer_build=True)
+)
 
 
 async def vote_delete(
@@ -3,7 +3,7 @@
 from uuid import UUID
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -43,7 +43,9 @@ class VoteMergeResult(BaseModel):
     id: UUID
 
 
-adapter = TypeAdapter[VoteMergeResult | None](VoteMergeResult | None)
+adapter = TypeAdapter[VoteMergeResult | None](
+    VoteMergeResult | None, config=ConfigDict(defer_build=True)
+)
 
 
 async def vote_merge(
@@ -2,7 +2,7 @@
 # pyright: strict
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -45,7 +45,9 @@ class PotAddResult(BaseModel):
     count: int
 
 
-adapter = TypeAdapter[PotAddResult | None](PotAddResult | None)
+adapter = TypeAdapter[PotAddResult | None](
+    PotAddResult | None, config=ConfigDict(defer_build=True)
+)
 
 
 async def pot_add(
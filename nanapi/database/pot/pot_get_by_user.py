@@ -2,7 +2,7 @@
 # pyright: strict
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -17,7 +17,9 @@ class PotGetByUserResult(BaseModel):
     count: int
 
 
-adapter = TypeAdapter[PotGetByUserResult | None](PotGetByUserResult | None)
+adapter = TypeAdapter[PotGetByUserResult | None](
+    PotGetByUserResult | None, config=ConfigDict(defer_build=True)
+)
 
 
 async def pot_get_by_user(
@@ -3,7 +3,7 @@
 from uuid import UUID
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 delete presence::Presence filter .id = <uuid>$id
@@ -14,7 +14,9 @@ class PresenceDeleteByIdResult(BaseModel):
     id: UUID
 
 
-adapter = TypeAdapter[PresenceDeleteByIdResult | None](PresenceDeleteByIdResult | None)
+adapter = TypeAdapter[PresenceDeleteByIdResult | None](
+    PresenceDeleteByIdResult | None, config=ConfigDict(defer_build=True)
+)
 
 
 async def presence_delete_by_id(
@@ -4,7 +4,7 @@ from enum import StrEnum
 from uuid import UUID
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 select presence::Presence { id, type, name }
@@ -24,7 +24,9 @@ class PresenceSelectAllResult(BaseModel):
     type: PresencePresenceType
 
 
-adapter = TypeAdapter[list[PresenceSelectAllResult]](list[PresenceSelectAllResult])
+adapter = TypeAdapter[list[PresenceSelectAllResult]](
+    list[PresenceSelectAllResult], config=ConfigDict(defer_build=True)
+)
 
 
 async def presence_select_all(
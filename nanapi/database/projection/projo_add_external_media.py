@@ -3,7 +3,7 @@
 from uuid import UUID
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -25,7 +25,9 @@ class ProjoAddExternalMediaResult(BaseModel):
     id: UUID
 
 
-adapter = TypeAdapter[ProjoAddExternalMediaResult | None](ProjoAddExternalMediaResult | None)
+adapter = TypeAdapter[ProjoAddExternalMediaResult | None](
+    ProjoAddExternalMediaResult | None, config=ConfigDict(defer_build=True)
+)
 
 
 async def projo_add_external_media(
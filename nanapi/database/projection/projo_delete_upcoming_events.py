@@ -3,7 +3,7 @@
 from uuid import UUID
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -21,7 +21,7 @@ class ProjoDeleteUpcomingEventsResult(BaseModel):
 
 
 adapter = TypeAdapter[ProjoDeleteUpcomingEventsResult | None](
-    ProjoDeleteUpcomingEventsResult | None
+    ProjoDeleteUpcomingEventsResult | None, config=ConfigDict(defer_build=True)
 )
 
 
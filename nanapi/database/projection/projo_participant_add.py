@@ -3,7 +3,7 @@
 from uuid import UUID
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -34,7 +34,9 @@ class ProjoParticipantAddResult(BaseModel):
     id: UUID
 
 
-adapter = TypeAdapter[ProjoParticipantAddResult | None](ProjoParticipantAddResult | None)
+adapter = TypeAdapter[ProjoParticipantAddResult | None](
+    ProjoParticipantAddResult | None, config=ConfigDict(defer_build=True)
+)
 
 
 async def projo_participant_add(
@@ -3,7 +3,7 @@
 from uuid import UUID
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -21,7 +21,9 @@ class ProjoRemoveExternalMediaResult(BaseModel):
     id: UUID
 
 
-adapter = TypeAdapter[ProjoRemoveExternalMediaResult | None](ProjoRemoveExternalMediaResult | None)
+adapter = TypeAdapter[ProjoRemoveExternalMediaResult | None](
+    ProjoRemoveExternalMediaResult | None, config=ConfigDict(defer_build=True)
+)
 
 
 async def projo_remove_external_media(
@@ -3,7 +3,7 @@
 from uuid import UUID
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -21,7 +21,9 @@ class ProjoRemoveMediaResult(BaseModel):
     id: UUID
 
 
-adapter = TypeAdapter[ProjoRemoveMediaResult | None](ProjoRemoveMediaResult | None)
+adapter = TypeAdapter[ProjoRemoveMediaResult | None](
+    ProjoRemoveMediaResult | None, config=ConfigDict(defer_build=True)
+)
 
 
 async def projo_remove_media(
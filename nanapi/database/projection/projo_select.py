@@ -110,7 +110,9 @@ class ProjoSelectResult(BaseModel):
     status: ProjectionStatus
 
 
-adapter = TypeAdapter[list[ProjoSelectResult]](list[ProjoSelectResult])
+adapter = TypeAdapter[list[ProjoSelectResult]](
+    list[ProjoSelectResult], config=ConfigDict(defer_build=True)
+)
 
 
 async def projo_select(
@@ -3,7 +3,7 @@
 from uuid import UUID
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -19,7 +19,9 @@ class ProjoUpdateMessageIdResult(BaseModel):
     id: UUID
 
 
-adapter = TypeAdapter[ProjoUpdateMessageIdResult | None](ProjoUpdateMessageIdResult | None)
+adapter = TypeAdapter[ProjoUpdateMessageIdResult | None](
+    ProjoUpdateMessageIdResult | None, config=ConfigDict(defer_build=True)
+)
 
 
 async def projo_update_message_id(
@@ -3,7 +3,7 @@
 from uuid import UUID
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -19,7 +19,9 @@ class ProjoUpdateNameResult(BaseModel):
     id: UUID
 
 
-adapter = TypeAdapter[ProjoUpdateNameResult | None](ProjoUpdateNameResult | None)
+adapter = TypeAdapter[ProjoUpdateNameResult | None](
+    ProjoUpdateNameResult | None, config=ConfigDict(defer_build=True)
+)
 
 
 async def projo_update_name(
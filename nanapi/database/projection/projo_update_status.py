@@ -4,7 +4,7 @@ from typing import Literal
 from uuid import UUID
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -26,7 +26,9 @@ class ProjoUpdateStatusResult(BaseModel):
     id: UUID
 
 
-adapter = TypeAdapter[ProjoUpdateStatusResult | None](ProjoUpdateStatusResult | None)
+adapter = TypeAdapter[ProjoUpdateStatusResult | None](
+    ProjoUpdateStatusResult | None, config=ConfigDict(defer_build=True)
+)
 
 
 async def projo_update_status(
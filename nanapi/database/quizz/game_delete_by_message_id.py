@@ -3,7 +3,7 @@
 from uuid import UUID
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -17,7 +17,9 @@ class GameDeleteByMessageIdResult(BaseModel):
     id: UUID
 
 
-adapter = TypeAdapter[GameDeleteByMessageIdResult | None](GameDeleteByMessageIdResult | None)
+adapter = TypeAdapter[GameDeleteByMessageIdResult | None](
+    GameDeleteByMessageIdResult | None, config=ConfigDict(defer_build=True)
+)
 
 
 async def game_delete_by_message_id(
@@ -5,7 +5,7 @@ from enum import StrEnum
 from uuid import UUID
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -82,7 +82,9 @@ class GameEndResult(BaseModel):
     winner: GameEndResultWinner | None
 
 
-adapter = TypeAdapter[GameEndResult | None](GameEndResult | None)
+adapter = TypeAdapter[GameEndResult | None](
+    GameEndResult | None, config=ConfigDict(defer_build=True)
+)
 
 
 async def game_end(
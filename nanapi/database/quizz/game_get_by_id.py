@@ -5,7 +5,7 @@ from enum import StrEnum
 from uuid import UUID
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -60,7 +60,9 @@ class GameGetByIdResult(BaseModel):
     winner: GameGetByIdResultWinner | None
 
 
-adapter = TypeAdapter[GameGetByIdResult | None](GameGetByIdResult | None)
+adapter = TypeAdapter[GameGetByIdResult | None](
+    GameGetByIdResult | None, config=ConfigDict(defer_build=True)
+)
 
 
 async def game_get_by_id(
@@ -5,7 +5,7 @@ from enum import StrEnum
 from uuid import UUID
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -63,7 +63,9 @@ class GameGetCurrentResult(BaseModel):
     winner: GameGetCurrentResultWinner | None
 
 
-adapter = TypeAdapter[GameGetCurrentResult | None](GameGetCurrentResult | None)
+adapter = TypeAdapter[GameGetCurrentResult | None](
+    GameGetCurrentResult | None, config=ConfigDict(defer_build=True)
+)
 
 
 async def game_get_current(
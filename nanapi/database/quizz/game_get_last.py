@@ -5,7 +5,7 @@ from enum import StrEnum
 from uuid import UUID
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -62,7 +62,9 @@ class GameGetLastResult(BaseModel):
     winner: GameGetLastResultWinner | None
 
 
-adapter = TypeAdapter[GameGetLastResult | None](GameGetLastResult | None)
+adapter = TypeAdapter[GameGetLastResult | None](
+    GameGetLastResult | None, config=ConfigDict(defer_build=True)
+)
 
 
 async def game_get_last(
@@ -6,7 +6,7 @@ from typing import Literal
 from uuid import UUID
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -67,7 +67,9 @@ class GameSelectResult(BaseModel):
     winner: GameSelectResultWinner | None
 
 
-adapter = TypeAdapter[list[GameSelectResult]](list[GameSelectResult])
+adapter = TypeAdapter[list[GameSelectResult]](
+    list[GameSelectResult], config=ConfigDict(defer_build=True)
+)
 
 
 async def game_select(
@@ -3,7 +3,7 @@
 from uuid import UUID
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -17,7 +17,9 @@ class QuizzDeleteByIdResult(BaseModel):
     id: UUID
 
 
-adapter = TypeAdapter[QuizzDeleteByIdResult | None](QuizzDeleteByIdResult | None)
+adapter = TypeAdapter[QuizzDeleteByIdResult | None](
+    QuizzDeleteByIdResult | None, config=ConfigDict(defer_build=True)
+)
 
 
 async def quizz_delete_by_id(
@@ -4,7 +4,7 @@ from datetime import datetime
 from uuid import UUID
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -34,7 +34,9 @@ class QuizzGetByIdResult(BaseModel):
     submitted_at: datetime
 
 
-adapter = TypeAdapter[QuizzGetByIdResult | None](QuizzGetByIdResult | None)
+adapter = TypeAdapter[QuizzGetByIdResult | None](
+    QuizzGetByIdResult | None, config=ConfigDict(defer_build=True)
+)
 
 
 async def quizz_get_by_id(
@@ -4,7 +4,7 @@ from datetime import datetime
 from uuid import UUID
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -36,7 +36,9 @@ class QuizzGetOldestResult(BaseModel):
     submitted_at: datetime
 
 
-adapter = TypeAdapter[QuizzGetOldestResult | None](QuizzGetOldestResult | None)
+adapter = TypeAdapter[QuizzGetOldestResult | None](
+    QuizzGetOldestResult | None, config=ConfigDict(defer_build=True)
+)
 
 
 async def quizz_get_oldest(
@@ -3,7 +3,7 @@
 from uuid import UUID
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -23,7 +23,9 @@ class QuizzSetAnswerResult(BaseModel):
     id: UUID
 
 
-adapter = TypeAdapter[QuizzSetAnswerResult | None](QuizzSetAnswerResult | None)
+adapter = TypeAdapter[QuizzSetAnswerResult | None](
+    QuizzSetAnswerResult | None, config=ConfigDict(defer_build=True)
+)
 
 
 async def quizz_set_answer(
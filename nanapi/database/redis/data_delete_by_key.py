@@ -3,7 +3,7 @@
 from uuid import UUID
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -17,7 +17,9 @@ class DataDeleteByKeyResult(BaseModel):
     id: UUID
 
 
-adapter = TypeAdapter[DataDeleteByKeyResult | None](DataDeleteByKeyResult | None)
+adapter = TypeAdapter[DataDeleteByKeyResult | None](
+    DataDeleteByKeyResult | None, config=ConfigDict(defer_build=True)
+)
 
 
 async def data_delete_by_key(
@@ -2,7 +2,7 @@
 # pyright: strict
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -20,7 +20,9 @@ class DataGetByKeyResult(BaseModel):
     value: str
 
 
-adapter = TypeAdapter[DataGetByKeyResult | None](DataGetByKeyResult | None)
+adapter = TypeAdapter[DataGetByKeyResult | None](
+    DataGetByKeyResult | None, config=ConfigDict(defer_build=True)
+)
 
 
 async def data_get_by_key(
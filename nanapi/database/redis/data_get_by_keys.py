@@ -0,0 +1,37 @@
+# Generated by gel-pydantic-codegen
+# pyright: strict
+
+from gel import AsyncIOExecutor
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+
+EDGEQL_QUERY = r"""
+with
+  keys := <array<str>>$keys,
+select redis::Data {
+  key,
+  value,
+}
+filter .key in array_unpack(keys)
+"""
+
+
+class DataGetByKeysResult(BaseModel):
+    key: str
+    value: str
+
+
+adapter = TypeAdapter[list[DataGetByKeysResult]](
+    list[DataGetByKeysResult], config=ConfigDict(defer_build=True)
+)
+
+
+async def data_get_by_keys(
+    executor: AsyncIOExecutor,
+    *,
+    keys: list[str],
+) -> list[DataGetByKeysResult]:
+    resp = await executor.query_json(  # pyright: ignore[reportUnknownMemberType]
+        EDGEQL_QUERY,
+        keys=keys,
+    )
+    return adapter.validate_json(resp, strict=False)
@@ -0,0 +1,45 @@
+# Generated by gel-pydantic-codegen
+# pyright: strict
+
+from gel import AsyncIOExecutor
+from pydantic import BaseModel, TypeAdapter
+
+EDGEQL_QUERY = r"""
+with
+  key := <str>$key,
+  value := <str>$value,
+  data := (
+    insert redis::Data {
+      key := key,
+      value := value,
+    }
+    unless conflict on .key
+    else (select redis::Data)
+  ),
+select data {
+  key,
+  value,
+}
+"""
+
+
+class DataInsertDefaultResult(BaseModel):
+    key: str
+    value: str
+
+
+adapter = TypeAdapter[DataInsertDefaultResult](DataInsertDefaultResult)
+
+
+async def data_insert_default(
+    executor: AsyncIOExecutor,
+    *,
+    key: str,
+    value: str,
+) -> DataInsertDefaultResult:
+    resp = await executor.query_single_json(  # pyright: ignore[reportUnknownMemberType]
+        EDGEQL_QUERY,
+        key=key,
+        value=value,
+    )
+    return adapter.validate_json(resp, strict=False)
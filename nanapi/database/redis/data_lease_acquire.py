@@ -0,0 +1,48 @@
+# Generated by gel-pydantic-codegen
+# pyright: strict
+from gel import AsyncIOExecutor
+from pydantic import TypeAdapter
+
+EDGEQL_QUERY = r"""
+with
+  key := <str>$key,
+  owner := <str>$owner,
+  ttl := <float64>$ttl,
+  now := datetime_get(datetime_of_statement(), 'epochseconds'),
+  value := to_str(<json>(owner := owner, expires := now + ttl)),
+  lease := (
+    insert redis::Data {
+      key := key,
+      value := value,
+    }
+    unless conflict on .key
+    else (
+      update redis::Data
+      filter <str>to_json(.value)['owner'] = owner
+        or <float64>to_json(.value)['expires'] < now
+      set {
+        value := value,
+      }
+    )
+  ),
+select exists lease
+"""
+
+
+adapter = TypeAdapter[bool](bool)
+
+
+async def data_lease_acquire(
+    executor: AsyncIOExecutor,
+    *,
+    key: str,
+    owner: str,
+    ttl: float,
+) -> bool:
+    resp = await executor.query_single_json(  # pyright: ignore[reportUnknownMemberType]
+        EDGEQL_QUERY,
+        key=key,
+        owner=owner,
+        ttl=ttl,
+    )
+    return adapter.validate_json(resp, strict=False)
@@ -0,0 +1,38 @@
+# Generated by gel-pydantic-codegen
+# pyright: strict
+from uuid import UUID
+
+from gel import AsyncIOExecutor
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+
+EDGEQL_QUERY = r"""
+with
+  key := <str>$key,
+  owner := <str>$owner,
+  lease := (select redis::Data filter .key = key),
+delete lease
+filter <str>to_json(.value)['owner'] = owner
+"""
+
+
+class DataLeaseReleaseResult(BaseModel):
+    id: UUID
+
+
+adapter = TypeAdapter[DataLeaseReleaseResult | None](
+    DataLeaseReleaseResult | None, config=ConfigDict(defer_build=True)
+)
+
+
+async def data_lease_release(
+    executor: AsyncIOExecutor,
+    *,
+    key: str,
+    owner: str,
+) -> DataLeaseReleaseResult | None:
+    resp = await executor.query_single_json(  # pyright: ignore[reportUnknownMemberType]
+        EDGEQL_QUERY,
+        key=key,
+        owner=owner,
+    )
+    return adapter.validate_json(resp, strict=False)
@@ -2,7 +2,7 @@
 # pyright: strict
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -18,7 +18,9 @@ class DataSelectKeyIlikeResult(BaseModel):
     key: str
 
 
-adapter = TypeAdapter[list[DataSelectKeyIlikeResult]](list[DataSelectKeyIlikeResult])
+adapter = TypeAdapter[list[DataSelectKeyIlikeResult]](
+    list[DataSelectKeyIlikeResult], config=ConfigDict(defer_build=True)
+)
 
 
 async def data_select_key_ilike(
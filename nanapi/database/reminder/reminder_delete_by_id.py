@@ -3,7 +3,7 @@
 from uuid import UUID
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 delete reminder::Reminder filter .id = <uuid>$id;
@@ -14,7 +14,9 @@ class ReminderDeleteByIdResult(BaseModel):
     id: UUID
 
 
-adapter = TypeAdapter[ReminderDeleteByIdResult | None](ReminderDeleteByIdResult | None)
+adapter = TypeAdapter[ReminderDeleteByIdResult | None](
+    ReminderDeleteByIdResult | None, config=ConfigDict(defer_build=True)
+)
 
 
 async def reminder_delete_by_id(
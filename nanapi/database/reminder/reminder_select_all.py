@@ -4,7 +4,7 @@ from datetime import datetime
 from uuid import UUID
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 select reminder::Reminder {
@@ -32,7 +32,9 @@ class ReminderSelectAllResult(BaseModel):
     user: ReminderSelectAllResultUser
 
 
-adapter = TypeAdapter[list[ReminderSelectAllResult]](list[ReminderSelectAllResult])
+adapter = TypeAdapter[list[ReminderSelectAllResult]](
+    list[ReminderSelectAllResult], config=ConfigDict(defer_build=True)
+)
 
 
 async def reminder_select_all(
@@ -3,7 +3,7 @@
 from uuid import UUID
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -17,7 +17,9 @@ class RoleDeleteByRoleIdResult(BaseModel):
     id: UUID
 
 
-adapter = TypeAdapter[RoleDeleteByRoleIdResult | None](RoleDeleteByRoleIdResult | None)
+adapter = TypeAdapter[RoleDeleteByRoleIdResult | None](
+    RoleDeleteByRoleIdResult | None, config=ConfigDict(defer_build=True)
+)
 
 
 async def role_delete_by_role_id(
@@ -2,7 +2,7 @@
 # pyright: strict
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 select role::Role {
@@ -18,7 +18,9 @@ class RoleSelectAllResult(BaseModel):
     role_id: str
 
 
-adapter = TypeAdapter[list[RoleSelectAllResult]](list[RoleSelectAllResult])
+adapter = TypeAdapter[list[RoleSelectAllResult]](
+    list[RoleSelectAllResult], config=ConfigDict(defer_build=True)
+)
 
 
 async def role_select_all(
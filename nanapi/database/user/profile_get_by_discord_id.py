@@ -3,7 +3,7 @@
 from datetime import datetime
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -42,7 +42,9 @@ class ProfileGetByDiscordIdResult(BaseModel):
     user: ProfileGetByDiscordIdResultUser
 
 
-adapter = TypeAdapter[ProfileGetByDiscordIdResult | None](ProfileGetByDiscordIdResult | None)
+adapter = TypeAdapter[ProfileGetByDiscordIdResult | None](
+    ProfileGetByDiscordIdResult | None, config=ConfigDict(defer_build=True)
+)
 
 
 async def profile_get_by_discord_id(
@@ -3,7 +3,7 @@
 from datetime import datetime
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -42,7 +42,7 @@ class ProfileSelectFilterDiscordIdResult(BaseModel):
 
 
 adapter = TypeAdapter[list[ProfileSelectFilterDiscordIdResult]](
-    list[ProfileSelectFilterDiscordIdResult]
+    list[ProfileSelectFilterDiscordIdResult], config=ConfigDict(defer_build=True)
 )
 
 
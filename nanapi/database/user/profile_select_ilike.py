@@ -3,7 +3,7 @@
 from datetime import datetime
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -43,7 +43,9 @@ class ProfileSelectIlikeResult(BaseModel):
     user: ProfileSelectIlikeResultUser
 
 
-adapter = TypeAdapter[list[ProfileSelectIlikeResult]](list[ProfileSelectIlikeResult])
+adapter = TypeAdapter[list[ProfileSelectIlikeResult]](
+    list[ProfileSelectIlikeResult], config=ConfigDict(defer_build=True)
+)
 
 
 async def profile_select_ilike(
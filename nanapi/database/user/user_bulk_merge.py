@@ -5,7 +5,7 @@ from uuid import UUID
 
 import orjson
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -32,7 +32,9 @@ class UserBulkMergeResult(BaseModel):
     id: UUID
 
 
-adapter = TypeAdapter[list[UserBulkMergeResult]](list[UserBulkMergeResult])
+adapter = TypeAdapter[list[UserBulkMergeResult]](
+    list[UserBulkMergeResult], config=ConfigDict(defer_build=True)
+)
 
 
 async def user_bulk_merge(
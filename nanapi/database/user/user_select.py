@@ -2,7 +2,7 @@
 # pyright: strict
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 select user::User {
@@ -19,7 +19,9 @@ class UserSelectResult(BaseModel):
     discord_username: str
 
 
-adapter = TypeAdapter[list[UserSelectResult]](list[UserSelectResult])
+adapter = TypeAdapter[list[UserSelectResult]](
+    list[UserSelectResult], config=ConfigDict(defer_build=True)
+)
 
 
 async def user_select(
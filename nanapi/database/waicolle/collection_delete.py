@@ -3,7 +3,7 @@
 from uuid import UUID
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -17,7 +17,9 @@ class CollectionDeleteResult(BaseModel):
     id: UUID
 
 
-adapter = TypeAdapter[CollectionDeleteResult | None](CollectionDeleteResult | None)
+adapter = TypeAdapter[CollectionDeleteResult | None](
+    CollectionDeleteResult | None, config=ConfigDict(defer_build=True)
+)
 
 
 async def collection_delete(
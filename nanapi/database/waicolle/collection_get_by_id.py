@@ -3,7 +3,7 @@
 from uuid import UUID
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -41,7 +41,9 @@ class CollectionGetByIdResult(BaseModel):
     staffs_ids_al: list[int]
 
 
-adapter = TypeAdapter[CollectionGetByIdResult | None](CollectionGetByIdResult | None)
+adapter = TypeAdapter[CollectionGetByIdResult | None](
+    CollectionGetByIdResult | None, config=ConfigDict(defer_build=True)
+)
 
 
 async def collection_get_by_id(
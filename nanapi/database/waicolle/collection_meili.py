@@ -3,7 +3,7 @@
 from uuid import UUID
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 group waicolle::Collection {
@@ -47,7 +47,9 @@ class CollectionMeiliResult(BaseModel):
     key: CollectionMeiliResultKey
 
 
-adapter = TypeAdapter[list[CollectionMeiliResult]](list[CollectionMeiliResult])
+adapter = TypeAdapter[list[CollectionMeiliResult]](
+    list[CollectionMeiliResult], config=ConfigDict(defer_build=True)
+)
 
 
 async def collection_meili(
@@ -3,7 +3,7 @@
 from uuid import UUID
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -22,7 +22,9 @@ class CollectionRemoveMediaResult(BaseModel):
     id: UUID
 
 
-adapter = TypeAdapter[CollectionRemoveMediaResult | None](CollectionRemoveMediaResult | None)
+adapter = TypeAdapter[CollectionRemoveMediaResult | None](
+    CollectionRemoveMediaResult | None, config=ConfigDict(defer_build=True)
+)
 
 
 async def collection_remove_media(
@@ -3,7 +3,7 @@
 from uuid import UUID
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -22,7 +22,9 @@ class CollectionRemoveStaffResult(BaseModel):
     id: UUID
 
 
-adapter = TypeAdapter[CollectionRemoveStaffResult | None](CollectionRemoveStaffResult | None)
+adapter = TypeAdapter[CollectionRemoveStaffResult | None](
+    CollectionRemoveStaffResult | None, config=ConfigDict(defer_build=True)
+)
 
 
 async def collection_remove_staff(
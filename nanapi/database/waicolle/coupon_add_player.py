@@ -3,7 +3,7 @@
 from uuid import UUID
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -22,7 +22,9 @@ class CouponAddPlayerResult(BaseModel):
     id: UUID
 
 
-adapter = TypeAdapter[CouponAddPlayerResult | None](CouponAddPlayerResult | None)
+adapter = TypeAdapter[CouponAddPlayerResult | None](
+    CouponAddPlayerResult | None, config=ConfigDict(defer_build=True)
+)
 
 
 async def coupon_add_player(
@@ -2,7 +2,7 @@
 # pyright: strict
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -32,7 +32,9 @@ class CouponGetByCodeResult(BaseModel):
     code: str
 
 
-adapter = TypeAdapter[CouponGetByCodeResult | None](CouponGetByCodeResult | None)
+adapter = TypeAdapter[CouponGetByCodeResult | None](
+    CouponGetByCodeResult | None, config=ConfigDict(defer_build=True)
+)
 
 
 async def coupon_get_by_code(
@@ -2,7 +2,7 @@
 # pyright: strict
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 select waicolle::Coupon {
@@ -30,7 +30,9 @@ class CouponSelectAllResult(BaseModel):
     code: str
 
 
-adapter = TypeAdapter[list[CouponSelectAllResult]](list[CouponSelectAllResult])
+adapter = TypeAdapter[list[CouponSelectAllResult]](
+    list[CouponSelectAllResult], config=ConfigDict(defer_build=True)
+)
 
 
 async def coupon_select_all(
@@ -3,7 +3,7 @@
 from enum import StrEnum
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -56,7 +56,9 @@ class MediasPoolResult(BaseModel):
     key: MediasPoolResultKey
 
 
-adapter = TypeAdapter[list[MediasPoolResult]](list[MediasPoolResult])
+adapter = TypeAdapter[list[MediasPoolResult]](
+    list[MediasPoolResult], config=ConfigDict(defer_build=True)
+)
 
 
 async def medias_pool(
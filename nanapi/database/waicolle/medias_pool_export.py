@@ -2,7 +2,7 @@
 # pyright: strict
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -26,7 +26,9 @@ class MediasPoolExportResult(BaseModel):
     image: str
 
 
-adapter = TypeAdapter[list[MediasPoolExportResult]](list[MediasPoolExportResult])
+adapter = TypeAdapter[list[MediasPoolExportResult]](
+    list[MediasPoolExportResult], config=ConfigDict(defer_build=True)
+)
 
 
 async def medias_pool_export(
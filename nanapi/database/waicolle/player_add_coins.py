@@ -5,7 +5,7 @@ from enum import StrEnum
 from uuid import UUID
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -48,7 +48,9 @@ class PlayerAddCoinsResult(BaseModel):
     user: PlayerAddCoinsResultUser
 
 
-adapter = TypeAdapter[PlayerAddCoinsResult | None](PlayerAddCoinsResult | None)
+adapter = TypeAdapter[PlayerAddCoinsResult | None](
+    PlayerAddCoinsResult | None, config=ConfigDict(defer_build=True)
+)
 
 
 async def player_add_coins(
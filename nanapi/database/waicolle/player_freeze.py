@@ -3,7 +3,7 @@
 from uuid import UUID
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -20,7 +20,9 @@ class PlayerFreezeResult(BaseModel):
     id: UUID
 
 
-adapter = TypeAdapter[PlayerFreezeResult | None](PlayerFreezeResult | None)
+adapter = TypeAdapter[PlayerFreezeResult | None](
+    PlayerFreezeResult | None, config=ConfigDict(defer_build=True)
+)
 
 
 async def player_freeze(
@@ -5,7 +5,7 @@ from enum import StrEnum
 from uuid import UUID
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -44,7 +44,9 @@ class PlayerGetByUserResult(BaseModel):
     user: PlayerGetByUserResultUser
 
 
-adapter = TypeAdapter[PlayerGetByUserResult | None](PlayerGetByUserResult | None)
+adapter = TypeAdapter[PlayerGetByUserResult | None](
+    PlayerGetByUserResult | None, config=ConfigDict(defer_build=True)
+)
 
 
 async def player_get_by_user(
@@ -4,7 +4,7 @@ from typing import Literal
 from uuid import UUID
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -49,7 +49,9 @@ class PlayerMergeResult(BaseModel):
     id: UUID
 
 
-adapter = TypeAdapter[PlayerMergeResult | None](PlayerMergeResult | None)
+adapter = TypeAdapter[PlayerMergeResult | None](
+    PlayerMergeResult | None, config=ConfigDict(defer_build=True)
+)
 
 
 async def player_merge(
@@ -3,7 +3,7 @@
 from uuid import UUID
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -22,7 +22,9 @@ class PlayerRemoveCollectionResult(BaseModel):
     id: UUID
 
 
-adapter = TypeAdapter[PlayerRemoveCollectionResult | None](PlayerRemoveCollectionResult | None)
+adapter = TypeAdapter[PlayerRemoveCollectionResult | None](
+    PlayerRemoveCollectionResult | None, config=ConfigDict(defer_build=True)
+)
 
 
 async def player_remove_collection(
@@ -3,7 +3,7 @@
 from uuid import UUID
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -22,7 +22,9 @@ class PlayerRemoveMediaResult(BaseModel):
     id: UUID
 
 
-adapter = TypeAdapter[PlayerRemoveMediaResult | None](PlayerRemoveMediaResult | None)
+adapter = TypeAdapter[PlayerRemoveMediaResult | None](
+    PlayerRemoveMediaResult | None, config=ConfigDict(defer_build=True)
+)
 
 
 async def player_remove_media(
@@ -5,7 +5,7 @@ from enum import StrEnum
 from uuid import UUID
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 select waicolle::Player {
@@ -37,7 +37,9 @@ class PlayerSelectAllResult(BaseModel):
     user: PlayerSelectAllResultUser
 
 
-adapter = TypeAdapter[list[PlayerSelectAllResult]](list[PlayerSelectAllResult])
+adapter = TypeAdapter[list[PlayerSelectAllResult]](
+    list[PlayerSelectAllResult], config=ConfigDict(defer_build=True)
+)
 
 
 async def player_select_all(
@@ -5,7 +5,7 @@ from enum import StrEnum
 from uuid import UUID
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -41,7 +41,9 @@ class PlayerSelectByCharaResult(BaseModel):
     user: PlayerSelectByCharaResultUser
 
 
-adapter = TypeAdapter[list[PlayerSelectByCharaResult]](list[PlayerSelectByCharaResult])
+adapter = TypeAdapter[list[PlayerSelectByCharaResult]](
+    list[PlayerSelectByCharaResult], config=ConfigDict(defer_build=True)
+)
 
 
 async def player_select_by_chara(
@@ -0,0 +1,44 @@
+# Generated by gel-pydantic-codegen
+# pyright: strict
+from uuid import UUID
+
+from gel import AsyncIOExecutor
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+
+EDGEQL_QUERY = r"""
+with
+  id := <uuid>$id,
+  collection := (select waicolle::Collection filter .id = id),
+select waicolle::Player {
+  user: {
+    discord_id,
+  },
+}
+filter .client = global client
+and collection in .tracked_collections
+"""
+
+
+class PlayerSelectByCollectionResultUser(BaseModel):
+    discord_id: str
+
+
+class PlayerSelectByCollectionResult(BaseModel):
+    user: PlayerSelectByCollectionResultUser
+
+
+adapter = TypeAdapter[list[PlayerSelectByCollectionResult]](
+    list[PlayerSelectByCollectionResult], config=ConfigDict(defer_build=True)
+)
+
+
+async def player_select_by_collection(
+    executor: AsyncIOExecutor,
+    *,
+    id: UUID,
+) -> list[PlayerSelectByCollectionResult]:
+    resp = await executor.query_json(  # pyright: ignore[reportUnknownMemberType]
+        EDGEQL_QUERY,
+        id=id,
+    )
+    return adapter.validate_json(resp, strict=False)
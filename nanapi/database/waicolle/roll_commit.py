@@ -0,0 +1,162 @@
+# Generated by gel-pydantic-codegen
+# pyright: strict
+from datetime import datetime
+from enum import StrEnum
+from uuid import UUID
+
+from gel import AsyncIOExecutor
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+
+EDGEQL_QUERY = r"""
+with
+  discord_id := <str>$discord_id,
+  charas_ids := <array<int32>>$charas_ids,
+  reason := <str>$reason,
+  moecoins := <int32>$moecoins,
+  coupon_code := <optional str>$coupon_code,
+  flag_key := <optional str>$flag_key,
+  flag_value := <optional str>$flag_value,
+  player := (select waicolle::Player filter .client = global client and .user.discord_id = discord_id),
+  paid := (
+    update waicolle::Player
+    filter .client = global client and .user.discord_id = discord_id and moecoins > 0
+    set {
+      moecoins := .moecoins - moecoins,
+    }
+  ),
+  claimed := (
+    update waicolle::Coupon
+    filter .client = global client and .code = coupon_code
+    set {
+      claimed_by += player,
+    }
+  ),
+  flagged := (
+    for key in {flag_key} union (
+      insert redis::Data {
+        key := key,
+        value := assert_exists(flag_value),
+      }
+      unless conflict on .key
+      else (
+        update redis::Data set {
+          value := assert_exists(flag_value),
+        }
+      )
+    )
+  ),
+  inserted := (
+    for id_al in array_unpack(charas_ids) union (
+      insert waicolle::Waifu {
+        client := global client,
+        character := (select anilist::Character filter .id_al = id_al),
+        owner := player,
+        original_owner := player,
+      }
+    )
+  ),
+  rollop := (
+    insert waicolle::RollOperation {
+      client := global client,
+      author := player,
+      received := inserted,
+      reason := reason,
+      moecoins := moecoins,
+    }
+  ),
+select inserted {
+  *,
+  character: { id_al },
+  owner: {
+    user: {
+      discord_id,
+    },
+  },
+  original_owner: {
+    user: {
+      discord_id,
+    },
+  },
+  custom_position_waifu: { id },
+}
+"""
+
+
+class WaicolleCollagePosition(StrEnum):
+    DEFAULT = 'DEFAULT'
+    LEFT_OF = 'LEFT_OF'
+    RIGHT_OF = 'RIGHT_OF'
+
+
+class RollCommitResultOwnerUser(BaseModel):
+    discord_id: str
+
+
+class RollCommitResultOwner(BaseModel):
+    user: RollCommitResultOwnerUser
+
+
+class RollCommitResultOriginalOwnerUser(BaseModel):
+    discord_id: str
+
+
+class RollCommitResultOriginalOwner(BaseModel):
+    user: RollCommitResultOriginalOwnerUser
+
+
+class RollCommitResultCustomPositionWaifu(BaseModel):
+    id: UUID
+
+
+class RollCommitResultCharacter(BaseModel):
+    id_al: int
+
+
+class RollCommitResult(BaseModel):
+    blooded: bool
+    character: RollCommitResultCharacter
+    custom_collage: bool
+    custom_image: str | None
+    custom_image_digest: str | None
+    custom_name: str | None
+    custom_position: WaicolleCollagePosition
+    custom_position_waifu: RollCommitResultCustomPositionWaifu | None
+    disabled: bool
+    frozen: bool
+    id: UUID
+    level: int
+    locked: bool
+    nanaed: bool
+    original_owner: RollCommitResultOriginalOwner | None
+    owner: RollCommitResultOwner
+    timestamp: datetime
+    trade_locked: bool
+
+
+adapter = TypeAdapter[list[RollCommitResult]](
+    list[RollCommitResult], config=ConfigDict(defer_build=True)
+)
+
+
+async def roll_commit(
+    executor: AsyncIOExecutor,
+    *,
+    discord_id: str,
+    charas_ids: list[int],
+    reason: str,
+    moecoins: int,
+    coupon_code: str | None = None,
+    flag_key: str | None = None,
+    flag_value: str | None = None,
+) -> list[RollCommitResult]:
+    resp = await executor.query_json(  # pyright: ignore[reportUnknownMemberType]
+        EDGEQL_QUERY,
+        discord_id=discord_id,
+        charas_ids=charas_ids,
+        reason=reason,
+        moecoins=moecoins,
+        coupon_code=coupon_code,
+        flag_key=flag_key,
+        flag_value=flag_value,
+    )
+    return adapter.validate_json(resp, strict=False)
@@ -0,0 +1,66 @@
+# Generated by gel-pydantic-codegen
+# pyright: strict
+from enum import StrEnum
+
+from gel import AsyncIOExecutor
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+
+EDGEQL_QUERY = r"""
+with
+  edges := (
+    select anilist::CharacterEdge
+    filter exists .media.season
+      and exists .media.season_year
+      and .character.image_large not ilike '%/default.jpg'
+  ),
+select (
+  group edges
+  using
+    season := .media.season,
+    season_year := .media.season_year,
+    rank := .character.rank,
+  by season, season_year, rank
+) {
+  season := .key.season,
+  season_year := .key.season_year,
+  rank := .key.rank,
+  count := count(.elements.character),
+}
+"""
+
+
+class AnilistMediaSeason(StrEnum):
+    FALL = 'FALL'
+    SPRING = 'SPRING'
+    SUMMER = 'SUMMER'
+    WINTER = 'WINTER'
+
+
+class WaicolleRank(StrEnum):
+    A = 'A'
+    B = 'B'
+    C = 'C'
+    D = 'D'
+    E = 'E'
+    S = 'S'
+
+
+class SeasonPoolRanksResult(BaseModel):
+    season: AnilistMediaSeason | None
+    season_year: int | None
+    rank: WaicolleRank
+    count: int
+
+
+adapter = TypeAdapter[list[SeasonPoolRanksResult]](
+    list[SeasonPoolRanksResult], config=ConfigDict(defer_build=True)
+)
+
+
+async def season_pool_ranks(
+    executor: AsyncIOExecutor,
+) -> list[SeasonPoolRanksResult]:
+    resp = await executor.query_json(  # pyright: ignore[reportUnknownMemberType]
+        EDGEQL_QUERY,
+    )
+    return adapter.validate_json(resp, strict=False)
@@ -0,0 +1,56 @@
+# Generated by gel-pydantic-codegen
+# pyright: strict
+from enum import StrEnum
+
+from gel import AsyncIOExecutor
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+
+EDGEQL_QUERY = r"""
+with
+  min_rank := <int32>$min_rank,
+for tag in (select anilist::Tag) union (
+  with
+    medias := (select tag.medias filter any(.tags@rank >= min_rank)),
+    pool := (
+      select medias.character_edges.character
+      filter .image_large not ilike '%/default.jpg'
+    ),
+  select (group pool by .rank) {
+    tag_name := tag.name,
+    rank := .key.rank,
+    count := count(.elements),
+  }
+)
+"""
+
+
+class WaicolleRank(StrEnum):
+    A = 'A'
+    B = 'B'
+    C = 'C'
+    D = 'D'
+    E = 'E'
+    S = 'S'
+
+
+class TagPoolRanksResult(BaseModel):
+    tag_name: str
+    rank: WaicolleRank
+    count: int
+
+
+adapter = TypeAdapter[list[TagPoolRanksResult]](
+    list[TagPoolRanksResult], config=ConfigDict(defer_build=True)
+)
+
+
+async def tag_pool_ranks(
+    executor: AsyncIOExecutor,
+    *,
+    min_rank: int,
+) -> list[TagPoolRanksResult]:
+    resp = await executor.query_json(  # pyright: ignore[reportUnknownMemberType]
+        EDGEQL_QUERY,
+        min_rank=min_rank,
+    )
+    return adapter.validate_json(resp, strict=False)
@@ -3,7 +3,7 @@
 from uuid import UUID
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -21,7 +21,9 @@ class TradeCommitResult(BaseModel):
     id: UUID
 
 
-adapter = TypeAdapter[TradeCommitResult | None](TradeCommitResult | None)
+adapter = TypeAdapter[TradeCommitResult | None](
+    TradeCommitResult | None, config=ConfigDict(defer_build=True)
+)
 
 
 async def trade_commit(
@@ -4,7 +4,7 @@ from datetime import datetime
 from uuid import UUID
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -63,7 +63,9 @@ class TradeGetByIdResult(BaseModel):
     received: list[TradeGetByIdResultReceived]
 
 
-adapter = TypeAdapter[TradeGetByIdResult | None](TradeGetByIdResult | None)
+adapter = TypeAdapter[TradeGetByIdResult | None](
+    TradeGetByIdResult | None, config=ConfigDict(defer_build=True)
+)
 
 
 async def trade_get_by_id(
@@ -107,6 +107,7 @@ class TradeInsertResultReceived(BaseModel):
     character: TradeInsertResultReceivedCharacter
     custom_collage: bool
     custom_image: str | None
+    custom_image_digest: str | None
     custom_name: str | None
     custom_position: WaicolleCollagePosition
     custom_position_waifu: TradeInsertResultReceivedCustomPositionWaifu | None
@@ -159,6 +160,7 @@ class TradeInsertResultOffered(BaseModel):
     character: TradeInsertResultOfferedCharacter
     custom_collage: bool
     custom_image: str | None
+    custom_image_digest: str | None
     custom_name: str | None
     custom_position: WaicolleCollagePosition
     custom_position_waifu: TradeInsertResultOfferedCustomPositionWaifu | None
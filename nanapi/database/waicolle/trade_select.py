@@ -5,7 +5,7 @@ from enum import StrEnum
 from uuid import UUID
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 select waicolle::TradeOperation {
@@ -91,6 +91,7 @@ class TradeSelectResultReceived(BaseModel):
     character: TradeSelectResultReceivedCharacter
     custom_collage: bool
     custom_image: str | None
+    custom_image_digest: str | None
     custom_name: str | None
     custom_position: WaicolleCollagePosition
     custom_position_waifu: TradeSelectResultReceivedCustomPositionWaifu | None
@@ -143,6 +144,7 @@ class TradeSelectResultOffered(BaseModel):
     character: TradeSelectResultOfferedCharacter
     custom_collage: bool
     custom_image: str | None
+    custom_image_digest: str | None
     custom_name: str | None
     custom_position: WaicolleCollagePosition
     custom_position_waifu: TradeSelectResultOfferedCustomPositionWaifu | None
@@ -177,7 +179,9 @@ class TradeSelectResult(BaseModel):
     received: list[TradeSelectResultReceived]
 
 
-adapter = TypeAdapter[list[TradeSelectResult]](list[TradeSelectResult])
+adapter = TypeAdapter[list[TradeSelectResult]](
+    list[TradeSelectResult], config=ConfigDict(defer_build=True)
+)
 
 
 async def trade_select(
@@ -3,7 +3,7 @@
 from enum import StrEnum
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -64,7 +64,9 @@ class UserPoolResult(BaseModel):
     key: UserPoolResultKey
 
 
-adapter = TypeAdapter[list[UserPoolResult]](list[UserPoolResult])
+adapter = TypeAdapter[list[UserPoolResult]](
+    list[UserPoolResult], config=ConfigDict(defer_build=True)
+)
 
 
 async def user_pool(
@@ -0,0 +1,116 @@
+# Generated by gel-pydantic-codegen
+# pyright: strict
+from datetime import datetime
+from enum import StrEnum
+from typing import Any
+from uuid import UUID
+
+import orjson
+from gel import AsyncIOExecutor
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+
+EDGEQL_QUERY = r"""
+with
+  ascensions := <json>$ascensions,
+  timestamp := <datetime>$timestamp,
+  updated := (
+    for ascension in json_array_unpack(ascensions) union (
+      with
+        id := <uuid>json_get(ascension, 'id'),
+        level := <int32>json_get(ascension, 'level'),
+        ascended_from_ids := <array<uuid>>json_get(ascension, 'ascended_from_ids'),
+      update waicolle::Waifu
+      filter .id = id
+      set {
+        level := level,
+        timestamp := timestamp,
+        ascended_from += (select waicolle::Waifu filter .id in array_unpack(ascended_from_ids)),
+      }
+    )
+  ),
+select updated {
+  *,
+  character: { id_al },
+  owner: {
+    user: {
+      discord_id,
+    },
+  },
+  original_owner: {
+    user: {
+      discord_id,
+    },
+  },
+  custom_position_waifu: { id },
+}
+"""
+
+
+class WaicolleCollagePosition(StrEnum):
+    DEFAULT = 'DEFAULT'
+    LEFT_OF = 'LEFT_OF'
+    RIGHT_OF = 'RIGHT_OF'
+
+
+class WaifuAscendResultOwnerUser(BaseModel):
+    discord_id: str
+
+
+class WaifuAscendResultOwner(BaseModel):
+    user: WaifuAscendResultOwnerUser
+
+
+class WaifuAscendResultOriginalOwnerUser(BaseModel):
+    discord_id: str
+
+
+class WaifuAscendResultOriginalOwner(BaseModel):
+    user: WaifuAscendResultOriginalOwnerUser
+
+
+class WaifuAscendResultCustomPositionWaifu(BaseModel):
+    id: UUID
+
+
+class WaifuAscendResultCharacter(BaseModel):
+    id_al: int
+
+
+class WaifuAscendResult(BaseModel):
+    blooded: bool
+    character: WaifuAscendResultCharacter
+    custom_collage: bool
+    custom_image: str | None
+    custom_image_digest: str | None
+    custom_name: str | None
+    custom_position: WaicolleCollagePosition
+    custom_position_waifu: WaifuAscendResultCustomPositionWaifu | None
+    disabled: bool
+    frozen: bool
+    id: UUID
+    level: int
+    locked: bool
+    nanaed: bool
+    original_owner: WaifuAscendResultOriginalOwner | None
+    owner: WaifuAscendResultOwner
+    timestamp: datetime
+    trade_locked: bool
+
+
+adapter = TypeAdapter[list[WaifuAscendResult]](
+    list[WaifuAscendResult], config=ConfigDict(defer_build=True)
+)
+
+
+async def waifu_ascend(
+    executor: AsyncIOExecutor,
+    *,
+    ascensions: Any,
+    timestamp: datetime,
+) -> list[WaifuAscendResult]:
+    resp = await executor.query_json(  # pyright: ignore[reportUnknownMemberType]
+        EDGEQL_QUERY,
+        ascensions=orjson.dumps(ascensions).decode(),
+        timestamp=timestamp,
+    )
+    return adapter.validate_json(resp, strict=False)
@@ -0,0 +1,75 @@
+# Generated by gel-pydantic-codegen
+# pyright: strict
+from datetime import datetime
+from uuid import UUID
+
+from gel import AsyncIOExecutor
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+
+EDGEQL_QUERY = r"""
+with
+  discord_id := <str>$discord_id,
+  chara_id_al := <optional int32>$chara_id_al,
+  player := (select waicolle::Player filter .client = global client and .user.discord_id = discord_id),
+  waifus := (
+    select waicolle::Waifu
+    filter .client = global client
+    and .owner = assert_exists(player)
+    and not .trade_locked and not .blooded
+    and not .disabled
+    and (.character.id_al = chara_id_al if exists chara_id_al else true)
+  ),
+  grouped := (
+    group waifus
+    using chara_id_al := .character.id_al
+    by chara_id_al
+  ),
+  counted := (
+    select grouped {
+      count := count(.elements),
+    }
+  ),
+select counted {
+  key: { chara_id_al },
+  elements: {
+    id,
+    level,
+    timestamp,
+  },
+}
+filter .count >= 4
+"""
+
+
+class WaifuAscendCandidatesResultKey(BaseModel):
+    chara_id_al: int
+
+
+class WaifuAscendCandidatesResultElements(BaseModel):
+    id: UUID
+    level: int
+    timestamp: datetime
+
+
+class WaifuAscendCandidatesResult(BaseModel):
+    key: WaifuAscendCandidatesResultKey
+    elements: list[WaifuAscendCandidatesResultElements]
+
+
+adapter = TypeAdapter[list[WaifuAscendCandidatesResult]](
+    list[WaifuAscendCandidatesResult], config=ConfigDict(defer_build=True)
+)
+
+
+async def waifu_ascend_candidates(
+    executor: AsyncIOExecutor,
+    *,
+    discord_id: str,
+    chara_id_al: int | None = None,
+) -> list[WaifuAscendCandidatesResult]:
+    resp = await executor.query_json(  # pyright: ignore[reportUnknownMemberType]
+        EDGEQL_QUERY,
+        discord_id=discord_id,
+        chara_id_al=chara_id_al,
+    )
+    return adapter.validate_json(resp, strict=False)
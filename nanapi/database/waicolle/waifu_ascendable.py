@@ -5,7 +5,7 @@ from enum import StrEnum
 from uuid import UUID
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -91,6 +91,7 @@ class WaifuAscendableResultElements(BaseModel):
     character: WaifuAscendableResultElementsCharacter
     custom_collage: bool
     custom_image: str | None
+    custom_image_digest: str | None
     custom_name: str | None
     custom_position: WaicolleCollagePosition
     custom_position_waifu: WaifuAscendableResultElementsCustomPositionWaifu | None
@@ -112,7 +113,9 @@ class WaifuAscendableResult(BaseModel):
     key: WaifuAscendableResultKey
 
 
-adapter = TypeAdapter[list[WaifuAscendableResult]](list[WaifuAscendableResult])
+adapter = TypeAdapter[list[WaifuAscendableResult]](
+    list[WaifuAscendableResult], config=ConfigDict(defer_build=True)
+)
 
 
 async def waifu_ascendable(
@@ -5,7 +5,7 @@ from enum import StrEnum
 from uuid import UUID
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -81,6 +81,7 @@ class WaifuBulkUpdateResult(BaseModel):
     character: WaifuBulkUpdateResultCharacter
     custom_collage: bool
     custom_image: str | None
+    custom_image_digest: str | None
     custom_name: str | None
     custom_position: WaicolleCollagePosition
     custom_position_waifu: WaifuBulkUpdateResultCustomPositionWaifu | None
@@ -96,7 +97,9 @@ class WaifuBulkUpdateResult(BaseModel):
     trade_locked: bool
 
 
-adapter = TypeAdapter[list[WaifuBulkUpdateResult]](list[WaifuBulkUpdateResult])
+adapter = TypeAdapter[list[WaifuBulkUpdateResult]](
+    list[WaifuBulkUpdateResult], config=ConfigDict(defer_build=True)
+)
 
 
 async def waifu_bulk_update(
@@ -5,7 +5,7 @@ from enum import StrEnum
 from uuid import UUID
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -77,6 +77,7 @@ class WaifuChangeOwnerResult(BaseModel):
     character: WaifuChangeOwnerResultCharacter
     custom_collage: bool
     custom_image: str | None
+    custom_image_digest: str | None
     custom_name: str | None
     custom_position: WaicolleCollagePosition
     custom_position_waifu: WaifuChangeOwnerResultCustomPositionWaifu | None
@@ -92,7 +93,9 @@ class WaifuChangeOwnerResult(BaseModel):
     trade_locked: bool
 
 
-adapter = TypeAdapter[list[WaifuChangeOwnerResult]](list[WaifuChangeOwnerResult])
+adapter = TypeAdapter[list[WaifuChangeOwnerResult]](
+    list[WaifuChangeOwnerResult], config=ConfigDict(defer_build=True)
+)
 
 
 async def waifu_change_owner(
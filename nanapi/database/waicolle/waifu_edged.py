@@ -5,7 +5,7 @@ from enum import StrEnum
 from uuid import UUID
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -90,6 +90,7 @@ class WaifuEdgedResultElements(BaseModel):
     character: WaifuEdgedResultElementsCharacter
     custom_collage: bool
     custom_image: str | None
+    custom_image_digest: str | None
     custom_name: str | None
     custom_position: WaicolleCollagePosition
     custom_position_waifu: WaifuEdgedResultElementsCustomPositionWaifu | None
@@ -111,7 +112,9 @@ class WaifuEdgedResult(BaseModel):
     key: WaifuEdgedResultKey
 
 
-adapter = TypeAdapter[list[WaifuEdgedResult]](list[WaifuEdgedResult])
+adapter = TypeAdapter[list[WaifuEdgedResult]](
+    list[WaifuEdgedResult], config=ConfigDict(defer_build=True)
+)
 
 
 async def waifu_edged(
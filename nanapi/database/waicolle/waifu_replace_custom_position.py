@@ -4,7 +4,7 @@ from typing import Literal
 from uuid import UUID
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -37,7 +37,7 @@ class WaifuReplaceCustomPositionResult(BaseModel):
 
 
 adapter = TypeAdapter[WaifuReplaceCustomPositionResult | None](
-    WaifuReplaceCustomPositionResult | None
+    WaifuReplaceCustomPositionResult | None, config=ConfigDict(defer_build=True)
 )
 
 
@@ -5,7 +5,7 @@ from enum import StrEnum
 from uuid import UUID
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -64,6 +64,7 @@ class WaifuSelectResult(BaseModel):
     character: WaifuSelectResultCharacter
     custom_collage: bool
     custom_image: str | None
+    custom_image_digest: str | None
     custom_name: str | None
     custom_position: WaicolleCollagePosition
     custom_position_waifu: WaifuSelectResultCustomPositionWaifu | None
@@ -79,7 +80,9 @@ class WaifuSelectResult(BaseModel):
     trade_locked: bool
 
 
-adapter = TypeAdapter[list[WaifuSelectResult]](list[WaifuSelectResult])
+adapter = TypeAdapter[list[WaifuSelectResult]](
+    list[WaifuSelectResult], config=ConfigDict(defer_build=True)
+)
 
 
 async def waifu_select(
@@ -5,7 +5,7 @@ from enum import StrEnum
 from uuid import UUID
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -67,6 +67,7 @@ class WaifuSelectByCharaResult(BaseModel):
     character: WaifuSelectByCharaResultCharacter
     custom_collage: bool
     custom_image: str | None
+    custom_image_digest: str | None
     custom_name: str | None
     custom_position: WaicolleCollagePosition
     custom_position_waifu: WaifuSelectByCharaResultCustomPositionWaifu | None
@@ -82,7 +83,9 @@ class WaifuSelectByCharaResult(BaseModel):
     trade_locked: bool
 
 
-adapter = TypeAdapter[list[WaifuSelectByCharaResult]](list[WaifuSelectByCharaResult])
+adapter = TypeAdapter[list[WaifuSelectByCharaResult]](
+    list[WaifuSelectByCharaResult], config=ConfigDict(defer_build=True)
+)
 
 
 async def waifu_select_by_chara(
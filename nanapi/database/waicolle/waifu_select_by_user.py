@@ -5,7 +5,7 @@ from enum import StrEnum
 from uuid import UUID
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -88,6 +88,7 @@ class WaifuSelectByUserResult(BaseModel):
     character: WaifuSelectByUserResultCharacter
     custom_collage: bool
     custom_image: str | None
+    custom_image_digest: str | None
     custom_name: str | None
     custom_position: WaicolleCollagePosition
     custom_position_waifu: WaifuSelectByUserResultCustomPositionWaifu | None
@@ -103,7 +104,9 @@ class WaifuSelectByUserResult(BaseModel):
     trade_locked: bool
 
 
-adapter = TypeAdapter[list[WaifuSelectByUserResult]](list[WaifuSelectByUserResult])
+adapter = TypeAdapter[list[WaifuSelectByUserResult]](
+    list[WaifuSelectByUserResult], config=ConfigDict(defer_build=True)
+)
 
 
 async def waifu_select_by_user(
@@ -0,0 +1,42 @@
+# Generated by gel-pydantic-codegen
+# pyright: strict
+from uuid import UUID
+
+from gel import AsyncIOExecutor
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+
+EDGEQL_QUERY = r"""
+with
+  batch_size := <int64>$batch_size,
+  clear := <bool>$clear,
+select waicolle::Waifu {
+  id,
+  custom_image,
+}
+filter exists .custom_image and (clear or not exists .custom_image_digest)
+limit batch_size
+"""
+
+
+class WaifuSelectUndigestedResult(BaseModel):
+    id: UUID
+    custom_image: str | None
+
+
+adapter = TypeAdapter[list[WaifuSelectUndigestedResult]](
+    list[WaifuSelectUndigestedResult], config=ConfigDict(defer_build=True)
+)
+
+
+async def waifu_select_undigested(
+    executor: AsyncIOExecutor,
+    *,
+    batch_size: int,
+    clear: bool,
+) -> list[WaifuSelectUndigestedResult]:
+    resp = await executor.query_json(  # pyright: ignore[reportUnknownMemberType]
+        EDGEQL_QUERY,
+        batch_size=batch_size,
+        clear=clear,
+    )
+    return adapter.validate_json(resp, strict=False)
@@ -0,0 +1,171 @@
+# Generated by gel-pydantic-codegen
+# pyright: strict
+from datetime import datetime
+from enum import StrEnum
+from uuid import UUID
+
+from gel import AsyncIOExecutor
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+
+EDGEQL_QUERY = r"""
+with
+  discord_id := <str>$discord_id,
+  hide_singles := <optional bool>$hide_singles ?? false,
+  player := (select waicolle::Player filter .client = global client and .user.discord_id = discord_id),
+  unlocked := (
+    select waicolle::Waifu
+    filter .client = global client
+    and .owner = assert_exists(player)
+    and not .locked and not .trade_locked and not .blooded and not .disabled
+  ),
+for character in (distinct unlocked.character) union (
+  with
+    locked := (
+      select waicolle::Waifu
+      filter .client = global client
+      and .character = character
+      and .locked and not .frozen and not .disabled
+    ),
+    locked_owners := (distinct locked.owner),
+    shown_locked := (
+      for owner in locked_owners union (
+        with
+          owned := (select locked filter .owner = owner),
+        select (
+          owned if not hide_singles or count(owned) != 1
+          else <waicolle::Waifu>{}
+        )
+      )
+    ),
+    trackers := (
+      select waicolle::Player
+      filter .client = global client
+      and character in .tracked_characters
+      and not exists .frozen_at
+      and waicolle::Player not in locked_owners
+    ),
+  select {
+    character_id_al := character.id_al,
+    trackers_not_owners := trackers {
+      *,
+      user: {
+        discord_id,
+      },
+    },
+    locked := (
+      select shown_locked {
+        *,
+        character: { id_al },
+        owner: {
+          user: {
+            discord_id,
+          },
+        },
+        original_owner: {
+          user: {
+            discord_id,
+          },
+        },
+        custom_position_waifu: { id },
+      }
+      order by .timestamp desc
+    ),
+  }
+  filter exists trackers or exists shown_locked
+)
+"""
+
+
+class WaicolleCollagePosition(StrEnum):
+    DEFAULT = 'DEFAULT'
+    LEFT_OF = 'LEFT_OF'
+    RIGHT_OF = 'RIGHT_OF'
+
+
+class WaicolleGameMode(StrEnum):
+    ALL = 'ALL'
+    HUSBANDO = 'HUSBANDO'
+    WAIFU = 'WAIFU'
+
+
+class WaifuTrackReversedResultLockedOwnerUser(BaseModel):
+    discord_id: str
+
+
+class WaifuTrackReversedResultLockedOwner(BaseModel):
+    user: WaifuTrackReversedResultLockedOwnerUser
+
+
+class WaifuTrackReversedResultLockedOriginalOwnerUser(BaseModel):
+    discord_id: str
+
+
+class WaifuTrackReversedResultLockedOriginalOwner(BaseModel):
+    user: WaifuTrackReversedResultLockedOriginalOwnerUser
+
+
+class WaifuTrackReversedResultLockedCustomPositionWaifu(BaseModel):
+    id: UUID
+
+
+class WaifuTrackReversedResultLockedCharacter(BaseModel):
+    id_al: int
+
+
+class WaifuTrackReversedResultLocked(BaseModel):
+    blooded: bool
+    character: WaifuTrackReversedResultLockedCharacter
+    custom_collage: bool
+    custom_image: str | None
+    custom_image_digest: str | None
+    custom_name: str | None
+    custom_position: WaicolleCollagePosition
+    custom_position_waifu: WaifuTrackReversedResultLockedCustomPositionWaifu | None
+    disabled: bool
+    frozen: bool
+    id: UUID
+    level: int
+    locked: bool
+    nanaed: bool
+    original_owner: WaifuTrackReversedResultLockedOriginalOwner | None
+    owner: WaifuTrackReversedResultLockedOwner
+    timestamp: datetime
+    trade_locked: bool
+
+
+class WaifuTrackReversedResultTrackersNotOwnersUser(BaseModel):
+    discord_id: str
+
+
+class WaifuTrackReversedResultTrackersNotOwners(BaseModel):
+    blood_shards: int
+    frozen_at: datetime | None
+    game_mode: WaicolleGameMode
+    id: UUID
+    moecoins: int
+    user: WaifuTrackReversedResultTrackersNotOwnersUser
+
+
+class WaifuTrackReversedResult(BaseModel):
+    character_id_al: int
+    trackers_not_owners: list[WaifuTrackReversedResultTrackersNotOwners]
+    locked: list[WaifuTrackReversedResultLocked]
+
+
+adapter = TypeAdapter[list[WaifuTrackReversedResult]](
+    list[WaifuTrackReversedResult], config=ConfigDict(defer_build=True)
+)
+
+
+async def waifu_track_reversed(
+    executor: AsyncIOExecutor,
+    *,
+    discord_id: str,
+    hide_singles: bool | None = None,
+) -> list[WaifuTrackReversedResult]:
+    resp = await executor.query_json(  # pyright: ignore[reportUnknownMemberType]
+        EDGEQL_QUERY,
+        discord_id=discord_id,
+        hide_singles=hide_singles,
+    )
+    return adapter.validate_json(resp, strict=False)
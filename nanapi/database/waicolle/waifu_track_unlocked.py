@@ -5,7 +5,7 @@ from enum import StrEnum
 from uuid import UUID
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -105,6 +105,7 @@ class WaifuTrackUnlockedResult(BaseModel):
     character: WaifuTrackUnlockedResultCharacter
     custom_collage: bool
     custom_image: str | None
+    custom_image_digest: str | None
     custom_name: str | None
     custom_position: WaicolleCollagePosition
     custom_position_waifu: WaifuTrackUnlockedResultCustomPositionWaifu | None
@@ -120,7 +121,9 @@ class WaifuTrackUnlockedResult(BaseModel):
     trade_locked: bool
 
 
-adapter = TypeAdapter[list[WaifuTrackUnlockedResult]](list[WaifuTrackUnlockedResult])
+adapter = TypeAdapter[list[WaifuTrackUnlockedResult]](
+    list[WaifuTrackUnlockedResult], config=ConfigDict(defer_build=True)
+)
 
 
 async def waifu_track_unlocked(
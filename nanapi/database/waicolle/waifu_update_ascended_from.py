@@ -3,7 +3,7 @@
 from uuid import UUID
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
@@ -22,7 +22,9 @@ class WaifuUpdateAscendedFromResult(BaseModel):
     id: UUID
 
 
-adapter = TypeAdapter[WaifuUpdateAscendedFromResult | None](WaifuUpdateAscendedFromResult | None)
+adapter = TypeAdapter[WaifuUpdateAscendedFromResult | None](
+    WaifuUpdateAscendedFromResult | None, config=ConfigDict(defer_build=True)
+)
 
 
 async def waifu_update_ascended_from(
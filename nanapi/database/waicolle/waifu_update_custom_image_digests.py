@@ -0,0 +1,45 @@
+# Generated by gel-pydantic-codegen
+# pyright: strict
+from typing import Any
+from uuid import UUID
+
+import orjson
+from gel import AsyncIOExecutor
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+
+EDGEQL_QUERY = r"""
+with
+  digests := <json>$digests,
+  clear := <bool>$clear,
+for waifu in json_array_unpack(digests) union (
+  update waicolle::Waifu
+  filter .id = <uuid>waifu['id']
+  set {
+    custom_image_digest := <str>waifu['digest'],
+    custom_image := <str>{} if clear else .custom_image,
+  }
+)
+"""
+
+
+class WaifuUpdateCustomImageDigestsResult(BaseModel):
+    id: UUID
+
+
+adapter = TypeAdapter[list[WaifuUpdateCustomImageDigestsResult]](
+    list[WaifuUpdateCustomImageDigestsResult], config=ConfigDict(defer_build=True)
+)
+
+
+async def waifu_update_custom_image_digests(
+    executor: AsyncIOExecutor,
+    *,
+    digests: Any,
+    clear: bool,
+) -> list[WaifuUpdateCustomImageDigestsResult]:
+    resp = await executor.query_json(  # pyright: ignore[reportUnknownMemberType]
+        EDGEQL_QUERY,
+        digests=orjson.dumps(digests).decode(),
+        clear=clear,
+    )
+    return adapter.validate_json(resp, strict=False)
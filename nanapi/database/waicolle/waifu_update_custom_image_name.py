@@ -3,21 +3,23 @@
 from uuid import UUID
 
 from gel import AsyncIOExecutor
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 EDGEQL_QUERY = r"""
 with
   id := <uuid>$id,
+  custom_image_digest := <optional str>$custom_image_digest,
   custom_image := <optional str>$custom_image,
   custom_name := <optional str>$custom_name,
 update waicolle::Waifu
 filter .id = id
 set {
-  custom_image := (
-    (<str>{} if custom_image ilike '' else custom_image)
-    if exists custom_image
-    else .custom_image
+  custom_image_digest := (
+    (<str>{} if custom_image_digest ilike '' else custom_image_digest)
+    if exists custom_image_digest
+    else .custom_image_digest
   ),
+  custom_image := custom_image if exists custom_image_digest else .custom_image,
   custom_name := (
     (<str>{} if custom_name ilike '' else custom_name)
     if exists custom_name
@@ -32,7 +34,7 @@ class WaifuUpdateCustomImageNameResult(BaseModel):
 
 
 adapter = TypeAdapter[WaifuUpdateCustomImageNameResult | None](
-    WaifuUpdateCustomImageNameResult | None
+    WaifuUpdateCustomImageNameResult | None, config=ConfigDict(defer_build=True)
 )
 
 
@@ -40,12 +42,14 @@ async def waifu_update_custom_image_name(
     executor: AsyncIOExecutor,
     *,
     id: UUID,
+    custom_image_digest: str | None = None,
     custom_image: str | None = None,
     custom_name: str | None = None,
 ) -> WaifuUpdateCustomImageNameResult | None:
     resp = await executor.query_single_json(  # pyright: ignore[reportUnknownMemberType]
         EDGEQL_QUERY,
         id=id,
+        custom_image_digest=custom_image_digest,
         custom_image=custom_image,
         custom_name=custom_name,
     )
@@ -5,6 +5,13 @@
 # LOG_LEVEL = 'INFO'
 # ERROR_WEBHOOK_URL = None
 # PROFILING = False
+# PROFILING_SAMPLE_RATE = 1.0
+# PROFILING_MAX_RESULTS = 100
+# PROFILING_ROUTES = []
+# PROFILING_TOP_FRAMES = 20
+# QUERY_METRICS = False
+# QUERY_METRICS_N_PLUS_ONE_THRESHOLD = 10
+# WARM_QUERY_ADAPTERS = True
 
 ## General
 # INSTANCE_NAME = 'nanapi'
@@ -21,6 +28,14 @@
 # FASTAPI_APP = 'nanapi.fastapi:app'
 # FASTAPI_CONFIG = dict()
 # HYPERCORN_CONFIG = dict(workers=4, accesslog='-')
+# LEADER_LEASE_TTL = 60
+# COMPRESSION_MINIMUM_SIZE = 1024
+# COMPRESSION_GZIP_LEVEL = 6
+# COMPRESSION_ZSTD_LEVEL = 3
+# SHARED_CACHE_PATH = '/var/cache/nanapi/cache.sqlite3'
+# RENDER_PROCESSES = 2
+# BLOB_STORE_PATH = '/var/lib/nanapi/blobs'
+# BLOB_STORE_PERSISTENT = False
 
 ## Security
 JAPAN7_BASIC_AUTH_USERNAME = 'username'
@@ -28,6 +43,8 @@ JAPAN7_BASIC_AUTH_PASSWORD = 'password'
 # JWT_ALGORITHM = 'HS256'
 # JWT_EXPIRE_MINUTES = 30
 JWT_SECRET_KEY = ''  # openssl rand -hex 32
+# AUTH_CACHE_TTL = 300
+# AUTH_CACHE_MAXSIZE = 1024
 
 ## AniList
 # AniList API is currently in “degraded” mode and limits to
@@ -3,10 +3,8 @@ import logging
 import sys
 from contextlib import asynccontextmanager
 from datetime import date, datetime, timedelta
-from random import randint
 
 from fastapi import FastAPI, Request, status
-from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.routing import APIRoute
 
 from nanapi.routers import (
@@ -31,10 +29,18 @@ from nanapi.settings import (
     ERROR_WEBHOOK_URL,
     FASTAPI_CONFIG,
     INSTANCE_NAME,
+    LEADER_LEASE_TTL,
     LOG_LEVEL,
     PROFILING,
+    QUERY_METRICS,
+    WARM_QUERY_ADAPTERS,
 )
+from nanapi.utils.clients import close_meilisearch, get_meilisearch
+from nanapi.utils.collages import close_render_pool
+from nanapi.utils.database import warm_adapters
+from nanapi.utils.fastapi import CompressionMiddleware
 from nanapi.utils.logs import get_traceback, get_traceback_str, webhook_post_error
+from nanapi.utils.redis.lease import Lease
 from nanapi.utils.waicolle import load_rolls
 
 logger = logging.getLogger(__name__)
@@ -57,26 +63,60 @@ async def daily_loop():
     while True:
         tomorrow = date.today() + timedelta(days=1)
         t = datetime.fromordinal(tomorrow.toordinal()) - datetime.now()
-        # I can’t find a way to tell which worker is being used so
-        # spread tasks with a random number of seconds to not have
-        # our n workers waking up at the same time.
         # a little delay should be fine since this is mostly here to
         # prepare the rolls for the next day.
-        random_delay = randint(1, 3600 * 4)
-        await asyncio.sleep(t.total_seconds() + random_delay)
+        await asyncio.sleep(t.total_seconds() + 60)
         await daily_tasks()
 
 
-async def startup():
+async def leader_tasks():
     # preload rolls so it might not take too much time to load
     # when someone needs it
-    logger.info('[startup] preloading rolls')
+    logger.info('[leader] preloading rolls')
     asyncio.create_task(load_rolls())
-    asyncio.create_task(daily_loop())
+    await daily_loop()
+
+
+async def leader_loop():
+    # only the worker holding the lease runs the background tasks, preparing the next
+    # daily and weekly rolls ahead of time. a worker needing one before it is prepared
+    # picks it too, but the first one stored in the database is used by all.
+    leader_task: asyncio.Task[None] | None = None
+    while True:
+        if await leader_lease.acquire():
+            if leader_task is None:
+                logger.info('[leader] lease acquired')
+                leader_task = asyncio.create_task(leader_tasks())
+                background_tasks.add(leader_task)
+        elif leader_task is not None:
+            logger.warning('[leader] lease lost')
+            leader_task.cancel()
+            background_tasks.discard(leader_task)
+            leader_task = None
+        await asyncio.sleep(LEADER_LEASE_TTL / 3)
+
+
+leader_lease = Lease('leader', ttl=LEADER_LEASE_TTL)
+background_tasks = set[asyncio.Task[None]]()
+
+
+async def startup():
+    get_meilisearch()
+    background_tasks.add(asyncio.create_task(leader_loop()))
+    if WARM_QUERY_ADAPTERS:
+        # query adapters are built lazily, build them while the worker is idle
+        asyncio.create_task(warm_adapters())
 
 
 async def cleanup():
-    pass
+    for task in background_tasks:
+        task.cancel()
+    # the leader tasks must be stopped before another worker takes over
+    await asyncio.gather(*background_tasks, return_exceptions=True)
+    # let another worker take over right away
+    await leader_lease.release()
+    await close_meilisearch()
+    close_render_pool()
 
 
 class HypercornLogFilter(logging.Filter):
@@ -110,7 +150,11 @@ app = FastAPI(
     **FASTAPI_CONFIG,
 )
 
-app.add_middleware(GZipMiddleware)
+app.add_middleware(CompressionMiddleware)
+if QUERY_METRICS:
+    from nanapi.utils.fastapi import QueryMetricsMiddleware
+
+    app.add_middleware(QueryMetricsMiddleware, fastapi_app=app)
 if PROFILING:
     from nanapi.utils.fastapi import ProfilerMiddleware
 
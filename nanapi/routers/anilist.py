@@ -1,6 +1,6 @@
 from typing import Any, cast
 
-from fastapi import HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.responses import StreamingResponse
 from gel.errors import ConstraintViolationError
 from meilisearch_python_sdk.models.search import SearchResults
@@ -19,8 +19,10 @@ from nanapi.database.anilist.c_edge_select_filter_staff import (
     CEdgeSelectFilterStaffResult,
     c_edge_select_filter_staff,
 )
+from nanapi.database.anilist.chara_select import EDGEQL_QUERY as CHARA_SELECT_QUERY
 from nanapi.database.anilist.chara_select import CharaSelectResult, chara_select
 from nanapi.database.anilist.chara_select_birthday import chara_select_birthday
+from nanapi.database.anilist.chara_select_version import chara_select_version
 from nanapi.database.anilist.entry_select_all import (
     ENTRY_SELECT_ALL_MEDIA_TYPE,
     EntrySelectAllResult,
@@ -30,7 +32,9 @@ from nanapi.database.anilist.entry_select_filter_media import (
     EntrySelectFilterMediaResult,
     entry_select_filter_media,
 )
+from nanapi.database.anilist.media_select import EDGEQL_QUERY as MEDIA_SELECT_QUERY
 from nanapi.database.anilist.media_select import MediaSelectResult, media_select
+from nanapi.database.anilist.media_select_version import media_select_version
 from nanapi.database.anilist.staff_select import StaffSelectResult, staff_select
 from nanapi.models.anilist import (
     MEDIA_TYPES,
@@ -41,12 +45,17 @@ from nanapi.models.anilist import (
     UpsertAnilistAccountBody,
 )
 from nanapi.settings import INSTANCE_NAME
-from nanapi.utils.clients import get_edgedb, get_meilisearch
+from nanapi.utils.clients import get_edgedb, get_meilisearch_index
 from nanapi.utils.collages import chara_collage, media_collage
-from nanapi.utils.fastapi import HTTPExceptionModel, NanAPIRouter
+from nanapi.utils.database import raw_json
+from nanapi.utils.fastapi import HTTPExceptionModel, NanAPIRouter, RawJSONResponse, check_etag
+from nanapi.utils.waicolle import invalidate_pools
 
 router = NanAPIRouter(prefix='/anilist', tags=['anilist'])
 
+entry_select_all_raw = raw_json(entry_select_all)
+media_select_raw = raw_json(media_select)
+
 
 ############
 # Accounts #
@@ -65,55 +74,67 @@ async def get_accounts():
 async def upsert_account(discord_id: str, body: UpsertAnilistAccountBody):
     """Upsert AniList account for a Discord user."""
     try:
-        return await account_merge(get_edgedb(), discord_id=discord_id, **body.model_dump())
+        resp = await account_merge(get_edgedb(), discord_id=discord_id, **body.model_dump())
     except ConstraintViolationError as e:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    await invalidate_pools(discord_id)
+    return resp
 
 
 @router.oauth2.get('/accounts/all/entries', response_model=list[EntrySelectAllResult])
 async def get_all_entries(type: ENTRY_SELECT_ALL_MEDIA_TYPE | None = None):
     """Get all AniList entries for all accounts."""
-    return await entry_select_all(get_edgedb(), media_type=type)
+    return RawJSONResponse(await entry_select_all_raw(get_edgedb(), media_type=type))
 
 
 @router.oauth2.get('/accounts/{discord_id}/entries', response_model=list[EntrySelectAllResult])
 async def get_account_entries(discord_id: str, type: ENTRY_SELECT_ALL_MEDIA_TYPE | None = None):
     """Get AniList entries for a specific Discord user."""
-    return await entry_select_all(get_edgedb(), media_type=type, discord_id=discord_id)
+    resp = await entry_select_all_raw(get_edgedb(), media_type=type, discord_id=discord_id)
+    return RawJSONResponse(resp)
 
 
 ##########
 # Medias #
 ##########
-@router.oauth2.get('/medias', response_model=list[MediaSelectResult])
-async def get_medias(ids_al: str):
-    """Get AniList media objects by IDs."""
+def ids_al_param(ids_al: str) -> list[int]:
     try:
-        ids_al_parsed = [int(id_al) for id_al in ids_al.split(',')] if len(ids_al) > 0 else []
+        return [int(id_al) for id_al in ids_al.split(',')] if len(ids_al) > 0 else []
     except ValueError:
         raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY)
 
-    db_resp = await media_select(get_edgedb(), ids_al=ids_al_parsed)
-    return db_resp
+
+async def medias_etag(request: Request, ids_al: list[int] = Depends(ids_al_param)):
+    version = await media_select_version(get_edgedb(), ids_al=ids_al)
+    # the query is part of the version, the body changes with its shape
+    check_etag(request, MEDIA_SELECT_QUERY, version.count, version.updated_at)
+
+
+@router.oauth2.get('/medias', response_model=list[MediaSelectResult], etag=True)
+async def get_medias(
+    ids_al: list[int] = Depends(ids_al_param), _etag: None = Depends(medias_etag)
+):
+    """Get AniList media objects by IDs."""
+    db_resp = await media_select_raw(get_edgedb(), ids_al=ids_al)
+    return RawJSONResponse(db_resp)
 
 
 @router.oauth2.post('/medias/search', response_model=list[MediaSelectResult])
 async def get_medias_post(body: SearchIdsALBody):
     """Get AniList media objects by IDs in request body."""
-    return await media_select(get_edgedb(), **body.model_dump())
+    return RawJSONResponse(await media_select_raw(get_edgedb(), **body.model_dump()))
 
 
 @router.oauth2.get('/medias/search', response_model=list[MediaSelectResult])
 async def media_search(search: str, type: MEDIA_TYPES | None = None):
     """Search for AniList media by title."""
-    async with get_meilisearch() as client:
-        index = client.index(f'{INSTANCE_NAME}_medias')
-        resp = cast(
-            SearchResults[dict[str, Any]],
-            await index.search(  # pyright: ignore[reportUnknownMemberType]
-                search, limit=25, filter=f'type={type}' if type is not None else None
-            ),
-        )
+    index = get_meilisearch_index(f'{INSTANCE_NAME}_medias')
+    resp = cast(
+        SearchResults[dict[str, Any]],
+        await index.search(  # pyright: ignore[reportUnknownMemberType]
+            search, limit=25, filter=f'type={type}' if type is not None else None
+        ),
+    )
     ids = [int(hit['id_al']) for hit in resp.hits]
     data = await media_select(get_edgedb(), ids_al=ids)
     data.sort(key=lambda m: ids.index(m.id_al))
@@ -123,15 +144,14 @@ async def media_search(search: str, type: MEDIA_TYPES | None = None):
 @router.oauth2.get('/medias/autocomplete', response_model=list[MediaTitleAutocompleteResult])
 async def media_title_autocomplete(search: str, type: MEDIA_TYPES | None = None):
     """Autocomplete AniList media titles."""
-    async with get_meilisearch() as client:
-        index = client.index(f'{INSTANCE_NAME}_medias')
-        resp = cast(
-            SearchResults[dict[str, Any]],
-            await index.search(  # pyright: ignore[reportUnknownMemberType]
-                search, limit=25, filter=f'type={type}' if type is not None else None
-            ),
-        )
-        return resp.hits
+    index = get_meilisearch_index(f'{INSTANCE_NAME}_medias')
+    resp = cast(
+        SearchResults[dict[str, Any]],
+        await index.search(  # pyright: ignore[reportUnknownMemberType]
+            search, limit=25, filter=f'type={type}' if type is not None else None
+        ),
+    )
+    return resp.hits
 
 
 @router.public.get(
@@ -167,15 +187,17 @@ async def get_media_chara_edges(id_al: int):
 ##########
 # Charas #
 ##########
-@router.oauth2.get('/charas', response_model=list[CharaSelectResult])
-async def get_charas(ids_al: str):
-    """Get AniList characters by IDs."""
-    try:
-        ids_al_parsed = [int(id_al) for id_al in ids_al.split(',')] if len(ids_al) > 0 else []
-    except ValueError:
-        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY)
+async def charas_etag(request: Request, ids_al: list[int] = Depends(ids_al_param)):
+    version = await chara_select_version(get_edgedb(), ids_al=ids_al)
+    check_etag(request, CHARA_SELECT_QUERY, version.count, version.updated_at)
 
-    db_resp = await chara_select(get_edgedb(), ids_al=ids_al_parsed)
+
+@router.oauth2.get('/charas', response_model=list[CharaSelectResult], etag=True)
+async def get_charas(
+    ids_al: list[int] = Depends(ids_al_param), _etag: None = Depends(charas_etag)
+):
+    """Get AniList characters by IDs."""
+    db_resp = await chara_select(get_edgedb(), ids_al=ids_al)
     return db_resp
 
 
@@ -188,9 +210,8 @@ async def get_charas_post(body: SearchIdsALBody):
 @router.oauth2.get('/charas/search', response_model=list[CharaSelectResult])
 async def chara_search(search: str):
     """Search for AniList characters by name."""
-    async with get_meilisearch() as client:
-        index = client.index(f'{INSTANCE_NAME}_charas')
-        resp = cast(SearchResults[dict[str, Any]], await index.search(search, limit=25))  # pyright: ignore[reportUnknownMemberType]
+    index = get_meilisearch_index(f'{INSTANCE_NAME}_charas')
+    resp = cast(SearchResults[dict[str, Any]], await index.search(search, limit=25))  # pyright: ignore[reportUnknownMemberType]
     ids = [int(hit['id_al']) for hit in resp.hits]
     data = await chara_select(get_edgedb(), ids_al=[int(hit['id_al']) for hit in resp.hits])
     data.sort(key=lambda c: ids.index(c.id_al))
@@ -200,13 +221,12 @@ async def chara_search(search: str):
 @router.oauth2.get('/charas/autocomplete', response_model=list[CharaNameAutocompleteResult])
 async def chara_name_autocomplete(search: str):
     """Autocomplete AniList character names."""
-    async with get_meilisearch() as client:
-        index = client.index(f'{INSTANCE_NAME}_charas')
-        resp = cast(SearchResults[dict[str, Any]], await index.search(search, limit=25))  # pyright: ignore[reportUnknownMemberType]
-        return resp.hits
+    index = get_meilisearch_index(f'{INSTANCE_NAME}_charas')
+    resp = cast(SearchResults[dict[str, Any]], await index.search(search, limit=25))  # pyright: ignore[reportUnknownMemberType]
+    return resp.hits
 
 
-@router.oauth2.get('/charas/birthdays', response_model=list[CharaSelectResult])
+@router.oauth2.get('/charas/birthdays', response_model=list[CharaSelectResult], etag=True)
 async def chara_birthdays():
     """Characters Birthdays"""
     return await chara_select_birthday(get_edgedb())
@@ -266,9 +286,8 @@ async def get_staffs_post(body: SearchIdsALBody):
 @router.oauth2.get('/staffs/search', response_model=list[StaffSelectResult])
 async def staff_search(search: str):
     """Search for AniList staff by name."""
-    async with get_meilisearch() as client:
-        index = client.index(f'{INSTANCE_NAME}_staffs')
-        resp = cast(SearchResults[dict[str, Any]], await index.search(search, limit=25))  # pyright: ignore[reportUnknownMemberType]
+    index = get_meilisearch_index(f'{INSTANCE_NAME}_staffs')
+    resp = cast(SearchResults[dict[str, Any]], await index.search(search, limit=25))  # pyright: ignore[reportUnknownMemberType]
     ids = [int(hit['id_al']) for hit in resp.hits]
     data = await staff_select(get_edgedb(), ids_al=[int(hit['id_al']) for hit in resp.hits])
     data.sort(key=lambda s: ids.index(s.id_al))
@@ -278,10 +297,9 @@ async def staff_search(search: str):
 @router.oauth2.get('/staffs/autocomplete', response_model=list[StaffNameAutocompleteResult])
 async def staff_name_autocomplete(search: str):
     """Autocomplete AniList staff names."""
-    async with get_meilisearch() as client:
-        index = client.index(f'{INSTANCE_NAME}_staffs')
-        resp = cast(SearchResults[dict[str, Any]], await index.search(search, limit=25))  # pyright: ignore[reportUnknownMemberType]
-        return resp.hits
+    index = get_meilisearch_index(f'{INSTANCE_NAME}_staffs')
+    resp = cast(SearchResults[dict[str, Any]], await index.search(search, limit=25))  # pyright: ignore[reportUnknownMemberType]
+    return resp.hits
 
 
 @router.oauth2.get(
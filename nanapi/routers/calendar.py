@@ -30,12 +30,12 @@ from nanapi.database.calendar.user_calendar_select_all import (
     UserCalendarSelectAllResult,
     user_calendar_select_all,
 )
-from nanapi.database.default.client_get_by_username import client_get_by_username
 from nanapi.models.calendar import UpsertGuildEventBody, UpsertUserCalendarBody
 from nanapi.models.common import ParticipantAddBody
 from nanapi.utils.calendar import ics_from_events
 from nanapi.utils.clients import get_edgedb
 from nanapi.utils.fastapi import NanAPIRouter, get_client_edgedb
+from nanapi.utils.security import get_client_by_username
 
 router = NanAPIRouter(prefix='/calendar', tags=['calendar'])
 
@@ -160,10 +160,10 @@ async def remove_guild_event_participant(
     return resp
 
 
-@router.public.get('/ics', responses={status.HTTP_404_NOT_FOUND: {}})
+@router.public.get('/ics', responses={status.HTTP_404_NOT_FOUND: {}}, etag=True)
 async def get_ics(client: str, user: str | None = None, aggregate: bool = False):
     """Get an iCalendar (ICS) file for a client and optionally a user."""
-    _client = await client_get_by_username(get_edgedb(), username=client)
+    _client = await get_client_by_username(client)
     if _client is None:
         return Response(status_code=status.HTTP_404_NOT_FOUND)
     edgedb = get_client_edgedb(_client.id)
@@ -1,3 +1,4 @@
+import asyncio
 from datetime import timedelta
 
 from fastapi import Depends, HTTPException, status
@@ -30,13 +31,14 @@ async def whoami(current_user: ClientGetByUsernameResult = Depends(get_current_c
 async def register(body: NewClientBody):
     """Register a new client account."""
     password = body.password
-    password_hash = get_password_hash(password)
+    password_hash = await asyncio.to_thread(get_password_hash, password)
     try:
-        return await client_insert(
+        resp = await client_insert(
             get_edgedb(), username=body.username, password_hash=password_hash
         )
     except ConstraintViolationError as e:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    return resp
 
 
 @router.public.post(
@@ -1,7 +1,8 @@
 import asyncio
 import base64
+import logging
 import re
-from collections import defaultdict
+from dataclasses import asdict
 from datetime import datetime, timedelta
 from typing import Any, cast
 from uuid import UUID
@@ -42,7 +43,6 @@ from nanapi.database.waicolle.collection_remove_staff import (
     CollectionRemoveStaffResult,
     collection_remove_staff,
 )
-from nanapi.database.waicolle.coupon_add_player import coupon_add_player
 from nanapi.database.waicolle.coupon_delete import CouponDeleteResult, coupon_delete
 from nanapi.database.waicolle.coupon_get_by_code import coupon_get_by_code
 from nanapi.database.waicolle.coupon_insert import CouponInsertResult, coupon_insert
@@ -76,22 +76,22 @@ from nanapi.database.waicolle.player_remove_staff import (
     player_remove_staff,
 )
 from nanapi.database.waicolle.player_select_all import player_select_all
-from nanapi.database.waicolle.player_select_by_chara import (
-    PlayerSelectByCharaResult,
-    player_select_by_chara,
-)
+from nanapi.database.waicolle.player_select_by_chara import player_select_by_chara
+from nanapi.database.waicolle.player_select_by_collection import player_select_by_collection
 from nanapi.database.waicolle.player_staff_stats import PlayerStaffStatsResult, player_staff_stats
 from nanapi.database.waicolle.player_tracked_items import (
     PlayerTrackedItemsResult,
     player_tracked_items,
 )
 from nanapi.database.waicolle.rerollop_insert import rerollop_insert
-from nanapi.database.waicolle.rollop_insert import rollop_insert
+from nanapi.database.waicolle.roll_commit import roll_commit
 from nanapi.database.waicolle.trade_commit import trade_commit
 from nanapi.database.waicolle.trade_delete import TradeDeleteResult, trade_delete
 from nanapi.database.waicolle.trade_get_by_id import trade_get_by_id
 from nanapi.database.waicolle.trade_insert import trade_insert
 from nanapi.database.waicolle.trade_select import TradeSelectResult, trade_select
+from nanapi.database.waicolle.waifu_ascend import WaifuAscendResult, waifu_ascend
+from nanapi.database.waicolle.waifu_ascend_candidates import waifu_ascend_candidates
 from nanapi.database.waicolle.waifu_ascendable import waifu_ascendable
 from nanapi.database.waicolle.waifu_bulk_update import WaifuBulkUpdateResult, waifu_bulk_update
 from nanapi.database.waicolle.waifu_change_owner import waifu_change_owner
@@ -103,13 +103,10 @@ from nanapi.database.waicolle.waifu_replace_custom_position import (
     waifu_replace_custom_position,
 )
 from nanapi.database.waicolle.waifu_select import WaifuSelectResult, waifu_select
-from nanapi.database.waicolle.waifu_select_by_chara import (
-    WaifuSelectByCharaResult,
-    waifu_select_by_chara,
-)
+from nanapi.database.waicolle.waifu_select_by_chara import waifu_select_by_chara
 from nanapi.database.waicolle.waifu_select_by_user import waifu_select_by_user
+from nanapi.database.waicolle.waifu_track_reversed import waifu_track_reversed
 from nanapi.database.waicolle.waifu_track_unlocked import waifu_track_unlocked
-from nanapi.database.waicolle.waifu_update_ascended_from import waifu_update_ascended_from
 from nanapi.database.waicolle.waifu_update_custom_image_name import (
     WaifuUpdateCustomImageNameResult,
     waifu_update_custom_image_name,
@@ -144,12 +141,15 @@ from nanapi.models.waicolle import (
     StaffAlbumResult,
     UpsertPlayerBody,
 )
-from nanapi.settings import INSTANCE_NAME, TZ
-from nanapi.utils.clients import get_edgedb, get_meilisearch
+from nanapi.settings import BLOB_STORE_PERSISTENT, INSTANCE_NAME, TZ
+from nanapi.utils.blobs import blob_response, save_blob
+from nanapi.utils.clients import get_edgedb, get_meilisearch_index
 from nanapi.utils.collages import chara_album, waifu_collage
+from nanapi.utils.database import raw_json
 from nanapi.utils.fastapi import (
     HTTPExceptionModel,
     NanAPIRouter,
+    RawJSONResponse,
     client_id_param,
     get_client_edgedb,
 )
@@ -159,12 +159,22 @@ from nanapi.utils.waicolle import (
     RNG,
     TagRoll,
     UserRoll,
+    get_pool_generation,
+    get_prices,
     get_roll,
+    get_roll_price,
+    invalidate_collection_pools,
+    invalidate_pools,
     load_rolls,
+    plan_ascensions,
 )
 
+logger = logging.getLogger(__name__)
+
 router = NanAPIRouter(prefix='/waicolle', tags=['waicolle'])
 
+waifu_export_raw = raw_json(waifu_export)
+
 
 ###########
 # Players #
@@ -185,7 +195,9 @@ async def upsert_player(
     discord_id: str, body: UpsertPlayerBody, edgedb: AsyncIOClient = Depends(get_client_edgedb)
 ):
     """Upsert a player by Discord ID."""
-    return await player_merge(edgedb, discord_id=discord_id, **body.model_dump())
+    resp = await player_merge(edgedb, discord_id=discord_id, **body.model_dump())
+    await invalidate_pools(discord_id)
+    return resp
 
 
 @router.oauth2_client.get(
@@ -305,6 +317,7 @@ async def player_roll(
     nb: int | None = None,
     pool_discord_id: str | None = None,
     reason: str | None = None,
+    client_id: UUID = Depends(client_id_param),
     edgedb: AsyncIOClient = Depends(get_client_edgedb),
 ):
     """
@@ -351,7 +364,6 @@ async def player_roll(
                     raise HTTPException(
                         status_code=status.HTTP_409_CONFLICT, detail='Coupon already claimed'
                     )
-                await coupon_add_player(tx, code=coupon_code, discord_id=discord_id)
                 roll = UserRoll(3)
                 reason = reason if reason is not None else 'coupon'
             elif nb is not None:
@@ -361,35 +373,31 @@ async def player_roll(
                 raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST)
 
             await roll.load(tx)
-
-            # Pay price
-            price = await roll.get_price(tx, discord_id)
-            if price > 0:
-                try:
-                    await player_add_coins(tx, discord_id=discord_id, moecoins=-price)
-                except ConstraintViolationError as e:
-                    raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
-
-            # Dry roll
             if pool_discord_id is None:
                 pool_discord_id = discord_id
-            charas_ids = await roll.roll(tx, pool_discord_id)
-
-            # Insert waifus
-            new_waifus = await waifu_insert(tx, discord_id=discord_id, charas_ids=charas_ids)
-
-            # Do after task
-            await roll.after(tx, discord_id)
+            price, generation = await get_roll_price(tx, roll, discord_id, pool_discord_id)
 
-            await rollop_insert(
-                tx,
-                author_discord_id=discord_id,
-                received_ids=[w.id for w in new_waifus],
-                reason=reason,
-                moecoins=price,
-            )
+            # Dry roll
+            charas_ids = await roll.roll(pool_discord_id, client_id, generation)
 
-            return new_waifus
+            # Pay price, insert waifus, claim coupon and set first roll flag in one query
+            flag_key = flag_value = None
+            if (flag := roll.first_roll_flag(discord_id)) is not None:
+                redis_value, sub_key = flag
+                flag_key, flag_value = redis_value.make_key(sub_key), redis_value.encode(True)
+            try:
+                return await roll_commit(
+                    tx,
+                    discord_id=discord_id,
+                    charas_ids=charas_ids,
+                    reason=reason,
+                    moecoins=price,
+                    coupon_code=coupon_code if roll_id is None else None,
+                    flag_key=flag_key,
+                    flag_value=flag_value,
+                )
+            except ConstraintViolationError as e:
+                raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
 
 
 @router.oauth2_client.get(
@@ -446,45 +454,16 @@ async def get_player_track_reversed(
     except CardinalityViolationError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
 
-    id_al_set = {w.character.id_al for w in unlocked}
-    async with asyncio.TaskGroup() as tg:
-        tasks = [
-            (
-                id_al,
-                tg.create_task(player_select_by_chara(edgedb, id_al=id_al)),
-                tg.create_task(waifu_select_by_chara(edgedb, id_al=id_al)),
-            )
-            for id_al in id_al_set
-        ]
-
-    resp_map: dict[
-        int,
-        tuple[
-            dict[str, PlayerSelectByCharaResult],
-            dict[str, list[WaifuSelectByCharaResult]],
-        ],
-    ] = {}
-    for id_al, ttask, wtask in tasks:
-        trackers_map = {t.user.discord_id: t for t in ttask.result() if t.frozen_at is None}
-        locked_map = defaultdict[str, list[WaifuSelectByCharaResult]](list)
-        for w in wtask.result():
-            if w.locked and not w.frozen:
-                locked_map[w.owner.user.discord_id].append(w)
-                trackers_map.pop(w.owner.user.discord_id, None)
-        if hide_singles:
-            locked_map = {k: v for k, v in locked_map.items() if len(v) != 1}
-        resp_map[id_al] = (trackers_map, locked_map)
+    tracks = await waifu_track_reversed(
+        edgedb, discord_id=discord_id, hide_singles=bool(hide_singles)
+    )
+    tracks_map = {t.character_id_al: t for t in tracks}
 
     resp: list[dict[str, Any]] = []
     for uwaifu in unlocked:
-        trackers_map, locked_map = resp_map[uwaifu.character.id_al]
-        if len(trackers_map) > 0 or len(locked_map) > 0:
+        if (t := tracks_map.get(uwaifu.character.id_al)) is not None:
             resp.append(
-                dict(
-                    waifu=uwaifu,
-                    trackers_not_owners=trackers_map.values(),
-                    locked=sum(locked_map.values(), list[WaifuSelectByCharaResult]()),
-                )
+                dict(waifu=uwaifu, trackers_not_owners=t.trackers_not_owners, locked=t.locked)
             )
 
     return resp
@@ -515,9 +494,11 @@ async def player_track_media(
 ):
     """Add a media to a player tracking list."""
     try:
-        return await player_add_media(edgedb, discord_id=discord_id, id_al=id_al)
+        resp = await player_add_media(edgedb, discord_id=discord_id, id_al=id_al)
     except CardinalityViolationError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    await invalidate_pools(discord_id)
+    return resp
 
 
 @router.oauth2_client_restricted.delete(
@@ -530,6 +511,7 @@ async def player_untrack_media(
 ):
     """Remove a media from a player tracking list."""
     resp = await player_remove_media(edgedb, discord_id=discord_id, id_al=id_al)
+    await invalidate_pools(discord_id)
     if resp is None:
         return Response(status_code=status.HTTP_204_NO_CONTENT)
     return resp
@@ -560,9 +542,11 @@ async def player_track_staff(
 ):
     """Add a staff to a player tracking list."""
     try:
-        return await player_add_staff(edgedb, discord_id=discord_id, id_al=id_al)
+        resp = await player_add_staff(edgedb, discord_id=discord_id, id_al=id_al)
     except CardinalityViolationError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    await invalidate_pools(discord_id)
+    return resp
 
 
 @router.oauth2_client_restricted.delete(
@@ -575,6 +559,7 @@ async def player_untrack_staff(
 ):
     """Remove a staff from a player tracking list."""
     resp = await player_remove_staff(edgedb, discord_id=discord_id, id_al=id_al)
+    await invalidate_pools(discord_id)
     if resp is None:
         return Response(status_code=status.HTTP_204_NO_CONTENT)
     return resp
@@ -605,9 +590,11 @@ async def player_track_collection(
 ):
     """Add a collection to a player tracking list."""
     try:
-        return await player_add_collection(edgedb, discord_id=discord_id, id=id)
+        resp = await player_add_collection(edgedb, discord_id=discord_id, id=id)
     except CardinalityViolationError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    await invalidate_pools(discord_id)
+    return resp
 
 
 @router.oauth2_client_restricted.delete(
@@ -620,6 +607,7 @@ async def player_untrack_collection(
 ):
     """Remove a collection from a player tracking list."""
     resp = await player_remove_collection(edgedb, discord_id=discord_id, id=id)
+    await invalidate_pools(discord_id)
     if resp is None:
         return Response(status_code=status.HTTP_204_NO_CONTENT)
     return resp
@@ -957,7 +945,11 @@ async def bulk_update_waifus(
 @router.oauth2_client_restricted.post(
     '/waifus/reroll', response_model=RerollResponse, status_code=status.HTTP_201_CREATED
 )
-async def reroll(body: RerollBody, edgedb: AsyncIOClient = Depends(get_client_edgedb)):
+async def reroll(
+    body: RerollBody,
+    client_id: UUID = Depends(client_id_param),
+    edgedb: AsyncIOClient = Depends(get_client_edgedb),
+):
     """Reroll waifus for a player."""
     async for tx in edgedb.transaction():
         async with tx:
@@ -990,7 +982,8 @@ async def reroll(body: RerollBody, edgedb: AsyncIOClient = Depends(get_client_ed
 
             roll = UserRoll(nb_to_roll, min_rank=min_rank, max_rank=REROLLS_MAX_RANKS[min_rank])
             await roll.load(tx)
-            charas_ids = await roll.roll(tx, body.player_discord_id)
+            generation = await get_pool_generation(tx, body.player_discord_id)
+            charas_ids = await roll.roll(body.player_discord_id, client_id, generation)
             resp = await waifu_insert(tx, discord_id=body.player_discord_id, charas_ids=charas_ids)
             await roll.after(tx, body.player_discord_id)
 
@@ -1004,35 +997,17 @@ async def reroll(body: RerollBody, edgedb: AsyncIOClient = Depends(get_client_ed
             return dict(obtained=resp, nanascends=nanascends)
 
 
-async def ascend_all(tx: AsyncIOExecutor, discord_id: str):
+async def ascend_all(tx: AsyncIOExecutor, discord_id: str) -> list[WaifuAscendResult]:
     """Ascend all eligible waifus for a player."""
-    ascended: list[WaifuBulkUpdateResult] = []
-    while True:
-        ascendables = await waifu_ascendable(tx, discord_id=discord_id)
-        _ascended: list[WaifuBulkUpdateResult] = []
-        for ascendable in ascendables:
-            elements = sorted(ascendable.elements, key=lambda e: e.timestamp)
-            while len(elements) >= 4:
-                to_ascend = elements[0]
-                to_delete = elements[1:4]
-                resp = await waifu_bulk_update(
-                    tx,
-                    ids=[to_ascend.id],
-                    level=to_ascend.level + 1,
-                    timestamp=datetime.now(tz=TZ),
-                )
-                await waifu_update_ascended_from(
-                    tx,
-                    ascended_id=to_ascend.id,
-                    ascended_from_ids=[e.id for e in to_delete],
-                )
-                _ascended.append(resp[0])
-                elements = elements[4:]
-        if _ascended:
-            ascended += _ascended
-        else:
-            break
-    return ascended
+    candidates = await waifu_ascend_candidates(tx, discord_id=discord_id)
+    ascensions = [
+        asdict(ascension)
+        for group in candidates
+        for ascension in plan_ascensions(group.elements).values()
+    ]
+    if not ascensions:
+        return []
+    return await waifu_ascend(tx, ascensions=ascensions, timestamp=datetime.now(tz=TZ))
 
 
 @router.oauth2_client_restricted.delete('/waifus/expired', response_model=list[WaifuSelectResult])
@@ -1058,12 +1033,17 @@ async def blood_expired_waifus(
 @router.public.get(
     '/waifus/{id}/image',
     responses={status.HTTP_404_NOT_FOUND: dict(model=HTTPExceptionModel)},
+    etag=True,
 )
 async def get_waifu_image(id: UUID):
     waifus = await waifu_select(get_edgedb(), ids=[id])
     if not waifus:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
     waifu = waifus[0]
+    if waifu.custom_image_digest is not None:
+        if (resp := blob_response(waifu.custom_image_digest, 'image/png')) is not None:
+            return resp
+        logger.warning(f'custom image {waifu.custom_image_digest} missing from the blob store')
     if waifu.custom_image is not None:
         return Response(content=base64.b64decode(waifu.custom_image), media_type='image/png')
     charas = await chara_select(get_edgedb(), ids_al=[waifu.character.id_al])
@@ -1082,7 +1062,19 @@ async def customize_waifu(
     id: UUID, body: CustomizeWaifuBody, edgedb: AsyncIOClient = Depends(get_client_edgedb)
 ):
     """Customize waifu image name."""
-    resp = await waifu_update_custom_image_name(edgedb, id=id, **body.model_dump())
+    custom_image_digest = body.custom_image
+    custom_image = None
+    if body.custom_image:
+        custom_image_digest = await save_blob(base64.b64decode(body.custom_image))
+        if not BLOB_STORE_PERSISTENT:
+            custom_image = body.custom_image
+    resp = await waifu_update_custom_image_name(
+        edgedb,
+        id=id,
+        custom_image_digest=custom_image_digest,
+        custom_image=custom_image,
+        custom_name=body.custom_name,
+    )
     if resp is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
     return resp
@@ -1120,29 +1112,21 @@ async def ascend_waifu(id: UUID, edgedb: AsyncIOClient = Depends(get_client_edge
                 raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
             waifu = waifus[0]
 
-            ascendables = await waifu_ascendable(tx, discord_id=waifu.owner.user.discord_id)
-
-            for ascendable in ascendables:
-                key = ascendable.key
-                if key.chara_id_al == waifu.character.id_al and key.level == waifu.level:
-                    elements = ascendable.elements
-                    break
-            else:
+            candidates = await waifu_ascend_candidates(
+                tx, discord_id=waifu.owner.user.discord_id, chara_id_al=waifu.character.id_al
+            )
+            elements = [
+                element
+                for group in candidates
+                for element in group.elements
+                if element.level == waifu.level
+            ]
+            plan = plan_ascensions(elements, once=True)
+            if not plan:
                 raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST)
 
-            elements = sorted(elements, key=lambda e: e.timestamp)
-
-            to_ascend = elements[0]
-            to_delete = elements[1:4]
-
-            ascended = await waifu_bulk_update(
-                tx, ids=[to_ascend.id], level=to_ascend.level + 1, timestamp=datetime.now(tz=TZ)
-            )
-            await waifu_update_ascended_from(
-                tx,
-                ascended_id=to_ascend.id,
-                ascended_from_ids=[e.id for e in to_delete],
-            )
+            ascensions = [asdict(ascension) for ascension in plan.values()]
+            ascended = await waifu_ascend(tx, ascensions=ascensions, timestamp=datetime.now(tz=TZ))
 
             return ascended[0]
 
@@ -1337,12 +1321,11 @@ async def new_collection(
                 resp = await collection_insert(tx, **body.model_dump())
             except ConstraintViolationError as e:
                 raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
-            async with get_meilisearch() as client:
-                index = client.index(f'{INSTANCE_NAME}_collections_{client_id}')
-                doc = dict(
-                    id=str(resp.id), name=resp.name, author_discord_id=resp.author.user.discord_id
-                )
-                await index.add_documents([doc], primary_key='id')
+            index = get_meilisearch_index(f'{INSTANCE_NAME}_collections_{client_id}')
+            doc = dict(
+                id=str(resp.id), name=resp.name, author_discord_id=resp.author.user.discord_id
+            )
+            await index.add_documents([doc], primary_key='id')
             await player_add_collection(tx, discord_id=body.discord_id, id=resp.id)
             return resp
 
@@ -1352,10 +1335,9 @@ async def new_collection(
 )
 async def collection_name_autocomplete(search: str, client_id: UUID = Depends(client_id_param)):
     """Autocomplete collection names."""
-    async with get_meilisearch() as client:
-        index = client.index(f'{INSTANCE_NAME}_collections_{client_id}')
-        resp = cast(SearchResults[dict[str, Any]], await index.search(search, limit=25))  # pyright: ignore[reportUnknownMemberType]
-        return resp.hits
+    index = get_meilisearch_index(f'{INSTANCE_NAME}_collections_{client_id}')
+    resp = cast(SearchResults[dict[str, Any]], await index.search(search, limit=25))  # pyright: ignore[reportUnknownMemberType]
+    return resp.hits
 
 
 @router.oauth2_client.get(
@@ -1384,12 +1366,13 @@ async def delete_collection(
     """Delete a collection by ID."""
     async for tx in edgedb.transaction():
         async with tx:
+            players = await player_select_by_collection(tx, id=id)
             resp = await collection_delete(tx, id=id)
             if resp is None:
                 return Response(status_code=status.HTTP_204_NO_CONTENT)
-            async with get_meilisearch() as client:
-                index = client.index(f'{INSTANCE_NAME}_collections_{client_id}')
-                await index.delete_document(str(resp.id))
+            index = get_meilisearch_index(f'{INSTANCE_NAME}_collections_{client_id}')
+            await index.delete_document(str(resp.id))
+            await invalidate_pools(*(p.user.discord_id for p in players))
             return resp
 
 
@@ -1403,9 +1386,11 @@ async def collection_track_media(
 ):
     """Track a media for a collection."""
     try:
-        return await collection_add_media(edgedb, id=id, id_al=id_al)
+        resp = await collection_add_media(edgedb, id=id, id_al=id_al)
     except CardinalityViolationError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    await invalidate_collection_pools(edgedb, id)
+    return resp
 
 
 @router.oauth2_client_restricted.put(
@@ -1418,9 +1403,11 @@ async def collection_track_staff(
 ):
     """Track a staff for a collection."""
     try:
-        return await collection_add_staff(edgedb, id=id, id_al=id_al)
+        resp = await collection_add_staff(edgedb, id=id, id_al=id_al)
     except CardinalityViolationError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    await invalidate_collection_pools(edgedb, id)
+    return resp
 
 
 @router.oauth2_client_restricted.delete(
@@ -1435,6 +1422,7 @@ async def collection_untrack_media(
     resp = await collection_remove_media(edgedb, id=id, id_al=id_al)
     if resp is None:
         return Response(status_code=status.HTTP_204_NO_CONTENT)
+    await invalidate_collection_pools(edgedb, id)
     return resp
 
 
@@ -1450,6 +1438,7 @@ async def collection_untrack_staff(
     resp = await collection_remove_staff(edgedb, id=id, id_al=id_al)
     if resp is None:
         return Response(status_code=status.HTTP_204_NO_CONTENT)
+    await invalidate_collection_pools(edgedb, id)
     return resp
 
 
@@ -1499,7 +1488,7 @@ async def delete_coupon(code: str, edgedb: AsyncIOClient = Depends(get_client_ed
 ############
 # Settings #
 ############
-@router.oauth2.get('/settings/ranks', response_model=list[Rank])
+@router.oauth2.get('/settings/ranks', response_model=list[Rank], etag=True)
 async def get_ranks():
     """Get all ranks."""
     return list(RANKS.values())
@@ -1509,13 +1498,13 @@ async def get_ranks():
 async def get_rolls(discord_id: str):
     """Get all rolls and their data."""
     rolls = await load_rolls()
+    names, prices = await asyncio.gather(
+        asyncio.gather(*[roll.get_name(get_edgedb(), discord_id) for roll in rolls.values()]),
+        get_prices(get_edgedb(), list(rolls.values()), discord_id),
+    )
     return [
-        RollData(
-            id=roll_id,
-            name=await roll.get_name(get_edgedb(), discord_id),
-            price=await roll.get_price(get_edgedb(), discord_id),
-        )
-        for roll_id, roll in rolls.items()
+        RollData(id=roll_id, name=name, price=price)
+        for roll_id, name, price in zip(rolls, names, prices)
     ]
 
 
@@ -1525,7 +1514,7 @@ async def get_rolls(discord_id: str):
 @router.oauth2_client.get('/exports/waifus', response_model=WaifuExportResult)
 async def export_waifus(edgedb: AsyncIOClient = Depends(get_client_edgedb)):
     """Export all waifus."""
-    return await waifu_export(edgedb)
+    return RawJSONResponse(await waifu_export_raw(edgedb))
 
 
 @router.oauth2.get('/exports/daily', response_model=list[MediasPoolExportResult])
@@ -5,6 +5,13 @@ from zoneinfo import ZoneInfo
 LOG_LEVEL = 'INFO'
 ERROR_WEBHOOK_URL = None
 PROFILING = False
+PROFILING_SAMPLE_RATE = 1.0
+PROFILING_MAX_RESULTS = 100
+PROFILING_ROUTES: list[str] = []
+PROFILING_TOP_FRAMES = 20
+QUERY_METRICS = False
+QUERY_METRICS_N_PLUS_ONE_THRESHOLD = 10
+WARM_QUERY_ADAPTERS = True
 
 ## General
 INSTANCE_NAME = 'nanapi'
@@ -21,6 +28,21 @@ MEILISEARCH_CONFIG: dict[str, Any] = dict()
 FASTAPI_APP = 'nanapi.fastapi:app'
 FASTAPI_CONFIG: dict[str, Any] = dict()
 HYPERCORN_CONFIG: dict[str, Any] = dict(workers=4, accesslog='-')
+# seconds before another worker can take over the background tasks of a dead one
+LEADER_LEASE_TTL = 60
+COMPRESSION_MINIMUM_SIZE = 1024
+COMPRESSION_GZIP_LEVEL = 6
+COMPRESSION_ZSTD_LEVEL = 3
+# cache shared by the workers, disabled if None
+# values are unpickled: the file is created with mode 0600 and refused if anyone else can
+# write it, keep it in a directory only nanapi can write to
+SHARED_CACHE_PATH: str | None = None
+# processes rendering the collages, per worker
+RENDER_PROCESSES = 2
+# a volume in the docker image, must be persistent and shared by the instances
+BLOB_STORE_PATH = '/var/lib/nanapi/blobs'
+# until set, waifu custom images are also kept as base64 in Gel
+BLOB_STORE_PERSISTENT = False
 
 ## Security
 # JAPAN7_BASIC_AUTH_USERNAME = 'username'
@@ -28,6 +50,8 @@ HYPERCORN_CONFIG: dict[str, Any] = dict(workers=4, accesslog='-')
 JWT_ALGORITHM = 'HS256'
 JWT_EXPIRE_MINUTES = 30
 # JWT_SECRET_KEY = ''  # openssl rand -hex 32
+AUTH_CACHE_TTL = 300
+AUTH_CACHE_MAXSIZE = 1024
 
 ## AniList
 # AniList API is currently in “degraded” mode and limits to
@@ -0,0 +1,78 @@
+"""Move the base64 images stored in Gel to the blob store.
+
+Run once after applying the migration adding anilist::Image.digest and
+waicolle::Waifu.custom_image_digest. Rows are read from their digest once moved, the legacy
+base64 columns are still read until then. Waifu custom images are only removed from Gel
+once BLOB_STORE_PERSISTENT is set: run it again afterwards.
+
+python -m nanapi.tasks.blobs
+"""
+
+import asyncio
+import base64
+import logging
+from typing import cast
+
+import gel
+
+from nanapi.database.anilist.image_select_undigested import image_select_undigested
+from nanapi.database.anilist.image_update_digests import image_update_digests
+from nanapi.database.waicolle.waifu_select_undigested import waifu_select_undigested
+from nanapi.database.waicolle.waifu_update_custom_image_digests import (
+    waifu_update_custom_image_digests,
+)
+from nanapi.settings import BLOB_STORE_PERSISTENT, LOG_LEVEL
+from nanapi.utils.blobs import save_checked_blob
+from nanapi.utils.clients import get_edgedb
+from nanapi.utils.logs import webhook_exceptions
+from nanapi.utils.misc import log_time
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 100
+
+
+@webhook_exceptions
+@log_time
+async def move_images():
+    moved = 0
+    while images := await image_select_undigested(get_edgedb(), batch_size=BATCH_SIZE):
+        digests = [
+            dict(id=image.id, digest=await save_checked_blob(base64.b64decode(image.data)))
+            for image in images
+            if image.data is not None
+        ]
+        await image_update_digests(get_edgedb(), digests=digests)
+        moved += len(digests)
+        logger.info(f'moved {moved} images')
+
+
+@webhook_exceptions
+@log_time
+async def move_custom_images():
+    # waifus of every client
+    edgedb = cast(gel.AsyncIOClient, get_edgedb().with_config(apply_access_policies=False))  # pyright: ignore[reportUnknownMemberType]
+    moved = 0
+    while waifus := await waifu_select_undigested(
+        edgedb, batch_size=BATCH_SIZE, clear=BLOB_STORE_PERSISTENT
+    ):
+        digests = [
+            dict(id=waifu.id, digest=await save_checked_blob(base64.b64decode(waifu.custom_image)))
+            for waifu in waifus
+            if waifu.custom_image is not None
+        ]
+        await waifu_update_custom_image_digests(
+            edgedb, digests=digests, clear=BLOB_STORE_PERSISTENT
+        )
+        moved += len(digests)
+        logger.info(f'moved {moved} custom images')
+
+
+async def main():
+    await move_images()
+    await move_custom_images()
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=LOG_LEVEL)
+    asyncio.run(main())
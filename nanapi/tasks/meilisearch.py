@@ -6,7 +6,7 @@ from nanapi.database.anilist.media_select_all_titles import media_select_all_tit
 from nanapi.database.anilist.staff_select_all_names import staff_select_all_names
 from nanapi.database.waicolle.collection_meili import collection_meili
 from nanapi.settings import INSTANCE_NAME, LOG_LEVEL
-from nanapi.utils.clients import get_edgedb, get_meilisearch
+from nanapi.utils.clients import close_meilisearch, get_edgedb, get_meilisearch_index
 from nanapi.utils.logs import webhook_exceptions
 from nanapi.utils.misc import log_time
 
@@ -21,10 +21,9 @@ async def feed_meili_medias():
         return
     items_dict = [item.model_dump() for item in items]
     logger.debug(f'indexing {len(items_dict)} medias')
-    async with get_meilisearch() as client:
-        index = client.index(f'{INSTANCE_NAME}_medias')
-        await index.update_filterable_attributes(['type'])
-        await index.add_documents(items_dict, primary_key='id_al')
+    index = get_meilisearch_index(f'{INSTANCE_NAME}_medias')
+    await index.update_filterable_attributes(['type'])
+    await index.add_documents(items_dict, primary_key='id_al')
 
 
 @webhook_exceptions
@@ -35,9 +34,8 @@ async def feed_meili_charas():
         return
     items_dict = [item.model_dump() for item in items]
     logger.debug(f'indexing {len(items_dict)} charas')
-    async with get_meilisearch() as client:
-        index = client.index(f'{INSTANCE_NAME}_charas')
-        await index.add_documents(items_dict, primary_key='id_al')
+    index = get_meilisearch_index(f'{INSTANCE_NAME}_charas')
+    await index.add_documents(items_dict, primary_key='id_al')
 
 
 @webhook_exceptions
@@ -48,35 +46,36 @@ async def feed_meili_staffs():
         return
     items_dict = [item.model_dump() for item in items]
     logger.debug(f'indexing {len(items_dict)} staffs')
-    async with get_meilisearch() as client:
-        index = client.index(f'{INSTANCE_NAME}_staffs')
-        await index.add_documents(items_dict, primary_key='id_al')
+    index = get_meilisearch_index(f'{INSTANCE_NAME}_staffs')
+    await index.add_documents(items_dict, primary_key='id_al')
 
 
 @webhook_exceptions
 async def feed_meili_collections():
     resp = await collection_meili(get_edgedb())
-    async with get_meilisearch() as client:
-        for group in resp:
-            client_id = group.key.client.id
-            index = client.index(f'{INSTANCE_NAME}_collections_{client_id}')
-            await index.delete_all_documents()
-            docs = [
-                dict(
-                    id=str(collec.id),
-                    name=collec.name,
-                    author_discord_id=collec.author.user.discord_id,
-                )
-                for collec in group.elements
-            ]
-            await index.add_documents(docs, primary_key='id')
+    for group in resp:
+        client_id = group.key.client.id
+        index = get_meilisearch_index(f'{INSTANCE_NAME}_collections_{client_id}')
+        await index.delete_all_documents()
+        docs = [
+            dict(
+                id=str(collec.id),
+                name=collec.name,
+                author_discord_id=collec.author.user.discord_id,
+            )
+            for collec in group.elements
+        ]
+        await index.add_documents(docs, primary_key='id')
 
 
 async def main():
-    await feed_meili_medias()
-    await feed_meili_charas()
-    await feed_meili_staffs()
-    await feed_meili_collections()
+    try:
+        await feed_meili_medias()
+        await feed_meili_charas()
+        await feed_meili_staffs()
+        await feed_meili_collections()
+    finally:
+        await close_meilisearch()
 
 
 if __name__ == '__main__':
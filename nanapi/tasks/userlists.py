@@ -15,6 +15,7 @@ from nanapi.utils.anilist import (
 )
 from nanapi.utils.clients import get_edgedb
 from nanapi.utils.logs import webhook_exceptions
+from nanapi.utils.waicolle import invalidate_pools
 
 logger = logging.getLogger(__name__)
 
@@ -40,6 +41,7 @@ async def refresh_lists() -> None:
                 except Exception as e:
                     logger.exception(e)
 
+            await invalidate_pools(al.user.discord_id)
             logger.info(f'refreshed entries for {al.username}')
 
 
@@ -0,0 +1,87 @@
+"""Content-addressed store of binary blobs on the local disk.
+
+Blobs are named after the sha256 of their content and sharded under BLOB_STORE_PATH by the
+first bytes of their digest, Gel only holds the digests.
+"""
+
+import asyncio
+import hashlib
+import os
+import tempfile
+from collections.abc import Iterable
+from contextlib import suppress
+from pathlib import Path
+
+from starlette.responses import FileResponse
+
+from nanapi.settings import BLOB_STORE_PATH
+
+
+def blob_path(digest: str) -> Path:
+    return Path(BLOB_STORE_PATH) / digest[:2] / digest[2:4] / digest
+
+
+def put_blob(data: bytes) -> str:
+    digest = hashlib.sha256(data).hexdigest()
+    path = blob_path(digest)
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # written aside then renamed so readers never see a partial blob
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix='.')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, path)
+        except BaseException:
+            with suppress(FileNotFoundError):
+                os.unlink(tmp)
+            raise
+    return digest
+
+
+def get_blob(digest: str) -> bytes | None:
+    try:
+        return blob_path(digest).read_bytes()
+    except FileNotFoundError:
+        return None
+
+
+def check_blob(digest: str) -> bool:
+    data = get_blob(digest)
+    return data is not None and hashlib.sha256(data).hexdigest() == digest
+
+
+async def save_blob(data: bytes) -> str:
+    return await asyncio.to_thread(put_blob, data)
+
+
+async def save_checked_blob(data: bytes) -> str:
+    """Save the blob and read it back, for data only kept in the blob store afterwards."""
+    digest = await save_blob(data)
+    if not await asyncio.to_thread(check_blob, digest):
+        raise RuntimeError(f'blob {digest} could not be read back from {BLOB_STORE_PATH}')
+    return digest
+
+
+async def load_blobs(digests: Iterable[str]) -> dict[str, bytes]:
+    """Read blobs in a thread, the missing ones are left out."""
+
+    def load(digests: set[str]) -> dict[str, bytes]:
+        blobs: dict[str, bytes] = {}
+        for digest in digests:
+            if (data := get_blob(digest)) is not None:
+                blobs[digest] = data
+        return blobs
+
+    return await asyncio.to_thread(load, set(digests))
+
+
+def blob_response(digest: str, media_type: str) -> FileResponse | None:
+    """Response sending the blob file, with sendfile where the server supports it."""
+    path = blob_path(digest)
+    if not path.exists():
+        return None
+    # content-addressed, the digest is a strong ETag
+    return FileResponse(path, media_type=media_type, headers={'ETag': f'"{digest}"'})
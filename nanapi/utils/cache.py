@@ -0,0 +1,532 @@
+import asyncio
+import hashlib
+import logging
+import os
+import pickle
+import sqlite3
+import sys
+import threading
+import time
+from collections import defaultdict
+from collections.abc import (
+    Callable,
+    Coroutine,
+    Generator,
+    Hashable,
+    Iterable,
+    Iterator,
+    Mapping,
+    MutableMapping,
+)
+from contextlib import contextmanager, suppress
+from functools import wraps
+from typing import Any, override
+
+from cachetools import LRUCache
+from cachetools.keys import hashkey
+
+from nanapi.settings import INSTANCE_NAME, SHARED_CACHE_PATH
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+begin;
+create table if not exists cache (
+    namespace text not null,
+    digest text not null,
+    key blob not null,
+    value blob not null,
+    size integer not null,
+    expires real,
+    accessed real not null,
+    primary key (namespace, digest)
+);
+create index if not exists cache_accessed on cache (namespace, accessed);
+-- running byte total of each namespace, kept by the triggers below
+create table if not exists namespace_size (
+    namespace text primary key,
+    size integer not null
+);
+insert or ignore into namespace_size
+    select namespace, sum(size) from cache group by namespace;
+create trigger if not exists cache_insert after insert on cache begin
+    insert into namespace_size values (new.namespace, new.size)
+        on conflict (namespace) do update set size = size + new.size;
+end;
+create trigger if not exists cache_update after update of size on cache begin
+    update namespace_size set size = size - old.size + new.size
+        where namespace = new.namespace;
+end;
+create trigger if not exists cache_delete after delete on cache begin
+    update namespace_size set size = size - old.size where namespace = old.namespace;
+end;
+commit;
+"""
+
+# accessed times are written in batches, every ACCESS_FLUSH_SIZE reads or
+# ACCESS_FLUSH_INTERVAL seconds
+ACCESS_FLUSH_SIZE = 64
+ACCESS_FLUSH_INTERVAL = 10
+
+_connections: dict[tuple[int, str], tuple[sqlite3.Connection, threading.Lock]] = {}
+
+
+###########
+# Metrics #
+###########
+class CacheStats:
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+
+# process-wide stats per cache name
+caches_stats = defaultdict[str, CacheStats](CacheStats)
+
+
+def sizeof(value: Any) -> int:
+    if isinstance(value, bytes | bytearray):
+        return len(value)
+    return sys.getsizeof(value)
+
+
+class SizedLRUCache(LRUCache[Hashable, Any]):
+    """Process LRU cache holding at most maxsize bytes of values.
+
+    Values are weighted with getsizeof, the length of bytes values by default. Evictions are
+    recorded in caches_stats under name, hits and misses by the lookups of cache_get.
+    """
+
+    def __init__(self, name: str, maxsize: int, getsizeof: Callable[[Any], int] = sizeof):
+        super().__init__(maxsize, getsizeof=getsizeof)
+        self.stats = caches_stats[name]
+
+    @override
+    def popitem(self) -> tuple[Hashable, Any]:
+        item = super().popitem()
+        self.stats.evictions += 1
+        return item
+
+
+def check_private(path: str):
+    # values are unpickled, the database must not be writable by anyone else
+    fd = os.open(path, os.O_RDWR | os.O_CREAT | os.O_NOFOLLOW, 0o600)
+    try:
+        st = os.fstat(fd)
+    finally:
+        os.close(fd)
+    if st.st_uid != os.getuid() or st.st_mode & 0o077:
+        raise PermissionError(f'{path} must be owned by the nanapi user with mode 0600')
+
+
+def get_connection(path: str) -> tuple[sqlite3.Connection, threading.Lock]:
+    # connections must not be shared with forked workers
+    key = os.getpid(), path
+    if key not in _connections:
+        check_private(path)
+        conn = sqlite3.connect(path, timeout=1, isolation_level=None, check_same_thread=False)
+        conn.execute('pragma journal_mode=wal')
+        conn.execute('pragma synchronous=normal')
+        conn.executescript(_SCHEMA)
+        # the connection is used from the threads of asyncio.to_thread
+        _connections[key] = conn, threading.Lock()
+    return _connections[key]
+
+
+class SharedCache(MutableMapping[Hashable, Any]):
+    """Cache shared by all the workers, stored in a SQLite database.
+
+    Values are pickled and the least recently used ones are evicted once the namespace holds
+    more than maxsize bytes. Its methods block on SQLite: from the event loop, use
+    shared_cached or cache_get/cache_set, which run them in a thread. Hits, misses and
+    evictions of the worker are recorded in caches_stats under shared:namespace.
+    """
+
+    def __init__(self, path: str, namespace: str, maxsize: int, ttl: float | None = None):
+        self.path = path
+        self.namespace = f'{INSTANCE_NAME}_{namespace}'
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.stats = caches_stats[f'shared:{namespace}']
+        self.accessed: dict[str, float] = {}
+        self.flushed = time.time()
+
+    @contextmanager
+    def conn(self) -> Generator[sqlite3.Connection]:
+        conn, lock = get_connection(self.path)
+        with lock:
+            yield conn
+
+    @staticmethod
+    def _digest(key: Hashable) -> str:
+        return hashlib.sha256(pickle.dumps(key)).hexdigest()
+
+    @override
+    def __getitem__(self, key: Hashable) -> Any:
+        digest = self._digest(key)
+        try:
+            with self.conn() as conn:
+                row = conn.execute(
+                    'select value, expires from cache where namespace = ? and digest = ?',
+                    (self.namespace, digest),
+                ).fetchone()
+            if row is None:
+                self.stats.misses += 1
+                raise KeyError(key)
+            value, expires = row
+            now = time.time()
+            if expires is not None and expires < now:
+                self.stats.misses += 1
+                raise KeyError(key)
+            self.accessed[digest] = now
+            if (
+                len(self.accessed) >= ACCESS_FLUSH_SIZE
+                or now - self.flushed > ACCESS_FLUSH_INTERVAL
+            ):
+                self.flush_accessed()
+        except (sqlite3.Error, OSError) as e:
+            # a broken shared cache must not break the request, treat it as a miss
+            logger.exception(e)
+            self.stats.misses += 1
+            raise KeyError(key)
+        self.stats.hits += 1
+        return pickle.loads(value)
+
+    @override
+    def __setitem__(self, key: Hashable, value: Any):
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(data) > self.maxsize:
+            raise ValueError('value too large')
+        now = time.time()
+        expires = now + self.ttl if self.ttl is not None else None
+        try:
+            with self.conn() as conn:
+                conn.execute(
+                    'insert into cache values (?, ?, ?, ?, ?, ?, ?) '
+                    'on conflict (namespace, digest) do update set value = excluded.value, '
+                    'size = excluded.size, expires = excluded.expires, '
+                    'accessed = excluded.accessed',
+                    (
+                        self.namespace,
+                        self._digest(key),
+                        pickle.dumps(key),
+                        data,
+                        len(data),
+                        expires,
+                        now,
+                    ),
+                )
+            self.evict()
+        except (sqlite3.Error, OSError) as e:
+            logger.exception(e)
+
+    def get_many[K: Hashable](self, keys: Iterable[K]) -> dict[K, Any]:
+        """The cached values of keys, missing keys left out."""
+        values: dict[K, Any] = {}
+        for key in keys:
+            with suppress(KeyError):
+                values[key] = self[key]
+        return values
+
+    def set_many[K: Hashable](self, items: Mapping[K, Any]):
+        """Store items, ignoring values too large for the cache."""
+        for key, value in items.items():
+            with suppress(ValueError):
+                self[key] = value
+
+    @override
+    def __delitem__(self, key: Hashable):
+        with self.conn() as conn:
+            cursor = conn.execute(
+                'delete from cache where namespace = ? and digest = ?',
+                (self.namespace, self._digest(key)),
+            )
+        if cursor.rowcount == 0:
+            raise KeyError(key)
+
+    @override
+    def __iter__(self) -> Iterator[Hashable]:
+        with self.conn() as conn:
+            rows = conn.execute(
+                'select key from cache where namespace = ?', (self.namespace,)
+            ).fetchall()
+        for (key,) in rows:
+            yield pickle.loads(key)
+
+    @override
+    def __len__(self) -> int:
+        with self.conn() as conn:
+            (count,) = conn.execute(
+                'select count(*) from cache where namespace = ?', (self.namespace,)
+            ).fetchone()
+        return count
+
+    @override
+    def clear(self):
+        with self.conn() as conn:
+            conn.execute('delete from cache where namespace = ?', (self.namespace,))
+
+    @property
+    def currsize(self) -> int:
+        with self.conn() as conn:
+            row = conn.execute(
+                'select size from namespace_size where namespace = ?', (self.namespace,)
+            ).fetchone()
+        return row[0] if row is not None else 0
+
+    def flush_accessed(self):
+        accessed, self.accessed = self.accessed, {}
+        self.flushed = time.time()
+        if accessed:
+            with self.conn() as conn:
+                conn.executemany(
+                    'update cache set accessed = max(accessed, ?) '
+                    'where namespace = ? and digest = ?',
+                    [(now, self.namespace, digest) for digest, now in accessed.items()],
+                )
+
+    def evict(self):
+        if self.currsize <= self.maxsize:
+            return
+        self.flush_accessed()
+        with self.conn() as conn:
+            cursor = conn.execute(
+                'delete from cache where namespace = ? and expires < ?',
+                (self.namespace, time.time()),
+            )
+        self.stats.evictions += cursor.rowcount
+        excess = self.currsize - self.maxsize
+        if excess <= 0:
+            return
+        with self.conn() as conn:
+            rows = conn.execute(
+                'select digest, size from cache where namespace = ? order by accessed',
+                (self.namespace,),
+            )
+            digests: list[str] = []
+            for digest, size in rows:
+                digests.append(digest)
+                excess -= size
+                if excess <= 0:
+                    break
+            conn.executemany(
+                'delete from cache where namespace = ? and digest = ?',
+                [(self.namespace, digest) for digest in digests],
+            )
+        self.stats.evictions += len(digests)
+
+
+class TieredCache(MutableMapping[Hashable, Any]):
+    """Process local cache in front of a SharedCache.
+
+    Hits from the shared cache are kept in the local one so they are unpickled only once per
+    worker.
+    """
+
+    def __init__(self, local: MutableMapping[Hashable, Any], shared: SharedCache):
+        self.local = local
+        self.shared = shared
+
+    @override
+    def __getitem__(self, key: Hashable) -> Any:
+        try:
+            return self.local[key]
+        except KeyError:
+            pass
+        value = self.shared[key]
+        try:
+            self.local[key] = value
+        except ValueError:
+            pass
+        return value
+
+    @override
+    def __setitem__(self, key: Hashable, value: Any):
+        try:
+            self.local[key] = value
+        except ValueError:
+            pass
+        self.shared[key] = value
+
+    @override
+    def __delitem__(self, key: Hashable):
+        self.local.pop(key, None)
+        del self.shared[key]
+
+    @override
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self.shared)
+
+    @override
+    def __len__(self) -> int:
+        return len(self.shared)
+
+    @override
+    def clear(self):
+        self.local.clear()
+        self.shared.clear()
+
+
+def shared_cache(
+    namespace: str,
+    maxsize: int,
+    fallback: MutableMapping[Hashable, Any],
+    ttl: float | None = None,
+    tiered: bool = False,
+) -> MutableMapping[Hashable, Any]:
+    """Cache shared by the workers, with a byte budget of maxsize.
+
+    The fallback process cache, usually a SizedLRUCache, is used instead when SHARED_CACHE_PATH
+    is unset, or in front of the shared cache if tiered.
+    """
+    if SHARED_CACHE_PATH is None:
+        return fallback
+    shared = SharedCache(SHARED_CACHE_PATH, namespace, maxsize, ttl=ttl)
+    if tiered:
+        return TieredCache(fallback, shared)
+    return shared
+
+
+def _local_get(cache: MutableMapping[Hashable, Any], key: Hashable) -> Any:
+    # SharedCache records its own hits and misses
+    try:
+        value = cache[key]
+    except KeyError:
+        if isinstance(cache, SizedLRUCache):
+            cache.stats.misses += 1
+        raise
+    if isinstance(cache, SizedLRUCache):
+        cache.stats.hits += 1
+    return value
+
+
+async def cache_get(cache: MutableMapping[Hashable, Any], key: Hashable) -> Any:
+    """cache[key], with the SQLite lookups of shared caches run in a thread."""
+    if isinstance(cache, TieredCache):
+        try:
+            return _local_get(cache.local, key)
+        except KeyError:
+            pass
+        value = await asyncio.to_thread(cache.shared.__getitem__, key)
+        with suppress(ValueError):
+            cache.local[key] = value
+        return value
+    if isinstance(cache, SharedCache):
+        return await asyncio.to_thread(cache.__getitem__, key)
+    return _local_get(cache, key)
+
+
+async def cache_set(cache: MutableMapping[Hashable, Any], key: Hashable, value: Any):
+    """cache[key] = value, ignoring values too large for the cache, with the SQLite writes of
+    shared caches run in a thread."""
+    if isinstance(cache, TieredCache):
+        with suppress(ValueError):
+            cache.local[key] = value
+        cache = cache.shared
+    with suppress(ValueError):
+        if isinstance(cache, SharedCache):
+            await asyncio.to_thread(cache.__setitem__, key, value)
+        else:
+            cache[key] = value
+
+
+async def cache_get_many[K: Hashable](
+    cache: MutableMapping[Hashable, Any], keys: Iterable[K]
+) -> dict[K, Any]:
+    """cache_get for several keys, missing keys left out, with the SQLite lookups of shared
+    caches run in a single thread call."""
+    if isinstance(cache, SharedCache):
+        return await asyncio.to_thread(cache.get_many, list(keys))
+    local = cache.local if isinstance(cache, TieredCache) else cache
+    values: dict[K, Any] = {}
+    missing: list[K] = []
+    for key in keys:
+        try:
+            values[key] = _local_get(local, key)
+        except KeyError:
+            missing.append(key)
+    if isinstance(cache, TieredCache) and missing:
+        shared_values = await asyncio.to_thread(cache.shared.get_many, missing)
+        for key, value in shared_values.items():
+            with suppress(ValueError):
+                local[key] = value
+        values |= shared_values
+    return values
+
+
+async def cache_set_many[K: Hashable](
+    cache: MutableMapping[Hashable, Any], items: Mapping[K, Any]
+):
+    """cache_set for several items, with the SQLite writes of shared caches run in a single
+    thread call."""
+    if isinstance(cache, TieredCache):
+        for key, value in items.items():
+            with suppress(ValueError):
+                cache.local[key] = value
+        cache = cache.shared
+    if isinstance(cache, SharedCache):
+        await asyncio.to_thread(cache.set_many, items)
+        return
+    for key, value in items.items():
+        with suppress(ValueError):
+            cache[key] = value
+
+
+def shared_cached[**P, R](
+    cache: MutableMapping[Hashable, Any], key: Callable[..., Hashable] = hashkey
+) -> Callable[[Callable[P, Coroutine[Any, Any, R]]], Callable[P, Coroutine[Any, Any, R]]]:
+    """asyncache.cached for the caches made by shared_cache, not blocking the event loop."""
+
+    def decorator(
+        func: Callable[P, Coroutine[Any, Any, R]],
+    ) -> Callable[P, Coroutine[Any, Any, R]]:
+        @wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            k = key(*args, **kwargs)
+            try:
+                return await cache_get(cache, k)
+            except KeyError:
+                pass
+            value = await func(*args, **kwargs)
+            await cache_set(cache, k, value)
+            return value
+
+        return wrapper
+
+    return decorator
+
+
+def single_flight[**P, R](
+    key: Callable[..., Hashable] = hashkey,
+) -> Callable[[Callable[P, Coroutine[Any, Any, R]]], Callable[P, Coroutine[Any, Any, R]]]:
+    """Make concurrent calls with the same key share a single execution.
+
+    Meant to be put under asyncache.cached, with the same key, so a burst of misses runs the
+    function once. A caller being cancelled does not cancel the execution awaited by the others.
+    """
+
+    def decorator(
+        func: Callable[P, Coroutine[Any, Any, R]],
+    ) -> Callable[P, Coroutine[Any, Any, R]]:
+        in_flight: dict[Hashable, asyncio.Task[R]] = {}
+
+        def done(k: Hashable, task: asyncio.Task[R]):
+            del in_flight[k]
+            if not task.cancelled():
+                # the callers may all have been cancelled
+                task.exception()
+
+        @wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            k = key(*args, **kwargs)
+            task = in_flight.get(k)
+            if task is None:
+                task = asyncio.create_task(func(*args, **kwargs))
+                in_flight[k] = task
+                task.add_done_callback(lambda t: done(k, t))
+            return await asyncio.shield(task)
+
+        return wrapper
+
+    return decorator
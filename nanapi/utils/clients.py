@@ -1,4 +1,4 @@
-from functools import cache
+from functools import cache, lru_cache
 from typing import cast
 
 import aiohttp
@@ -6,14 +6,19 @@ import gel
 import meilisearch_python_sdk
 import orjson
 from aiohttp.typedefs import JSONEncoder
+from meilisearch_python_sdk.index import AsyncIndex
 from meilisearch_python_sdk.json_handler import OrjsonHandler
 
-from nanapi.settings import EDGEDB_CONFIG, MEILISEARCH_CONFIG, MEILISEARCH_HOST_URL
+from nanapi.settings import EDGEDB_CONFIG, MEILISEARCH_CONFIG, MEILISEARCH_HOST_URL, QUERY_METRICS
+from nanapi.utils.database import InstrumentedExecutor
 
 
 @cache
 def get_edgedb() -> gel.AsyncIOClient:
-    return _get_edgedb()
+    client = _get_edgedb()
+    if QUERY_METRICS:
+        client = cast(gel.AsyncIOClient, InstrumentedExecutor(client))
+    return client
 
 
 def _get_edgedb() -> gel.AsyncIOClient:
@@ -23,13 +28,29 @@ def _get_edgedb() -> gel.AsyncIOClient:
     return cast(gel.AsyncIOClient, client)
 
 
+@cache
 def get_meilisearch() -> meilisearch_python_sdk.AsyncClient:
+    # long-lived client so its connections are kept alive between searches,
+    # closed by close_meilisearch()
     client = meilisearch_python_sdk.AsyncClient(
         MEILISEARCH_HOST_URL, json_handler=OrjsonHandler(), **MEILISEARCH_CONFIG
     )
     return client
 
 
+@lru_cache(maxsize=1024)
+def get_meilisearch_index(uid: str) -> AsyncIndex:
+    return get_meilisearch().index(uid)
+
+
+async def close_meilisearch():
+    if get_meilisearch.cache_info().currsize > 0:
+        client = get_meilisearch()
+        get_meilisearch.cache_clear()
+        get_meilisearch_index.cache_clear()
+        await client.aclose()
+
+
 @cache
 def get_session() -> aiohttp.ClientSession:
     timeout = aiohttp.ClientTimeout(total=30, connect=5, sock_connect=5)
@@ -3,30 +3,44 @@ import base64
 import io
 import logging
 import math
+import multiprocessing as mp
 from abc import ABC, abstractmethod
-from collections import defaultdict
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from dataclasses import field as dc_field
+from enum import StrEnum
+from functools import cache
 from importlib import resources
-from typing import Any, Callable, ClassVar, Self, Sequence, override
+from typing import Any, Callable, ClassVar, Iterable, Self, Sequence, override
 from uuid import UUID, uuid4
 
 import aiohttp
 import backoff
-import numpy as np
-import numpy.typing as npt
-from asyncache import cached
-from cachetools import LRUCache
+from cachetools.keys import hashkey
 from PIL import Image, ImageEnhance, ImageFilter, ImageOps, UnidentifiedImageError
 
 import nanapi.resources
 from nanapi.database.anilist.chara_select import chara_select
 from nanapi.database.anilist.image_save import image_save
 from nanapi.database.anilist.image_select import image_select
+from nanapi.database.anilist.image_tile_save import image_tile_save
+from nanapi.database.anilist.image_tile_select import image_tile_select
 from nanapi.database.anilist.media_select import MediaSelectResult, media_select
 from nanapi.database.waicolle.waifu_insert import WaicolleCollagePosition
+from nanapi.settings import RENDER_PROCESSES
+from nanapi.utils.blobs import load_blobs, save_blob
+from nanapi.utils.cache import (
+    SizedLRUCache,
+    cache_get_many,
+    cache_set,
+    cache_set_many,
+    shared_cache,
+    shared_cached,
+    single_flight,
+)
 from nanapi.utils.clients import get_edgedb, get_session
-from nanapi.utils.misc import default_backoff, to_producer
+from nanapi.utils.misc import default_backoff, spawn, to_producer
 from nanapi.utils.waicolle import CHARA_TYPES, RNG, WAIFU_TYPES
 
 logger = logging.getLogger(__name__)
@@ -35,39 +49,140 @@ logger = logging.getLogger(__name__)
 get_img_sema = asyncio.Semaphore(10)
 
 
+#############
+# Rendering #
+#############
+# the pixel work runs in worker processes, fed and returning encoded images
+@cache
+def get_render_pool() -> ProcessPoolExecutor:
+    # forking a threaded process is unsafe
+    return ProcessPoolExecutor(RENDER_PROCESSES, mp_context=mp.get_context('forkserver'))
+
+
+def close_render_pool():
+    if get_render_pool.cache_info().currsize > 0:
+        get_render_pool().shutdown(wait=False, cancel_futures=True)
+        get_render_pool.cache_clear()
+
+
+async def run_render[*Ts, R](func: Callable[[*Ts], R], *args: *Ts) -> R:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_render_pool(), func, *args)
+
+
 def load_img(buffer: bytes) -> Image.Image:
     img = Image.open(io.BytesIO(buffer))
     img.load()
     return img
 
 
-@cached(cache=LRUCache(2048))
+def check_img(buffer: bytes):
+    with Image.open(io.BytesIO(buffer)) as img:
+        img.verify()
+
+
+def encode_tile(img: Image.Image) -> bytes:
+    # lossless, the collages made of the tiles are compressed once more
+    with io.BytesIO() as buffer:
+        img.save(buffer, 'WEBP', lossless=True)
+        return buffer.getvalue()
+
+
+# the encoded images are cached, decoded ones weigh ten times more
+@shared_cached(shared_cache('img_data', 512 * 2**20, SizedLRUCache('img_data', 128 * 2**20)))
+@single_flight()
 @backoff.on_exception(backoff.expo, (aiohttp.ServerTimeoutError, ValueError), max_time=600)
 @default_backoff
-async def fetch_img(url: str) -> Image.Image:
+async def fetch_img_data(url: str) -> bytes:
     try:
         async with get_img_sema:
             async with get_session().get(url) as resp:
                 resp.raise_for_status()
                 buffer = await resp.read()
 
-            asyncio.create_task(
-                image_save(get_edgedb(), url=url, data=base64.b64encode(buffer).decode())
-            )
+            await run_render(check_img, buffer)
+
+            digest = await save_blob(buffer)
+            spawn(image_save(get_edgedb(), url=url, digest=digest))
 
-            img = await asyncio.to_thread(load_img, buffer)
-            return img
+            return buffer
     except UnidentifiedImageError as e:
         raise RuntimeError(f'failed to load {url}') from e
 
 
+async def load_al_images(urls: Iterable[str]) -> dict[str, bytes]:
+    """Images already fetched, from the blob store or their legacy base64 in Gel."""
+    al_images = await image_select(get_edgedb(), urls=list(set(urls)))
+    blobs = await load_blobs(i.digest for i in al_images if i.digest is not None)
+    images: dict[str, bytes] = {}
+    for al_image in al_images:
+        if al_image.digest is not None and al_image.digest in blobs:
+            images[al_image.url] = blobs[al_image.digest]
+        elif al_image.data is not None:
+            images[al_image.url] = base64.b64decode(al_image.data)
+    return images
+
+
+def blood_enhancer(img: Image.Image) -> Image.Image:
+    img = ImageOps.grayscale(img).convert('RGB')
+    with (
+        resources.path(nanapi.resources, 'blood.png') as bloody_path,
+        Image.open(bloody_path) as bloody,
+    ):
+        for _ in range(5):
+            bloody_x = RNG.integers(0, bloody.width - img.width, dtype=int)
+            bloody_y = RNG.integers(0, bloody.height - img.height, dtype=int)
+
+            bloody_i = bloody.crop(
+                (bloody_x, bloody_y, bloody_x + img.width, bloody_y + img.height)
+            )
+
+            img.paste(bloody_i, (0, 0), bloody_i)
+    return img
+
+
+class CharaImageEnhancer(StrEnum):
+    # named so they can be sent to the render processes
+    DARKEN = 'darken'
+    BLUR = 'blur'
+    BLOOD = 'blood'
+
+    @property
+    def deterministic(self) -> bool:
+        # the output of deterministic enhancers can be kept in the tile cache
+        return self is not CharaImageEnhancer.BLOOD
+
+    def __call__(self, img: Image.Image) -> Image.Image:
+        match self:
+            case CharaImageEnhancer.DARKEN:
+                return ImageEnhance.Brightness(img).enhance(0.5)
+            case CharaImageEnhancer.BLUR:
+                return img.filter(ImageFilter.BoxBlur(10))
+            case CharaImageEnhancer.BLOOD:
+                return blood_enhancer(img)
+
+
+@dataclass(slots=True)
+class Tile:
+    data: bytes
+    zoom: int = 1
+    # applied on top of data when pasted, for the enhancers that are not cached
+    enhancers: list[CharaImageEnhancer] = dc_field(default_factory=list[CharaImageEnhancer])
+
+    def load(self) -> Image.Image:
+        img = load_img(self.data)
+        for enhancer in self.enhancers:
+            img = enhancer(img)
+        return img
+
+
 @dataclass
 class ALImage(ABC):
     WIDTH: ClassVar[int] = 100
     HEIGHT: ClassVar[int] = round(WIDTH * 3 / 2)
 
     def __post_init__(self):
-        self.image: Image.Image | None = None
+        self.tile: Tile | None = None
 
     @abstractmethod
     async def load_image(self, al_img: bytes | None = None):
@@ -90,57 +205,82 @@ class ALImage(ABC):
         img = img.resize((cls.WIDTH * zoom, cls.HEIGHT * zoom))
         return img
 
-    def __getattr__(self, key: str):
-        return getattr(self.image, key)
+    @classmethod
+    def render_tile(
+        cls, data: bytes, zoom: int, enhancers: Sequence[CharaImageEnhancer] = ()
+    ) -> bytes:
+        with load_img(data) as img:
+            tile = img.convert('RGBA')
+        tile = cls.crop(tile)
+        tile = cls.normalize(tile, zoom)
+        for enhancer in enhancers:
+            tile = enhancer(tile)
+        return encode_tile(tile)
 
 
 @dataclass
 class CharaImageProps:
     zoom: int = 1
-    custom_image: Image.Image | None = None
+    # encoded, decoded by the render processes
+    custom_image: bytes | None = None
+    custom_image_digest: str | None = None
 
     @classmethod
     def from_waifu(cls, waifu: WAIFU_TYPES) -> Self:
         props = cls()
         if waifu.level > 0:
             props.zoom = 2**waifu.level
-        if waifu.custom_image is not None:
-            props.custom_image = load_img(base64.b64decode(waifu.custom_image))
+        if waifu.custom_image_digest is not None:
+            props.custom_image_digest = waifu.custom_image_digest
+        elif waifu.custom_image is not None:
+            props.custom_image = base64.b64decode(waifu.custom_image)
         return props
 
+    @property
+    def customized(self) -> bool:
+        return self.custom_image is not None or self.custom_image_digest is not None
 
-type ImageEnhancer = Callable[[Image.Image], Image.Image]
 
+#########
+# Tiles #
+#########
+# (image url, zoom, enhancers applied)
+type TileKey = tuple[str, int, str]
 
-def blood_enhancer(img: Image.Image) -> Image.Image:
-    img = ImageOps.grayscale(img).convert('RGB')
-    with (
-        resources.path(nanapi.resources, 'blood.png') as bloody_path,
-        Image.open(bloody_path) as bloody,
-    ):
-        for _ in range(5):
-            bloody_x = RNG.integers(0, bloody.width - img.width, dtype=int)
-            bloody_y = RNG.integers(0, bloody.height - img.height, dtype=int)
+tile_cache = shared_cache('tile', 256 * 2**20, SizedLRUCache('tile', 64 * 2**20))
 
-            bloody_i = bloody.crop(
-                (bloody_x, bloody_y, bloody_x + img.width, bloody_y + img.height)
-            )
 
-            img.paste(bloody_i, (0, 0), bloody_i)
-    return img
+async def get_tiles(keys: set[TileKey]) -> dict[TileKey, bytes]:
+    tiles: dict[TileKey, bytes] = await cache_get_many(tile_cache, keys)
+
+    missing = keys - tiles.keys()
+    if missing:
+        db_tiles = await image_tile_select(get_edgedb(), urls=list({k[0] for k in missing}))
+        db_tiles = [t for t in db_tiles if (t.url, t.zoom, t.enhancers) in missing]
+        blobs = await load_blobs(t.digest for t in db_tiles)
+        loaded = {
+            (tile.url, tile.zoom, tile.enhancers): blobs[tile.digest]
+            for tile in db_tiles
+            if tile.digest in blobs
+        }
+        tiles |= loaded
+        await cache_set_many(tile_cache, loaded)
 
+    return tiles
 
-class CharaImageEnhancer:
-    DARKEN: ImageEnhancer = lambda img: ImageEnhance.Brightness(img).enhance(0.5)
-    BLUR: ImageEnhancer = lambda img: img.filter(ImageFilter.BoxBlur(10))
-    BLOOD: ImageEnhancer = staticmethod(blood_enhancer)
+
+async def save_tile(key: TileKey, data: bytes):
+    await cache_set(tile_cache, key, data)
+    url, zoom, enhancers = key
+    digest = await save_blob(data)
+    await image_tile_save(get_edgedb(), url=url, zoom=zoom, enhancers=enhancers, digest=digest)
 
 
 @dataclass
 class CharaImage(ALImage):
     chara: CHARA_TYPES
     properties: CharaImageProps = dc_field(default_factory=CharaImageProps)
-    enhancers: list[ImageEnhancer] = dc_field(default_factory=list[ImageEnhancer])
+    enhancers: list[CharaImageEnhancer] = dc_field(default_factory=list[CharaImageEnhancer])
 
     def set_hidden(self):
         self.enhancers = [CharaImageEnhancer.DARKEN, CharaImageEnhancer.BLUR]
@@ -148,41 +288,80 @@ class CharaImage(ALImage):
     def set_blooded(self):
         self.enhancers = [CharaImageEnhancer.BLOOD]
 
-    @override
-    async def load_image(self, al_img: bytes | None = None):
-        img = self.properties.custom_image
+    def _split_enhancers(self) -> tuple[list[CharaImageEnhancer], list[CharaImageEnhancer]]:
+        # the tile holds the image up to the first non deterministic enhancer
+        for i, enhancer in enumerate(self.enhancers):
+            if not enhancer.deterministic:
+                return self.enhancers[:i], self.enhancers[i:]
+        return self.enhancers, []
 
-        if img is None:
-            if al_img is not None:
-                img = await asyncio.to_thread(load_img, al_img)
-            else:
-                try:
-                    img = await fetch_img(self.chara.image_large)
-                except Exception as e:
-                    logger.exception(e)
-                    img = await fetch_img('https://hikari.butaishoujo.moe/p/6b5e1488/default.jpg')
+    @property
+    def tile_key(self) -> TileKey | None:
+        if self.properties.customized:
+            return None
+        tiled, _ = self._split_enhancers()
+        return self.chara.image_large, self.properties.zoom, ','.join(tiled)
 
-        img = img.convert('RGBA')
-        img = self.crop(img)
-        img = self.normalize(img, self.properties.zoom)
+    @override
+    async def load_image(self, al_img: bytes | None = None):
+        data = self.properties.custom_image
+        key = self.tile_key
+
+        if (digest := self.properties.custom_image_digest) is not None:
+            data = (await load_blobs([digest])).get(digest)
+            if data is None:
+                logger.warning(f'custom image {digest} missing from the blob store')
+
+        data = data or al_img
+        if data is None:
+            try:
+                data = await fetch_img_data(self.chara.image_large)
+            except Exception as e:
+                logger.exception(e)
+                data = await fetch_img_data(
+                    'https://hikari.butaishoujo.moe/p/6b5e1488/default.jpg'
+                )
+                # the placeholder must not be cached as this chara tile
+                key = None
 
-        for enhancer in self.enhancers:
-            img = enhancer(img)
+        tiled, _ = self._split_enhancers()
+        data = await run_render(self.render_tile, data, self.properties.zoom, tiled)
+        if key is not None:
+            spawn(save_tile(key, data))
+        self.set_tile(data)
 
-        self.image = img
+    def set_tile(self, data: bytes):
+        _, enhancers = self._split_enhancers()
+        self.tile = Tile(data, self.properties.zoom, enhancers)
 
     @classmethod
     async def load_image_groups(cls, image_groups: list[list['CharaImage']]):
-        al_images = await image_select(
-            get_edgedb(), urls=[i.chara.image_large for g in image_groups for i in g]
-        )
-        al_images_dict = {i.url: base64.b64decode(i.data) for i in al_images}
-        tasks = [
-            img.load_image(al_images_dict.get(img.chara.image_large))
-            for g in image_groups
-            for img in g
-        ]
-        await asyncio.gather(*tasks)
+        images = [img for g in image_groups for img in g]
+        tiles = await get_tiles({key for img in images if (key := img.tile_key) is not None})
+
+        to_load: list[CharaImage] = []
+        for img in images:
+            if (key := img.tile_key) is not None and key in tiles:
+                img.set_tile(tiles[key])
+            else:
+                to_load.append(img)
+
+        if to_load:
+            al_images = await load_al_images(img.chara.image_large for img in to_load)
+            await asyncio.gather(
+                *(img.load_image(al_images.get(img.chara.image_large)) for img in to_load)
+            )
+
+    @staticmethod
+    def tile_groups(image_groups: list[list['CharaImage']]) -> list[list[Tile]]:
+        tile_groups: list[list[Tile]] = []
+        for group in image_groups:
+            tiles: list[Tile] = []
+            for img in group:
+                assert img.tile is not None
+                tiles.append(img.tile)
+            tile_groups.append(tiles)
+        return tile_groups
 
 
 def sorted_custom_positions(waifus_charas: list[WAIFU_TYPES | Any]) -> list[WAIFU_TYPES | Any]:
@@ -237,19 +416,19 @@ def sorted_custom_positions(waifus_charas: list[WAIFU_TYPES | Any]) -> list[WAIF
     return sorted_waifus
 
 
-def _make_collage(image_binary: io.BytesIO, chara_images: list[list[CharaImage]]):
+def _make_collage(tile_groups: list[list[Tile]]) -> bytes:
     n_imgs = 0
     max_group_width = 0
     sizes: list[tuple[int, int, int, list[int]]] = []
-    for i, img_group in enumerate(chara_images):
+    for i, tile_group in enumerate(tile_groups):
         group_height = 0
         group_width = 0
         individual_sizes: list[int] = []
-        for img in img_group:
-            n_imgs += img.properties.zoom**2
-            group_width += img.properties.zoom
-            group_height = max(img.properties.zoom, group_height)
-            individual_sizes.append(img.properties.zoom)
+        for tile in tile_group:
+            n_imgs += tile.zoom**2
+            group_width += tile.zoom
+            group_height = max(tile.zoom, group_height)
+            individual_sizes.append(tile.zoom)
         max_group_width = max(max_group_width, group_width)
         sizes.append((i, group_width, group_height, individual_sizes))
 
@@ -259,98 +438,90 @@ def _make_collage(image_binary: io.BytesIO, chara_images: list[list[CharaImage]]
     nb_rows = round(total_est_height / ALImage.HEIGHT)
     nb_columns = max(math.ceil(n_imgs / nb_rows), max_group_width)
 
-    positions, availability_matrix = _find_positions(sizes, nb_rows, nb_columns)
-    # After computing positions, the size of availability_matrix might change
+    positions, (height, width) = _find_positions(sizes, nb_rows, nb_columns)
 
-    collage = Image.new(
-        'RGBA',
-        (
-            ALImage.WIDTH * len(availability_matrix[0]),
-            ALImage.HEIGHT * len(availability_matrix),
-        ),
-    )
-    for ind_group, img_group in enumerate(chara_images):
+    collage = Image.new('RGBA', (ALImage.WIDTH * width, ALImage.HEIGHT * height))
+    for ind_group, tile_group in enumerate(tile_groups):
         i, j = positions[ind_group]
         curr_width = 0
-        for img in img_group:
-            assert img.image is not None
-            collage.paste(
-                img.image,
-                ((j + curr_width) * ALImage.WIDTH, i * ALImage.HEIGHT),
-            )
-            curr_width += img.properties.zoom
+        for tile in tile_group:
+            with tile.load() as img:
+                collage.paste(img, ((j + curr_width) * ALImage.WIDTH, i * ALImage.HEIGHT))
+            curr_width += tile.zoom
 
-    collage.save(image_binary, 'WEBP', method=6, quality=80)
-    image_binary.seek(0)
+    with io.BytesIO() as image_binary:
+        collage.save(image_binary, 'WEBP', method=6, quality=80)
+        return image_binary.getvalue()
 
 
 def _find_positions(
     sizes: list[tuple[int, int, int, list[int]]], nb_rows: int, nb_columns: int
-) -> tuple[list[tuple[int, int]], npt.NDArray[Any]]:
-    availability_matrix = np.ones((nb_rows, nb_columns), dtype=bool)
+) -> tuple[list[tuple[int, int]], tuple[int, int]]:
+    """First fit of the groups, in their order, scanning the cells row by row.
+
+    Each free cell gets the first remaining group whose bounding box fits there, the collage
+    growing downwards as needed. Returns the position of each group and the collage size in
+    cells, (rows, columns).
+
+    Rows are bitsets of their occupied cells. As the fit only depends on the bounding box,
+    groups are bucketed by it and only the first group of each bucket is tried.
+    """
+    rows: list[int] = [0] * nb_rows
     positions: list[tuple[int, int]] = [(0, 0) for _ in range(len(sizes))]
 
-    # We reverse the list to delete from the end
-    sizes.reverse()
+    buckets = defaultdict[tuple[int, int], deque[tuple[int, list[int]]]](deque)
+    for index, width, height, individual_sizes in sizes:
+        buckets[width, height].append((index, individual_sizes))
 
+    full = (1 << nb_columns) - 1
     i = 0
-    while i < availability_matrix.shape[0]:
-        j = 0
-        while j < availability_matrix.shape[1]:
-            curr_size_i = len(sizes) - 1
-            found_position = False
-            while not found_position and curr_size_i >= 0:
-                found_position = True
-                (index, width, height, individual_sizes) = sizes[curr_size_i]
-                while i + height - 1 >= availability_matrix.shape[0]:
-                    # Last lines, need to make the matrix bigger
-                    new_row = np.ones((1, availability_matrix.shape[1]))
-                    availability_matrix = np.vstack((availability_matrix, new_row))
-                if j + width - 1 < availability_matrix.shape[1]:
-                    for i_i in range(height):
-                        for j_i in range(width):
-                            if not availability_matrix[i + i_i, j + j_i]:
-                                found_position = False
-                else:
-                    found_position = False
-
-                if found_position:
-                    positions[index] = (i, j)
-                    curr_width = 0
-                    for individual_size in individual_sizes:
-                        for i_i in range(individual_size):
-                            for j_i in range(curr_width, curr_width + individual_size):
-                                availability_matrix[i + i_i, j + j_i] = False
-                        curr_width += individual_size
-                    del sizes[curr_size_i]
-                else:
-                    curr_size_i -= 1
-
-            j += 1
+    while buckets:
+        while i >= len(rows):
+            rows.append(0)
+        free = ~rows[i] & full
+        while free and buckets:
+            j = (free & -free).bit_length() - 1
+            free &= free - 1
+            # the first group in order is the first bucket head that fits
+            for (width, height), bucket in sorted(buckets.items(), key=lambda b: b[1][0][0]):
+                if j + width > nb_columns:
+                    continue
+                mask = ((1 << width) - 1) << j
+                if any(row & mask for row in rows[i : i + height]):
+                    continue
+
+                index, individual_sizes = bucket.popleft()
+                if not bucket:
+                    del buckets[width, height]
+                positions[index] = (i, j)
+                while i + height > len(rows):
+                    rows.append(0)
+                curr_width = 0
+                for individual_size in individual_sizes:
+                    square = ((1 << individual_size) - 1) << (j + curr_width)
+                    for i_i in range(i, i + individual_size):
+                        rows[i_i] |= square
+                    curr_width += individual_size
+                free &= ~rows[i]
+                break
         i += 1
 
-        if i == availability_matrix.shape[0] and sizes:
-            # No more line, need to make the matrix bigger
-            new_row = np.ones((1, availability_matrix.shape[1]))
-            availability_matrix = np.vstack((availability_matrix, new_row))
-
     # Cleaning
-    h, w = availability_matrix.shape
-    for i in range(availability_matrix.shape[0]):
-        if availability_matrix[i].all():
-            h = i
-            break
+    h = next((i for i, row in enumerate(rows) if not row), len(rows))
+    occupied = 0
+    for row in rows:
+        occupied |= row
+    w = min((~occupied & (occupied + 1)).bit_length() - 1, nb_columns)
 
-    for i in range(availability_matrix.shape[1]):
-        if availability_matrix[:, i].all():
-            w = i
-            break
+    return positions, (h, w)
 
-    availability_matrix = availability_matrix[:h, :w]
 
-    return positions, availability_matrix
+def _waifu_collage_key(waifus: list[WAIFU_TYPES]):
+    # waifus are not hashable and their customization changes the collage
+    return hashkey(*(w.model_dump_json() for w in waifus))
 
 
+@single_flight(key=_waifu_collage_key)
 async def waifu_collage(waifus: list[WAIFU_TYPES]) -> str:
     ids_al = {w.character.id_al for w in waifus}
     charas_data = await chara_select(get_edgedb(), ids_al=list(ids_al))
@@ -386,15 +557,10 @@ async def waifu_collage(waifus: list[WAIFU_TYPES]) -> str:
 
     await CharaImage.load_image_groups(chara_images)
 
-    try:
-        with io.BytesIO() as image_binary:
-            await asyncio.to_thread(_make_collage, image_binary, chara_images)
-            hikari = await to_producer(image_binary, filename=f'wc_{uuid4()}.webp')
-            return hikari['url']
-    finally:
-        for group in chara_images:
-            for img in group:
-                img.close()
+    data = await run_render(_make_collage, CharaImage.tile_groups(chara_images))
+    with io.BytesIO(data) as image_binary:
+        hikari = await to_producer(image_binary, filename=f'wc_{uuid4()}.webp')
+        return hikari['url']
 
 
 async def chara_collage(ids_al: list[int], hide_no_images: bool = False, blooded: bool = False):
@@ -406,7 +572,10 @@ async def chara_collage(ids_al: list[int], hide_no_images: bool = False, blooded
             yield b
 
 
-@cached(cache=LRUCache(1024))
+@shared_cached(
+    shared_cache('chara_collage', 256 * 2**20, SizedLRUCache('chara_collage', 64 * 2**20))
+)
+@single_flight()
 async def _chara_collage(
     ids_al: tuple[int, ...], hide_no_images: bool = False, blooded: bool = False
 ) -> bytes:
@@ -428,17 +597,16 @@ async def _chara_collage(
 
     await CharaImage.load_image_groups(chara_images)
 
-    try:
-        with io.BytesIO() as image_binary:
-            await asyncio.to_thread(_make_collage, image_binary, chara_images)
-            image_binary.seek(0)
-            return image_binary.read()
-    finally:
-        for group in chara_images:
-            for img in group:
-                img.close()
+    return await run_render(_make_collage, CharaImage.tile_groups(chara_images))
+
+
+def _chara_album_key(
+    charas: list[CHARA_TYPES], waifus: list[WAIFU_TYPES], owned_only: bool = False
+):
+    return hashkey(tuple(c.id_al for c in charas), _waifu_collage_key(waifus), owned_only)
 
 
+@single_flight(key=_chara_album_key)
 async def chara_album(
     charas: list[CHARA_TYPES], waifus: list[WAIFU_TYPES], owned_only: bool = False
 ) -> str:
@@ -488,15 +656,10 @@ async def chara_album(
 
     await CharaImage.load_image_groups(chara_images)
 
-    try:
-        with io.BytesIO() as image_binary:
-            await asyncio.to_thread(_make_collage, image_binary, chara_images)
-            hikari = await to_producer(image_binary, filename=f'wc_{uuid4()}.webp')
-            return hikari['url']
-    finally:
-        for group in chara_images:
-            for img in group:
-                img.close()
+    data = await run_render(_make_collage, CharaImage.tile_groups(chara_images))
+    with io.BytesIO(data) as image_binary:
+        hikari = await to_producer(image_binary, filename=f'wc_{uuid4()}.webp')
+        return hikari['url']
 
 
 def _is_left_part_of_waifu_group(waifus: list[WAIFU_TYPES | Any], index: int) -> bool:
@@ -528,24 +691,16 @@ class MediaImage(ALImage):
 
     @override
     async def load_image(self, al_img: bytes | None = None):
-        if al_img is not None:
-            img = await asyncio.to_thread(load_img, al_img)
-        else:
-            img = await fetch_img(self.media.cover_image_extra_large)
-        self.image = self.crop(img)
-        self.image = self.normalize(self.image, 4)
+        if al_img is None:
+            al_img = await fetch_img_data(self.media.cover_image_extra_large)
+        self.tile = Tile(await run_render(self.render_tile, al_img, 4), 4)
 
     @classmethod
     async def load_images(cls, images: list[Self]):
-        al_images = await image_select(
-            get_edgedb(), urls=[img.media.cover_image_extra_large for img in images]
-        )
-        al_images_dict = {i.url: base64.b64decode(i.data) for i in al_images}
+        al_images = await load_al_images(img.media.cover_image_extra_large for img in images)
         async with asyncio.TaskGroup() as tg:
             for img in images:
-                tg.create_task(
-                    img.load_image(al_images_dict.get(img.media.cover_image_extra_large))
-                )
+                tg.create_task(img.load_image(al_images.get(img.media.cover_image_extra_large)))
 
 
 async def media_collage(ids_al: list[int]):
@@ -557,7 +712,10 @@ async def media_collage(ids_al: list[int]):
             yield b
 
 
-@cached(cache=LRUCache(1024))
+@shared_cached(
+    shared_cache('media_collage', 256 * 2**20, SizedLRUCache('media_collage', 64 * 2**20))
+)
+@single_flight()
 async def _media_collage(ids_al: tuple[int, ...]) -> bytes:
     medias_data = await media_select(get_edgedb(), ids_al=list(ids_al))
     media_dict = {m.id_al: m for m in medias_data}
@@ -567,25 +725,21 @@ async def _media_collage(ids_al: tuple[int, ...]) -> bytes:
     media_images = [MediaImage(m) for m in medias]
     await MediaImage.load_images(media_images)
 
-    try:
-        with io.BytesIO() as image_binary:
-            await asyncio.to_thread(_make_dumb_collage, image_binary, media_images)
-            image_binary.seek(0)
-            return image_binary.read()
-    finally:
-        for img in media_images:
-            img.close()
-
-
-def _make_dumb_collage(image_binary: io.BytesIO, images: Sequence[ALImage]):
-    collage = Image.new(
-        'RGBA',
-        (images[0].width * len(images), images[0].height),
-    )
+    tiles: list[Tile] = []
+    for img in media_images:
+        assert img.tile is not None
+        tiles.append(img.tile)
+    return await run_render(_make_dumb_collage, tiles)
+
+
+def _make_dumb_collage(tiles: Sequence[Tile]) -> bytes:
+    width, height = ALImage.WIDTH * tiles[0].zoom, ALImage.HEIGHT * tiles[0].zoom
+    collage = Image.new('RGBA', (width * len(tiles), height))
     curr_width = 0
-    for img in images:
-        assert img.image is not None
-        collage.paste(img.image, (curr_width, 0))
-        curr_width += img.width
-    collage.save(image_binary, 'WEBP', method=6, quality=80)
-    image_binary.seek(0)
+    for tile in tiles:
+        with tile.load() as img:
+            collage.paste(img, (curr_width, 0))
+        curr_width += width
+    with io.BytesIO() as image_binary:
+        collage.save(image_binary, 'WEBP', method=6, quality=80)
+        return image_binary.getvalue()
@@ -0,0 +1,174 @@
+import asyncio
+import sys
+import time
+from collections import defaultdict
+from collections.abc import Awaitable, Callable, Iterator
+from contextvars import ContextVar
+from typing import Any, Concatenate, Self, get_origin, get_type_hints
+
+from gel import AsyncIOExecutor
+from pydantic import TypeAdapter
+
+
+def raw_json[**P](
+    func: Callable[Concatenate[AsyncIOExecutor, P], Awaitable[Any]],
+) -> Callable[Concatenate[AsyncIOExecutor, P], Awaitable[str]]:
+    """Build a passthrough variant of a generated query function.
+
+    The returned coroutine runs the same EdgeQL query but returns Gel's JSON untouched,
+    skipping the pydantic validation done by the generated function.
+    """
+    query: str = sys.modules[func.__module__].EDGEQL_QUERY
+    many = get_origin(get_type_hints(func)['return']) is list
+
+    async def raw(executor: AsyncIOExecutor, *args: P.args, **kwargs: P.kwargs) -> str:
+        if many:
+            return await executor.query_json(query, *args, **kwargs)  # pyright: ignore[reportUnknownMemberType]
+        return await executor.query_single_json(query, *args, **kwargs)  # pyright: ignore[reportUnknownMemberType]
+
+    raw.__name__ = raw.__qualname__ = f'{func.__name__}_raw'
+    return raw
+
+
+def query_adapters() -> Iterator[TypeAdapter[Any]]:
+    for module_name, module in list(sys.modules.items()):
+        if module_name.startswith('nanapi.database.'):
+            adapter = getattr(module, 'adapter', None)
+            if isinstance(adapter, TypeAdapter):
+                yield adapter
+
+
+async def warm_adapters():
+    """Build the deferred TypeAdapters of the imported query modules.
+
+    The adapters are otherwise built on their first validation. One adapter is built per event
+    loop iteration so requests are still served in between.
+    """
+    for adapter in query_adapters():
+        adapter.rebuild()
+        await asyncio.sleep(0)
+
+
+###########
+# Metrics #
+###########
+class QueryStats:
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.max_duration = 0.0
+
+    def add(self, duration: float):
+        self.count += 1
+        self.duration += duration
+        self.max_duration = max(self.max_duration, duration)
+
+
+class RequestQueries:
+    def __init__(self):
+        self.queries = defaultdict[str, QueryStats](QueryStats)
+
+    @property
+    def count(self) -> int:
+        return sum(s.count for s in self.queries.values())
+
+    @property
+    def duration(self) -> float:
+        return sum(s.duration for s in self.queries.values())
+
+
+# process-wide stats per query name, and stats of the request being served
+queries_stats = defaultdict[str, QueryStats](QueryStats)
+current_request_queries = ContextVar[RequestQueries | None](
+    'current_request_queries', default=None
+)
+
+_query_names: dict[str, str] = {}
+
+
+def _query_name(query: str) -> str:
+    """Name of the generated module of query, relative to nanapi.database."""
+    name = _query_names.get(query)
+    if name is None:
+        for module_name, module in list(sys.modules.items()):
+            if module_name.startswith('nanapi.database.'):
+                module_query = getattr(module, 'EDGEQL_QUERY', None)
+                if module_query is not None:
+                    _query_names[module_query] = module_name.removeprefix('nanapi.database.')
+        # all the queries are generated, a miss means the query was written elsewhere
+        name = _query_names.setdefault(query, '<unknown>')
+    return name
+
+
+class InstrumentedExecutor:
+    """Gel client or transaction wrapper recording the count and duration of each query.
+
+    Queries are named after the generated module running them and recorded both in the
+    process-wide queries_stats and in the current_request_queries of the request.
+    """
+
+    def __init__(self, executor: Any):
+        self._executor = executor
+
+    async def _timed(self, method: str, query: str, *args: Any, **kwargs: Any) -> Any:
+        name = _query_name(query)
+        begin = time.perf_counter()
+        try:
+            return await getattr(self._executor, method)(query, *args, **kwargs)
+        finally:
+            duration = time.perf_counter() - begin
+            queries_stats[name].add(duration)
+            if (request_queries := current_request_queries.get()) is not None:
+                request_queries.queries[name].add(duration)
+
+    async def query(self, query: str, *args: Any, **kwargs: Any) -> Any:
+        return await self._timed('query', query, *args, **kwargs)
+
+    async def query_single(self, query: str, *args: Any, **kwargs: Any) -> Any:
+        return await self._timed('query_single', query, *args, **kwargs)
+
+    async def query_required_single(self, query: str, *args: Any, **kwargs: Any) -> Any:
+        return await self._timed('query_required_single', query, *args, **kwargs)
+
+    async def query_json(self, query: str, *args: Any, **kwargs: Any) -> Any:
+        return await self._timed('query_json', query, *args, **kwargs)
+
+    async def query_single_json(self, query: str, *args: Any, **kwargs: Any) -> Any:
+        return await self._timed('query_single_json', query, *args, **kwargs)
+
+    async def query_required_single_json(self, query: str, *args: Any, **kwargs: Any) -> Any:
+        return await self._timed('query_required_single_json', query, *args, **kwargs)
+
+    async def execute(self, query: str, *args: Any, **kwargs: Any) -> Any:
+        return await self._timed('execute', query, *args, **kwargs)
+
+    def transaction(self) -> 'InstrumentedRetry':
+        return InstrumentedRetry(self._executor.transaction())
+
+    async def __aenter__(self) -> Self:
+        await self._executor.__aenter__()
+        return self
+
+    async def __aexit__(self, *args: Any) -> Any:
+        return await self._executor.__aexit__(*args)
+
+    def __getattr__(self, key: str) -> Any:
+        attr = getattr(self._executor, key)
+        if key.startswith(('with_', 'without_')):
+            # derived clients (with_globals…) must stay instrumented
+            def derive(*args: Any, **kwargs: Any) -> InstrumentedExecutor:
+                return InstrumentedExecutor(attr(*args, **kwargs))
+
+            return derive
+        return attr
+
+
+class InstrumentedRetry:
+    def __init__(self, retry: Any):
+        self._retry = retry
+
+    def __aiter__(self) -> Self:
+        return self
+
+    async def __anext__(self) -> InstrumentedExecutor:
+        return InstrumentedExecutor(await self._retry.__anext__())
@@ -1,34 +1,128 @@
+import hashlib
+import logging
+import sys
+from collections import deque
+from collections.abc import Callable, Coroutine
 from functools import cache, cached_property
 from typing import Annotated, Any, Self, cast, override
 from uuid import UUID
 
+import anyio
 import gel
-import jwt
 from fastapi import APIRouter, Depends, FastAPI, HTTPException, Security, status
-from fastapi.responses import HTMLResponse
+from fastapi.responses import FileResponse, HTMLResponse, Response, StreamingResponse
+from fastapi.routing import APIRoute
 from fastapi.security import HTTPBasicCredentials
 from pydantic import BaseModel
+from starlette.datastructures import Headers
 from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.middleware.gzip import GZipResponder, IdentityResponder
 from starlette.requests import Request
-
-from nanapi.database.default.client_get_by_username import (
-    ClientGetByUsernameResult,
-    client_get_by_username,
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from nanapi.database.default.client_get_by_username import ClientGetByUsernameResult
+from nanapi.settings import (
+    COMPRESSION_GZIP_LEVEL,
+    COMPRESSION_MINIMUM_SIZE,
+    COMPRESSION_ZSTD_LEVEL,
+    PROFILING,
+    QUERY_METRICS_N_PLUS_ONE_THRESHOLD,
 )
-from nanapi.settings import JWT_ALGORITHM, JWT_SECRET_KEY, PROFILING
+from nanapi.utils.cache import caches_stats
 from nanapi.utils.clients import get_edgedb
+from nanapi.utils.database import RequestQueries, current_request_queries, queries_stats
 from nanapi.utils.security import (
     HTTP_BASIC_AUTH,
     OAUTH2_BEARER_AUTH,
     authenticate_client,
+    decode_access_token,
+    get_client_by_username,
     japan7_basic_auth,
 )
 
+logger = logging.getLogger(__name__)
+
 
 class HTTPExceptionModel(BaseModel):
     detail: str
 
 
+class RawJSONResponse(Response):
+    """JSON already serialized by Gel, sent as is.
+
+    Returning it from a route bypasses the response_model validation and serialization,
+    the response_model is then only used for the OpenAPI schema.
+    """
+
+    media_type = 'application/json'
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Whether If-None-Match matches etag, using the weak comparison."""
+    if_none_match = request.headers.get('if-none-match', '')
+    return if_none_match.strip() == '*' or etag.removeprefix('W/') in (
+        tag.strip().removeprefix('W/') for tag in if_none_match.split(',')
+    )
+
+
+def check_etag(request: Request, *version: object):
+    """Answer a conditional request before the route handler runs.
+
+    For an ETagRoute whose body is costly to compute: a dependency of the route calls it with
+    a cheap version of the data the response is made of. The ETag is derived from it and the
+    request URL, a matching If-None-Match gets a 304 and the handler is not run. Otherwise the
+    ETagRoute sends this ETag instead of hashing the body.
+    """
+    key = '\0'.join([str(request.url.path), str(request.url.query), *map(str, version)])
+    etag = f'W/"{hashlib.blake2b(key.encode(), digest_size=16).hexdigest()}"'
+    if _etag_matches(request, etag):
+        raise HTTPException(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={'ETag': etag, 'Vary': 'Accept-Encoding'},
+        )
+    request.state.etag = etag
+
+
+class ETagRoute(APIRoute):
+    """Route sending a weak ETag computed from the response body, or from a version of its data
+    given to check_etag.
+
+    The ETag is weak since CompressionMiddleware may encode the body differently per request.
+    File responses keep their own ETag. Requests whose If-None-Match matches it, using the weak
+    comparison, get an empty 304 Not Modified response.
+    """
+
+    @override
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        handler = super().get_route_handler()
+
+        async def etag_handler(request: Request) -> Response:
+            response = await handler(request)
+            if response.status_code != status.HTTP_200_OK or isinstance(
+                response, StreamingResponse
+            ):
+                return response
+            if (etag := getattr(request.state, 'etag', None)) is not None:
+                # checked by check_etag before the handler ran
+                response.headers['ETag'] = etag
+                return response
+            if isinstance(response, FileResponse):
+                if (etag := response.headers.get('etag')) is None:
+                    return response
+            else:
+                etag = f'W/"{hashlib.blake2b(response.body, digest_size=16).hexdigest()}"'
+            if _etag_matches(request, etag):
+                # the 304 is not compressed, caches must still key it on the encoding
+                return Response(
+                    status_code=status.HTTP_304_NOT_MODIFIED,
+                    headers={'ETag': etag, 'Vary': 'Accept-Encoding'},
+                )
+            response.headers['ETag'] = etag
+            return response
+
+        return etag_handler
+
+
 class NanAPIRouter(APIRouter):
     @cached_property
     def public(self) -> Self:
@@ -114,9 +208,21 @@ class APIRouterProxy:
         if self.responses:
             kwargs.setdefault('responses', {}).update(self.responses)
 
-    def get(self, *args: Any, **kwargs: Any):
+    def get(self, path: str, *, etag: bool = False, **kwargs: Any):
+        """If etag is set, the route answers conditional requests, see ETagRoute."""
         self._prepare_kwargs(kwargs)
-        return self.router.get(*args, **kwargs)
+        if not etag:
+            return self.router.get(path, **kwargs)
+
+        kwargs.setdefault('responses', {})[status.HTTP_304_NOT_MODIFIED] = {}
+
+        def decorator[F: Callable[..., Any]](func: F) -> F:
+            self.router.add_api_route(
+                path, func, methods=['GET'], route_class_override=ETagRoute, **kwargs
+            )
+            return func
+
+        return decorator
 
     def post(self, *args: Any, **kwargs: Any):
         self._prepare_kwargs(kwargs)
@@ -138,10 +244,6 @@ class APIRouterProxy:
         return getattr(self.router, key)
 
 
-class TokenData(BaseModel):
-    username: str
-
-
 async def get_current_client(
     bearer: Annotated[str | None, Security(OAUTH2_BEARER_AUTH)],
     basic: Annotated[HTTPBasicCredentials | None, Security(HTTP_BASIC_AUTH)],
@@ -155,15 +257,10 @@ async def get_current_client(
     )
 
     if bearer is not None:
-        try:
-            payload = jwt.decode(bearer, JWT_SECRET_KEY, algorithms=[JWT_ALGORITHM])  # pyright: ignore[reportUnknownMemberType]
-            username: str | None = payload.get('sub', None)
-            if username is None:
-                raise credentials_exception
-            token_data = TokenData(username=username)
-        except jwt.PyJWTError:
+        username = decode_access_token(bearer)
+        if username is None:
             raise credentials_exception
-        client = await client_get_by_username(get_edgedb(), username=token_data.username)
+        client = await get_client_by_username(username)
 
     elif basic is not None:
         client = await authenticate_client(basic.username, basic.password)
@@ -198,37 +295,304 @@ def get_client_edgedb(client_id: UUID = Depends(client_id_param)) -> gel.AsyncIO
     return cast(gel.AsyncIOClient, client)
 
 
+class QueryMetricsMiddleware(BaseHTTPMiddleware):
+    """Record the Gel queries run by each request.
+
+    The count and duration of the queries are sent back in a Server-Timing header and
+    aggregated for the worker under /metrics/queries. Requests running the same query more
+    than QUERY_METRICS_N_PLUS_ONE_THRESHOLD times are logged and listed there as well. The
+    hits, misses and evictions of the worker caches are served under /metrics/caches.
+    """
+
+    def __init__(self, *args: Any, fastapi_app: FastAPI | None = None, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.n_plus_one = deque[dict[str, Any]](maxlen=100)
+        if fastapi_app is not None:
+            router = APIRouter(prefix='/metrics', tags=['metrics'])
+            router.add_api_route('/queries', self.get_queries)
+            router.add_api_route('/caches', self.get_caches)
+            fastapi_app.include_router(router)
+
+    @override
+    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint):
+        request_queries = RequestQueries()
+        token = current_request_queries.set(request_queries)
+        try:
+            resp = await call_next(request)
+        finally:
+            current_request_queries.reset(token)
+
+        timings = [
+            f'db;dur={request_queries.duration * 1000:.1f};desc="{request_queries.count} queries"'
+        ]
+        for name, stats in request_queries.queries.items():
+            timings.append(f'{name};dur={stats.duration * 1000:.1f};desc="{stats.count}x"')
+            if stats.count > QUERY_METRICS_N_PLUS_ONE_THRESHOLD:
+                logger.warning(f'{request.method} {request.url.path}: {stats.count}x {name}')
+                self.n_plus_one.append(
+                    dict(
+                        method=request.method,
+                        path=request.url.path,
+                        query=name,
+                        count=stats.count,
+                        duration=stats.duration,
+                    )
+                )
+        resp.headers['Server-Timing'] = ', '.join(timings)
+        return resp
+
+    async def get_queries(self):
+        queries = sorted(queries_stats.items(), key=lambda kv: kv[1].duration, reverse=True)
+        return dict(
+            queries={
+                name: dict(
+                    count=stats.count,
+                    duration=stats.duration,
+                    mean_duration=stats.duration / stats.count,
+                    max_duration=stats.max_duration,
+                )
+                for name, stats in queries
+            },
+            n_plus_one=list(self.n_plus_one),
+        )
+
+    async def get_caches(self):
+        return {
+            name: dict(
+                hits=stats.hits,
+                misses=stats.misses,
+                hit_ratio=stats.hits / max(stats.hits + stats.misses, 1),
+                evictions=stats.evictions,
+            )
+            for name, stats in sorted(caches_stats.items())
+        }
+
+
+# media types that are already compressed
+INCOMPRESSIBLE_CONTENT_TYPES = (
+    'image/',
+    'video/',
+    'audio/',
+    'font/woff',
+    'application/gzip',
+    'application/zip',
+    'application/zstd',
+    'text/event-stream',
+)
+
+
+def accepted_encodings(accept_encoding: str) -> set[str]:
+    encodings = set[str]()
+    for item in accept_encoding.split(','):
+        encoding, _, params = item.partition(';')
+        q = params.strip().removeprefix('q=')
+        try:
+            if params and float(q) == 0:
+                continue
+        except ValueError:
+            pass
+        encodings.add(encoding.strip().lower())
+    return encodings
+
+
+class SkippingResponder(IdentityResponder):
+    """Responder leaving the INCOMPRESSIBLE_CONTENT_TYPES untouched."""
+
+    @override
+    async def send_with_compression(self, message: Message) -> None:
+        if message['type'] == 'http.response.start':
+            content_type = Headers(raw=message['headers']).get('content-type', '')
+            await super().send_with_compression(message)
+            self.content_type_is_excluded = content_type.startswith(INCOMPRESSIBLE_CONTENT_TYPES)
+        else:
+            await super().send_with_compression(message)
+
+
+class SkippingGZipResponder(SkippingResponder, GZipResponder):
+    pass
+
+
+if sys.version_info >= (3, 14):
+    from compression import zstd
+
+    class ZstdResponder(SkippingResponder):
+        content_encoding = 'zstd'
+
+        def __init__(self, app: ASGIApp, minimum_size: int, level: int):
+            super().__init__(app, minimum_size)
+            self.level = level
+            self._compressor: zstd.ZstdCompressor | None = None
+
+        @property
+        def compressor(self) -> zstd.ZstdCompressor:
+            if self._compressor is None:
+                self._compressor = zstd.ZstdCompressor(self.level)
+            return self._compressor
+
+        @override
+        async def apply_compression(self, body: bytes, *, more_body: bool) -> bytes:
+            if len(body) >= 128 * 1024:
+                # compressing large chunks inline would block the event loop
+                return await anyio.to_thread.run_sync(self._compress_body, body, more_body)
+            return self._compress_body(body, more_body)
+
+        def _compress_body(self, body: bytes, more_body: bool) -> bytes:
+            # flush every chunk of a streaming response so it is sent right away
+            mode = (
+                zstd.ZstdCompressor.FLUSH_BLOCK if more_body else zstd.ZstdCompressor.FLUSH_FRAME
+            )
+            return self.compressor.compress(body, mode)
+
+
+class CompressionMiddleware:
+    """Compress responses with zstd (Python 3.14+) or gzip depending on Accept-Encoding.
+
+    Bodies smaller than COMPRESSION_MINIMUM_SIZE and INCOMPRESSIBLE_CONTENT_TYPES are sent as is.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        encodings = accepted_encodings(Headers(scope=scope).get('accept-encoding', ''))
+        responder: ASGIApp
+        if sys.version_info >= (3, 14) and 'zstd' in encodings:
+            responder = ZstdResponder(self.app, COMPRESSION_MINIMUM_SIZE, COMPRESSION_ZSTD_LEVEL)
+        elif 'gzip' in encodings:
+            responder = SkippingGZipResponder(
+                self.app, COMPRESSION_MINIMUM_SIZE, compresslevel=COMPRESSION_GZIP_LEVEL
+            )
+        else:
+            responder = SkippingResponder(self.app, COMPRESSION_MINIMUM_SIZE)
+        await responder(scope, receive, send)
+
+
 if PROFILING:
+    import random
+    from collections import defaultdict, deque
+    from html import escape
+
     from pyinstrument import Profiler
+    from pyinstrument.frame import Frame
+    from pyinstrument.renderers import HTMLRenderer
+    from pyinstrument.session import Session
+    from starlette.routing import BaseRoute
+
+    from nanapi.settings import (
+        PROFILING_MAX_RESULTS,
+        PROFILING_ROUTES,
+        PROFILING_SAMPLE_RATE,
+        PROFILING_TOP_FRAMES,
+    )
+
+    class RouteProfile:
+        def __init__(self):
+            self.samples = 0
+            self.duration = 0.0
+            self.frames = defaultdict[str, float](float)
+
+        def add(self, session: Session):
+            self.samples += 1
+            self.duration += session.duration
+            root = session.root_frame()
+            if root is not None:
+                self._add_frame(root)
+
+        def _add_frame(self, frame: Frame):
+            if not frame.is_synthetic and frame.total_self_time > 0:
+                key = f'{frame.function} {frame.file_path_short}:{frame.line_no}'
+                self.frames[key] += frame.total_self_time
+            for child in frame.children:
+                self._add_frame(child)
 
     class ProfilerMiddleware(BaseHTTPMiddleware):
-        """https://pyinstrument.readthedocs.io/en/latest/guide.html#profile-a-web-request-in-fastapi"""
+        """https://pyinstrument.readthedocs.io/en/latest/guide.html#profile-a-web-request-in-fastapi
+
+        Only a PROFILING_SAMPLE_RATE fraction of the requests matching PROFILING_ROUTES
+        (path prefixes, all routes if empty) is profiled. The last PROFILING_MAX_RESULTS
+        sessions are kept and rendered on demand, and the self time of every frame is
+        aggregated per route.
+        """
 
         def __init__(self, *args: Any, fastapi_app: FastAPI | None = None, **kwargs: Any):
             super().__init__(*args, **kwargs)
-            self.results: list[tuple[str, str, str]] = []
+            self.results = deque[tuple[str, str, Session]](maxlen=PROFILING_MAX_RESULTS)
+            self.offset = 0
+            self.routes = defaultdict[str, RouteProfile](RouteProfile)
             if fastapi_app is not None:
                 router = APIRouter(prefix='/profiler', tags=['profiler'])
                 router.add_api_route('/', self.list_results, response_class=HTMLResponse)
+                router.add_api_route('/routes', self.get_routes, response_class=HTMLResponse)
                 router.add_api_route('/{id}', self.get_result, response_class=HTMLResponse)
                 fastapi_app.include_router(router)
 
+        def should_profile(self, request: Request) -> bool:
+            path = request.url.path
+            if path.startswith('/profiler'):
+                return False
+            if PROFILING_ROUTES and not any(path.startswith(r) for r in PROFILING_ROUTES):
+                return False
+            return random.random() < PROFILING_SAMPLE_RATE
+
         @override
         async def dispatch(self, request: Request, call_next: RequestResponseEndpoint):
+            if not self.should_profile(request):
+                return await call_next(request)
+
             profiler = Profiler()
             profiler.start()
             resp = await call_next(request)
-            profiler.stop()
-            self.results.append((request.method, str(request.url), profiler.output_html()))
+            session = profiler.stop()
+
+            route: BaseRoute | None = request.scope.get('route')
+            # key by route template, unmatched urls share one entry to keep the table bounded
+            route_path: str | None = getattr(route, 'path', None)
+            route_methods: set[str] | None = getattr(route, 'methods', None)
+            if route_path is None or (route_methods and request.method not in route_methods):
+                route_key = '<unmatched>'
+            else:
+                route_key = f'{request.method} {route_path}'
+            self.routes[route_key].add(session)
+
+            if len(self.results) == self.results.maxlen:
+                self.offset += 1
+            self.results.append((request.method, str(request.url), session))
             return resp
 
         async def list_results(self):
             li = [
-                f'<li><a href="/profiler/{i}">{method} {url}</a></li>'
+                f'<li><a href="/profiler/{self.offset + i}">{method} {escape(url)}</a></li>'
                 for i, (method, url, _) in enumerate(self.results)
             ]
-            resp = f'<ul>\n{"\n".join(reversed(li))}\n</ul>'
+            resp = f'<a href="/profiler/routes">Routes</a>\n<ul>\n{"\n".join(reversed(li))}\n</ul>'
             return resp
 
+        async def get_routes(self):
+            sections: list[str] = []
+            for route_key, profile in sorted(
+                self.routes.items(), key=lambda kv: kv[1].duration, reverse=True
+            ):
+                rows = [
+                    f'<tr><td>{t:.3f}</td><td>{t / profile.duration:.1%}</td>'
+                    f'<td>{escape(frame)}</td></tr>'
+                    for frame, t in sorted(
+                        profile.frames.items(), key=lambda kv: kv[1], reverse=True
+                    )[:PROFILING_TOP_FRAMES]
+                ]
+                sections.append(
+                    f'<h2>{escape(route_key)}</h2>\n'
+                    f'<p>{profile.samples} samples, '
+                    f'{profile.duration / profile.samples:.3f}s mean</p>\n'
+                    f'<table>\n<tr><th>self (s)</th><th>%</th><th>frame</th></tr>\n'
+                    f'{"\n".join(rows)}\n</table>'
+                )
+            return '\n'.join(sections)
+
         async def get_result(self, id: int):
-            return self.results[id][-1]
+            if not 0 <= id - self.offset < len(self.results):
+                raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+            return HTMLRenderer().render(self.results[id - self.offset][-1])
@@ -3,7 +3,7 @@ import io
 import logging
 import time
 from functools import singledispatch, wraps
-from typing import Callable, ParamSpec, TypedDict, TypeVar
+from typing import Any, Callable, Coroutine, ParamSpec, TypedDict, TypeVar
 
 import aiohttp
 import backoff
@@ -35,6 +35,25 @@ timeout_backoff = backoff.on_exception(
 
 default_backoff = timeout_backoff(conn_backoff(response_backoff))
 
+logger = logging.getLogger(__name__)
+
+# the event loop only keeps weak references to its tasks
+_spawned = set[asyncio.Task[Any]]()
+
+
+def _spawned_done(task: asyncio.Task[Any]):
+    _spawned.discard(task)
+    if not task.cancelled() and (e := task.exception()) is not None:
+        logger.exception(e, exc_info=e)
+
+
+def spawn(coro: Coroutine[Any, Any, Any]) -> asyncio.Task[Any]:
+    """Run the coroutine in the background, logging its exception."""
+    task = asyncio.create_task(coro)
+    _spawned.add(task)
+    task.add_done_callback(_spawned_done)
+    return task
+
 
 class ProducerResponse(TypedDict):
     url: str
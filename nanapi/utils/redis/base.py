@@ -1,5 +1,6 @@
 import logging
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from typing import Any, Generic, TypeVar
 
 import orjson
@@ -7,6 +8,11 @@ from gel import AsyncIOExecutor
 
 from nanapi.database.redis.data_delete_by_key import data_delete_by_key
 from nanapi.database.redis.data_get_by_key import DataGetByKeyResult, data_get_by_key
+from nanapi.database.redis.data_get_by_keys import DataGetByKeysResult, data_get_by_keys
+from nanapi.database.redis.data_insert_default import (
+    DataInsertDefaultResult,
+    data_insert_default,
+)
 from nanapi.database.redis.data_merge import data_merge
 from nanapi.database.redis.data_select_key_ilike import data_select_key_ilike
 from nanapi.settings import INSTANCE_NAME
@@ -28,10 +34,13 @@ class BaseRedis(ABC, Generic[T]):
     def __init__(self, key: str, global_key: bool = False):
         self.key = key if global_key else make_redis_key(key)
 
+    def make_key(self, sub_key: str | int | None = None) -> str:
+        return self.key if sub_key is None else f'{self.key}:{sub_key}'
+
     async def get(
         self, sub_key: str | int | None = None, tx: AsyncIOExecutor | None = None
     ) -> T | None:
-        key = self.key if sub_key is None else f'{self.key}:{sub_key}'
+        key = self.make_key(sub_key)
         try:
             if tx is None:
                 tx = get_edgedb()
@@ -48,7 +57,7 @@ class BaseRedis(ABC, Generic[T]):
         sub_key: str | int | None = None,
         tx: AsyncIOExecutor | None = None,
     ):
-        key = self.key if sub_key is None else f'{self.key}:{sub_key}'
+        key = self.make_key(sub_key)
         encoded_value = self.encode(value)
         try:
             if tx is None:
@@ -59,14 +68,46 @@ class BaseRedis(ABC, Generic[T]):
             logger.exception(e)
             return
 
+    async def set_default(
+        self,
+        value: T,
+        sub_key: str | int | None = None,
+        tx: AsyncIOExecutor | None = None,
+    ) -> T:
+        """Set the value unless one is already stored, and return the stored one."""
+        key = self.make_key(sub_key)
+        if tx is None:
+            tx = get_edgedb()
+
+        resp = await data_insert_default(tx, key=key, value=self.encode(value))
+        return self.decode(resp.value)
+
     async def delete(self, sub_key: str | int | None = None, tx: AsyncIOExecutor | None = None):
-        key = self.key if sub_key is None else f'{self.key}:{sub_key}'
+        key = self.make_key(sub_key)
 
         if tx is None:
             tx = get_edgedb()
 
         await data_delete_by_key(tx, key=key)
 
+    @staticmethod
+    async def get_many(
+        values: Sequence[tuple['BaseRedis[T]', str | int | None]],
+        tx: AsyncIOExecutor | None = None,
+    ) -> list[T | None]:
+        """Get several values, possibly from different BaseRedis, in a single query."""
+        keys = [value.make_key(sub_key) for value, sub_key in values]
+        try:
+            if tx is None:
+                tx = get_edgedb()
+
+            resp = await data_get_by_keys(tx, keys=keys) if keys else []
+        except Exception as e:
+            logger.exception(e)
+            return [None] * len(values)
+        by_key = {item.key: item for item in resp}
+        return [value._decode(by_key.get(key)) for (value, _), key in zip(values, keys)]
+
     async def get_all(self, tx: AsyncIOExecutor | None = None):
         if tx is None:
             tx = get_edgedb()
@@ -79,7 +120,9 @@ class BaseRedis(ABC, Generic[T]):
     @abstractmethod
     def encode(self, value: T) -> str: ...
 
-    def _decode(self, resp: DataGetByKeyResult | None) -> T | None:
+    def _decode(
+        self, resp: DataGetByKeyResult | DataGetByKeysResult | DataInsertDefaultResult | None
+    ) -> T | None:
         if resp is None:
             return None
         return self.decode(resp.value)
@@ -127,7 +170,9 @@ class BooleanValue(_IntegerValueMixin, BaseRedis[bool]):
     def decode(self, value: str) -> bool:
         return bool(super().decode(value))
 
-    def _decode(self, resp: DataGetByKeyResult | None):
+    def _decode(
+        self, resp: DataGetByKeyResult | DataGetByKeysResult | DataInsertDefaultResult | None
+    ):
         if resp is None:
             return self.default
         return super()._decode(resp)
@@ -0,0 +1,45 @@
+import logging
+import os
+import secrets
+import socket
+
+from nanapi.database.redis.data_lease_acquire import data_lease_acquire
+from nanapi.database.redis.data_lease_release import data_lease_release
+from nanapi.utils.clients import get_edgedb
+from nanapi.utils.redis.base import make_redis_key
+
+logger = logging.getLogger(__name__)
+
+
+class Lease:
+    """Lease on a redis::Data key, held by at most one process at a time.
+
+    The holder must renew it with acquire() before ttl seconds have passed, otherwise another
+    process can take it over.
+    """
+
+    def __init__(self, key: str, ttl: float, global_key: bool = False):
+        self.key = key if global_key else make_redis_key(key)
+        self.ttl = ttl
+        self.owner = f'{socket.gethostname()}:{os.getpid()}:{secrets.token_hex(4)}'
+        self.held = False
+
+    async def acquire(self) -> bool:
+        """Acquire the lease, or renew it if already held."""
+        try:
+            self.held = await data_lease_acquire(
+                get_edgedb(), key=self.key, owner=self.owner, ttl=self.ttl
+            )
+        except Exception as e:
+            logger.exception(e)
+            self.held = False
+        return self.held
+
+    async def release(self):
+        """Release the lease if held, it otherwise expires after ttl seconds."""
+        if self.held:
+            self.held = False
+            try:
+                await data_lease_release(get_edgedb(), key=self.key, owner=self.owner)
+            except Exception as e:
+                logger.exception(e)
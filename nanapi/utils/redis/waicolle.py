@@ -1,6 +1,7 @@
-from nanapi.utils.redis.base import BooleanValue, StringValue
+from nanapi.utils.redis.base import BooleanValue, IntegerValue, StringValue
 
 daily_tag = StringValue('waifu_daily_tag')
 user_daily_roll = BooleanValue('waifu_player_daily_roll', default=False)
 weekly_season = StringValue('waifu_weekly_season')
 user_weekly_roll = BooleanValue('waifu_player_weekly_roll', default=False)
+pool_generation = IntegerValue('waifu_pool_generation')
@@ -1,9 +1,15 @@
+import asyncio
+import hashlib
+import hmac
+import math
 import secrets
+import time
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
 import bcrypt
 import jwt
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBasic, HTTPBasicCredentials, OAuth2PasswordBearer
 from pydantic import BaseModel
@@ -13,6 +19,8 @@ from nanapi.database.default.client_get_by_username import (
     client_get_by_username,
 )
 from nanapi.settings import (
+    AUTH_CACHE_MAXSIZE,
+    AUTH_CACHE_TTL,
     JAPAN7_BASIC_AUTH_PASSWORD,
     JAPAN7_BASIC_AUTH_USERNAME,
     JWT_ALGORITHM,
@@ -51,12 +59,40 @@ OAUTH2_BEARER_AUTH = OAuth2PasswordBearer(tokenUrl='clients/token', auto_error=F
 HTTP_BASIC_AUTH = HTTPBasic(auto_error=False)
 
 
+# Verified credentials, decoded tokens and clients are kept for AUTH_CACHE_TTL seconds so
+# that authenticated requests cost neither a bcrypt check nor a database round-trip.
+# Credentials are keyed by an HMAC of the password with a per-process secret.
+# Entries are per worker and only expire: clients are never updated, and unknown usernames are
+# not cached so a new client can log in right away. A change made to a client in the database
+# is seen by every worker after at most AUTH_CACHE_TTL seconds.
+_CREDENTIALS_KEY = secrets.token_bytes(32)
+_clients_cache = TTLCache[str, ClientGetByUsernameResult](AUTH_CACHE_MAXSIZE, ttl=AUTH_CACHE_TTL)
+_credentials_cache = TTLCache[tuple[str, bytes], ClientGetByUsernameResult](
+    AUTH_CACHE_MAXSIZE, ttl=AUTH_CACHE_TTL
+)
+_tokens_cache = TTLCache[str, tuple[str, float]](AUTH_CACHE_MAXSIZE, ttl=AUTH_CACHE_TTL)
+
+
+async def get_client_by_username(username: str) -> ClientGetByUsernameResult | None:
+    client = _clients_cache.get(username)
+    if client is None:
+        client = await client_get_by_username(get_edgedb(), username=username)
+        if client is not None:
+            _clients_cache[username] = client
+    return client
+
+
 async def authenticate_client(username: str, password: str) -> ClientGetByUsernameResult | None:
-    client = await client_get_by_username(get_edgedb(), username=username)
+    key = (username, hmac.digest(_CREDENTIALS_KEY, password.encode(), hashlib.sha256))
+    client = _credentials_cache.get(key)
+    if client is not None:
+        return client
+    client = await get_client_by_username(username)
     if not client:
         return None
-    if not verify_password(password, client.password_hash):
+    if not await asyncio.to_thread(verify_password, password, client.password_hash):
         return None
+    _credentials_cache[key] = client
     return client
 
 
@@ -74,3 +110,20 @@ def create_access_token(data: dict[str, Any], expires_delta: timedelta | None =
     to_encode.update(dict(exp=expire))
     encoded_jwt = jwt.encode(to_encode, JWT_SECRET_KEY, algorithm=JWT_ALGORITHM)  # pyright: ignore[reportUnknownMemberType]
     return encoded_jwt
+
+
+def decode_access_token(token: str) -> str | None:
+    cached = _tokens_cache.get(token)
+    if cached is not None:
+        username, expire = cached
+        if expire > time.time():
+            return username
+    try:
+        payload = jwt.decode(token, JWT_SECRET_KEY, algorithms=[JWT_ALGORITHM])  # pyright: ignore[reportUnknownMemberType]
+    except jwt.PyJWTError:
+        return None
+    username: str | None = payload.get('sub', None)
+    if username is None:
+        return None
+    _tokens_cache[token] = (username, payload.get('exp', math.inf))
+    return username
@@ -2,18 +2,20 @@ import abc
 import asyncio
 import logging
 import re
-from contextlib import suppress
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta
 from functools import partial
-from itertools import product
-from typing import Any, Callable, Coroutine, Self, cast
+from typing import Any, Callable, Coroutine, Hashable, Iterable, Self, Sequence, cast
+from uuid import UUID
 
 import numpy as np
 import numpy.typing as npt
 from asyncache import cached
-from cachetools import TTLCache
+from cachetools import LRUCache, TTLCache
 from cachetools.keys import hashkey
-from gel import AsyncIOExecutor
+from gel import AsyncIOClient, AsyncIOExecutor
 
 from nanapi.database.anilist.anime_select_ids_upcoming import anime_select_ids_upcoming
 from nanapi.database.anilist.c_edge_select_filter_media import (
@@ -29,15 +31,26 @@ from nanapi.database.anilist.media_select_ids_by_season import (
 )
 from nanapi.database.anilist.media_select_ids_by_tag import media_select_ids_by_tag
 from nanapi.database.anilist.media_select_top_h import media_select_top_h
-from nanapi.database.anilist.tag_select import tag_select
 from nanapi.database.waicolle.medias_pool import MediasPoolResult, medias_pool
+from nanapi.database.waicolle.player_select_by_collection import player_select_by_collection
+from nanapi.database.waicolle.season_pool_ranks import season_pool_ranks
+from nanapi.database.waicolle.tag_pool_ranks import tag_pool_ranks
 from nanapi.database.waicolle.user_pool import UserPoolResult, user_pool
+from nanapi.database.waicolle.waifu_ascend_candidates import WaifuAscendCandidatesResultElements
 from nanapi.database.waicolle.waifu_edged import WaifuEdgedResultElements
 from nanapi.database.waicolle.waifu_select_by_user import WaifuSelectByUserResult
 from nanapi.models.waicolle import RANKS, A, B, C, D, E, Rank, S
 from nanapi.settings import TZ
+from nanapi.utils.cache import shared_cache, shared_cached, single_flight
 from nanapi.utils.clients import get_edgedb
-from nanapi.utils.redis.waicolle import daily_tag, user_daily_roll, user_weekly_roll, weekly_season
+from nanapi.utils.redis.base import BaseRedis, BooleanValue
+from nanapi.utils.redis.waicolle import (
+    daily_tag,
+    pool_generation,
+    user_daily_roll,
+    user_weekly_roll,
+    weekly_season,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -50,6 +63,37 @@ CHARA_TYPES = (
 
 RNG = np.random.default_rng()
 
+
+class AliasSampler:
+    """Weighted sampling with replacement using Vose's alias method.
+
+    Building the tables is O(n), then each draw is O(1) instead of the O(n) checks and
+    cumulative sum done by Generator.choice on every call.
+    """
+
+    def __init__(self, items: npt.NDArray[np.int32], probas: npt.NDArray[np.float64]):
+        n = len(items)
+        scaled = (probas * n / probas.sum()).tolist()
+        prob = [1.0] * n
+        alias = list(range(n))
+        small = [i for i, p in enumerate(scaled) if p < 1]
+        large = [i for i, p in enumerate(scaled) if p >= 1]
+        while small and large:
+            s, l = small.pop(), large.pop()
+            prob[s] = scaled[s]
+            alias[s] = l
+            scaled[l] += scaled[s] - 1
+            (small if scaled[l] < 1 else large).append(l)
+        # leftovers are 1 up to rounding errors
+        self.items = items
+        self.prob = np.array(prob)
+        self.alias = np.array(alias, dtype=np.intp)
+
+    def sample(self, rng: np.random.Generator, size: int) -> npt.NDArray[np.int32]:
+        i = rng.integers(len(self.items), size=size)
+        return self.items[np.where(rng.random(size) < self.prob[i], i, self.alias[i])]
+
+
 RE_SYMBOLES = re.compile(r'[^a-zA-Z\d]+')
 
 RATES = {S: 5, A: 15, B: 25, C: 30, D: 20, E: 5}
@@ -64,6 +108,162 @@ REROLLS_MAX_RANKS = {
 }
 
 
+RANKS_BY_TIER = {rank.tier: rank for rank in RANKS.values()}
+
+
+@dataclass(slots=True)
+class CharaPool:
+    """Characters of a pool as compact arrays: AniList ids and the tier of their rank.
+
+    The alias samplers of the rolls are built with the pool and cached along with it, by the
+    tiers of their rank range.
+    """
+
+    ids: npt.NDArray[np.int32]
+    tiers: npt.NDArray[np.int8]
+    samplers: dict[tuple[int, int], AliasSampler] = field(
+        default_factory=dict[tuple[int, int], AliasSampler]
+    )
+
+    @classmethod
+    def from_groups(cls, pool: list[UserPoolResult] | list[MediasPoolResult]) -> Self:
+        ids: list[npt.NDArray[np.int32]] = []
+        tiers: list[npt.NDArray[np.int8]] = []
+        for group in pool:
+            group_ids = np.unique(np.array([el.id_al for el in group.elements], dtype=np.int32))
+            ids.append(group_ids)
+            tiers.append(np.full(len(group_ids), RANKS[group.key.rank].tier, dtype=np.int8))
+        if not ids:
+            return cls(np.empty(0, dtype=np.int32), np.empty(0, dtype=np.int8))
+        return cls(np.concatenate(ids), np.concatenate(tiers))
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @property
+    def ranks(self) -> list[Rank]:
+        return [RANKS_BY_TIER[int(tier)] for tier in np.unique(self.tiers)]
+
+    def probas(
+        self, rates: dict[Rank, int], min_rank: Rank, max_rank: Rank
+    ) -> tuple[npt.NDArray[np.int32], npt.NDArray[np.float64]]:
+        """Characters between min_rank and max_rank and their probability.
+
+        Each rank gets its share of the rates, split evenly between its characters.
+        """
+        mask = (self.tiers >= max_rank.tier) & (self.tiers <= min_rank.tier)
+        ids, tiers = self.ids[mask], self.tiers[mask]
+        rates_by_tier = np.zeros(max(RANKS_BY_TIER) + 1)
+        for rank, rate in rates.items():
+            rates_by_tier[rank.tier] = rate
+        counts = np.bincount(tiers, minlength=len(rates_by_tier))
+        probas = rates_by_tier[tiers] / counts[tiers]
+        return ids, probas / probas.sum()
+
+    def sampler(
+        self, min_rank: Rank, max_rank: Rank, common: 'CharaPool | None' = None
+    ) -> AliasSampler:
+        """Sampler of the characters between min_rank and max_rank, built once per pool.
+
+        If common is given and the characters of the pool are too few for the rates, the
+        characters of common are mixed in.
+        """
+        key = min_rank.tier, max_rank.tier
+        if (sampler := self.samplers.get(key)) is None:
+            ids, probas = self.probas(RATES, min_rank, max_rank)
+            if common is not None:
+                ids, probas = mix_pools(ids, probas, common, min_rank, max_rank)
+            sampler = self.samplers[key] = AliasSampler(ids, probas)
+        return sampler
+
+
+def mix_pools(
+    ids: npt.NDArray[np.int32],
+    probas: npt.NDArray[np.float64],
+    common: CharaPool,
+    min_rank: Rank,
+    max_rank: Rank,
+) -> tuple[npt.NDArray[np.int32], npt.NDArray[np.float64]]:
+    """Mix the common pool in if a character has more than a 1/200 chance per ticket."""
+    tot_tickets = sum(tickets for tickets in RATES.values())
+    tickets = sum(
+        tickets for rank, tickets in RATES.items() if rank >= min_rank and rank <= max_rank
+    )
+    MIN_RATE = tot_tickets / (200 * tickets)
+
+    if len(ids) > 0 and float(np.max(probas)) <= MIN_RATE:
+        return ids, probas
+
+    common_ids, common_probas = common.probas(RATES, min_rank, max_rank)
+    if len(ids) == 0:
+        factor = 0
+    else:
+        factor = MIN_RATE / float(np.max(probas))
+    logger.info(f'pool factor: {factor} (min rate: {MIN_RATE})')
+    return (
+        np.concatenate((ids, common_ids)),
+        np.concatenate((probas * factor, common_probas * (1 - factor))),
+    )
+
+
+def pool_eligible(counts: dict[Rank, int], rates: dict[Rank, int]) -> bool:
+    """Whether a pool with counts characters per rank is fit for a daily or weekly roll.
+
+    It needs more than 400 characters, none of them having more than a 1/50 chance to be rolled.
+    """
+    counts = {rank: count for rank, count in counts.items() if count > 0}
+    if sum(counts.values()) <= 400:
+        return False
+    tickets = sum(rates[rank] for rank in counts)
+    max_proba = max(rates[rank] / count for rank, count in counts.items()) / tickets
+    return 1 / max_proba > 50
+
+
+#########
+# Pools #
+#########
+# pools are cached with their player's generation in the key, so that they go stale in every
+# worker as soon as invalidate_pools bumps it
+POOL_TTL = timedelta(days=1).total_seconds()
+
+
+async def get_pool_generation(executor: AsyncIOExecutor, discord_id: str | None) -> int | None:
+    if discord_id is None:
+        return None
+    return await pool_generation.get(discord_id, tx=executor)
+
+
+def get_pool_edgedb(client_id: UUID | None) -> AsyncIOClient:
+    # cached pools are shared by concurrent callers, they do not run on the executor of one
+    if client_id is None:
+        return get_edgedb()
+    client = get_edgedb().with_globals(client_id=client_id)  # pyright: ignore[reportUnknownMemberType]
+    return cast(AsyncIOClient, client)
+
+
+def _pool_key(cls: type, **kwargs: Any) -> Hashable:
+    # the pool functions only take keyword arguments
+    return hashkey(**kwargs)
+
+
+async def invalidate_pools(*discord_ids: str):
+    """Invalidate the cached pools of players.
+
+    To be called whenever what their pools are made of changes: tracked items or collections,
+    game mode or AniList entries.
+    """
+    generation = time.time_ns()
+    await asyncio.gather(
+        *(pool_generation.set(generation, sub_key=discord_id) for discord_id in discord_ids)
+    )
+
+
+async def invalidate_collection_pools(executor: AsyncIOExecutor, id: UUID):
+    """Invalidate the cached pools of the players tracking a collection."""
+    players = await player_select_by_collection(executor, id=id)
+    await invalidate_pools(*(player.user.discord_id for player in players))
+
+
 ########
 # Roll #
 ########
@@ -86,48 +286,43 @@ class BaseRoll(abc.ABC):
         return name
 
     async def get_price(self, executor: AsyncIOExecutor, discord_id: str) -> int:
-        return self.price
+        (price,) = await get_prices(executor, [self], discord_id)
+        return price
+
+    def first_roll_flag(self, discord_id: str) -> tuple[BooleanValue, str] | None:
+        """Redis flag and sub key set by after(), if the first roll is discounted."""
+        return None
 
     @abc.abstractmethod
     async def load(self, executor: AsyncIOExecutor, force: bool = False):
         if force or not self.loaded.is_set():
             self.loaded.set()
 
-    async def roll(self, executor: AsyncIOExecutor, pool_discord_id: str) -> list[int]:
+    async def roll(
+        self, pool_discord_id: str, client_id: UUID, generation: int | None
+    ) -> list[int]:
+        """Roll from the pool of pool_discord_id at the generation read by get_roll_price."""
         await self.loaded.wait()
-        charas, probas = await self._roll(executor, pool_discord_id)
-        chousen = RNG.choice(charas, size=self.nb, p=probas)
+        sampler = await self._sampler(pool_discord_id, client_id, generation)
+        chousen = sampler.sample(RNG, self.nb)
         return [int(i) for i in chousen]
 
+    @classmethod
+    def rank_spans(cls) -> set[tuple[Rank, Rank]]:
+        """Rank ranges of the rolls of this class, their samplers are built with the pools."""
+        # the rolls made on demand (drops, coupons, daily and weekly) have the full range
+        spans = {(E, S)}
+        for roll in ROLLS.values():
+            if isinstance(roll, cls):
+                spans.add((roll.min_rank, roll.max_rank))
+        return spans
+
     @abc.abstractmethod
-    async def _roll(
-        self, executor: AsyncIOExecutor, pool_discord_id: str
-    ) -> tuple[npt.NDArray[np.int_], npt.NDArray[np.float64]]:
+    async def _sampler(
+        self, pool_discord_id: str, client_id: UUID, generation: int | None
+    ) -> AliasSampler:
         pass
 
-    async def _charas_probas_from_pool(
-        self, pool: list[UserPoolResult] | list[MediasPoolResult]
-    ) -> tuple[npt.NDArray[np.int_], npt.NDArray[np.float64]]:
-        charas_ids = {
-            RANKS[group.key.rank]: set(el.id_al for el in group.elements)
-            for group in pool
-            if (RANKS[group.key.rank] >= self.min_rank and RANKS[group.key.rank] <= self.max_rank)
-        }
-
-        chara_pool = np.full((sum(len(v) for v in charas_ids.values()),), 0)
-        probas = np.zeros((len(chara_pool),))
-
-        i = 0
-        for rank, clist in charas_ids.items():
-            for c in clist:
-                chara_pool[i] = c
-                probas[i] = self.RATES[rank] / len(charas_ids[rank])
-                i += 1
-
-        probas = probas / probas.sum()
-
-        return chara_pool[:i], probas[:i]
-
     @abc.abstractmethod
     async def after(self, executor: AsyncIOExecutor, discord_id: str):
         pass
@@ -145,46 +340,52 @@ class UserRoll(BaseRoll):
     async def load(self, executor: AsyncIOExecutor, force: bool = False):
         await super().load(executor, force=force)
 
-    async def _roll(
-        self, executor: AsyncIOExecutor, pool_discord_id: str
-    ) -> tuple[npt.NDArray[np.int_], npt.NDArray[np.float64]]:
-        pool = await self._cached_user_pool(executor, discord_id=pool_discord_id)
-        charas, probas = await self._charas_probas_from_pool(pool)
-
-        tot_tickets = sum(tickets for tickets in self.RATES.values())
-        tickets = sum(
-            tickets
-            for rank, tickets in self.RATES.items()
-            if rank >= self.min_rank and rank <= self.max_rank
+    async def _sampler(
+        self, pool_discord_id: str, client_id: UUID, generation: int | None
+    ) -> AliasSampler:
+        pool = await self._cached_user_pool(
+            discord_id=pool_discord_id, client_id=client_id, generation=generation
         )
-        MIN_RATE = tot_tickets / (200 * tickets)
-
-        if len(charas) == 0 or float(np.max(probas)) > MIN_RATE:
-            common_pool = await self._cached_user_pool(executor)
-            common_charas, common_probas = await self._charas_probas_from_pool(common_pool)
-
-            if len(charas) == 0:
-                factor = 0
-            else:
-                factor = MIN_RATE / float(np.max(probas))
-
-            logger.info(f'{pool_discord_id} pool factor: {factor} (min rate: {MIN_RATE})')
-            charas = np.append(charas, common_charas)
-            probas = np.append(probas * factor, common_probas * (1 - factor))
-
-        return charas, probas
+        if (self.min_rank.tier, self.max_rank.tier) in pool.samplers:
+            return pool.sampler(self.min_rank, self.max_rank)
+        common_pool = await self._cached_user_pool(
+            discord_id=None, client_id=None, generation=None
+        )
+        return pool.sampler(self.min_rank, self.max_rank, common_pool)
 
     @classmethod
-    @cached(
-        cache=TTLCache(1024, ttl=timedelta(hours=6).seconds),
-        key=lambda *args, **kwargs: hashkey(kwargs.get('discord_id', None)),
+    @shared_cached(
+        shared_cache(
+            'user_chara_pool',
+            256 * 2**20,
+            TTLCache[Hashable, Any](1024, ttl=POOL_TTL),
+            ttl=POOL_TTL,
+            tiered=True,
+        ),
+        key=_pool_key,
     )
-    async def _cached_user_pool(cls, executor: AsyncIOExecutor, *, discord_id: str | None = None):
-        res = await user_pool(executor, discord_id=discord_id)
+    @single_flight(key=_pool_key)
+    async def _cached_user_pool(
+        cls,
+        *,
+        discord_id: str | None = None,
+        client_id: UUID | None = None,
+        generation: int | None = None,
+    ) -> CharaPool:
+        res = await user_pool(get_pool_edgedb(client_id), discord_id=discord_id)
         if len(res) == 0:
             # do not cache empty user pool
             raise EmptyPoolException()
-        return res
+        pool = CharaPool.from_groups(res)
+        # small player pools are mixed with the common one
+        common_pool = None
+        if discord_id is not None:
+            common_pool = await cls._cached_user_pool(
+                discord_id=None, client_id=None, generation=None
+            )
+        for min_rank, max_rank in UserRoll.rank_spans():
+            pool.sampler(min_rank, max_rank, common_pool)
+        return pool
 
     async def after(self, executor: AsyncIOExecutor, discord_id: str):
         pass
@@ -202,41 +403,68 @@ class BaseMediaRoll(BaseRoll, metaclass=abc.ABCMeta):
         super().__init__(nb, price, min_rank, max_rank)
         self.genred = genred
         self.ids_al: list[int] | None = None
+        # highest and lowest ranks of the pool, for the rolls naming them
+        self.rank_span = E, S
 
-    async def _roll(
-        self, executor: AsyncIOExecutor, pool_discord_id: str | None = None
-    ) -> tuple[npt.NDArray[np.int_], npt.NDArray[np.float64]]:
-        pool = await self.get_pool(executor, pool_discord_id)
-        return await self._charas_probas_from_pool(pool)
+    async def _sampler(
+        self, pool_discord_id: str, client_id: UUID, generation: int | None
+    ) -> AliasSampler:
+        pool = await self.get_pool(pool_discord_id, client_id, generation)
+        return pool.sampler(self.min_rank, self.max_rank)
 
     async def get_pool(
-        self, executor: AsyncIOExecutor, discord_id: str | None = None
-    ) -> list[MediasPoolResult]:
+        self,
+        discord_id: str | None = None,
+        client_id: UUID | None = None,
+        generation: int | None = None,
+    ) -> CharaPool:
         assert self.ids_al is not None
         ids_al = tuple(sorted(self.ids_al))
+        if not self.genred or discord_id is None:
+            # the player only matters to filter the pool by game mode
+            discord_id = client_id = generation = None
         pool = await self._cached_medias_pool(
-            executor, ids_al=ids_al, discord_id=discord_id, genred=self.genred
+            ids_al=ids_al,
+            discord_id=discord_id,
+            client_id=client_id,
+            genred=self.genred,
+            generation=generation,
         )
         return pool
 
+    async def load_rank_span(self):
+        pool = await self.get_pool()
+        ranks = pool.ranks
+        self.rank_span = max(ranks, default=E), min(ranks, default=S)
+
     @classmethod
-    @cached(
-        cache=TTLCache(1024, ttl=timedelta(days=1).seconds),
-        key=lambda *args, **kwargs: hashkey(
-            kwargs.get('ids_al', None), kwargs.get('discord_id', None), kwargs.get('genred', None)
+    @shared_cached(
+        shared_cache(
+            'medias_chara_pool',
+            256 * 2**20,
+            TTLCache[Hashable, Any](1024, ttl=POOL_TTL),
+            ttl=POOL_TTL,
+            tiered=True,
         ),
+        key=_pool_key,
     )
+    @single_flight(key=_pool_key)
     async def _cached_medias_pool(
         cls,
-        executor: AsyncIOExecutor,
         *,
         ids_al: tuple[int, ...],
         discord_id: str | None = None,
+        client_id: UUID | None = None,
         genred: bool | None = None,
-    ):
-        return await medias_pool(
-            executor, ids_al=list(ids_al), discord_id=discord_id, genred=genred
+        generation: int | None = None,
+    ) -> CharaPool:
+        res = await medias_pool(
+            get_pool_edgedb(client_id), ids_al=list(ids_al), discord_id=discord_id, genred=genred
         )
+        pool = CharaPool.from_groups(res)
+        for min_rank, max_rank in BaseMediaRoll.rank_spans():
+            pool.sampler(min_rank, max_rank)
+        return pool
 
 
 class UpcomingRoll(BaseMediaRoll):
@@ -277,9 +505,15 @@ def get_current_date() -> date:
     return date(current_time.year, current_time.month, current_time.day)
 
 
+def _roll_date_key(cls: type, *args: Hashable, **kwargs: Hashable) -> Hashable:
+    # the date or week of the roll, passed by position or by name
+    return hashkey(*args, *kwargs.values())
+
+
 class TagRoll(BaseMediaRoll):
     DAILY_BASE_PRICE = 150
     DAILY_NB = 1
+    MIN_TAG_RANK = 60
     daily_rolls: dict[str, Self] = {}
 
     def __init__(
@@ -294,53 +528,42 @@ class TagRoll(BaseMediaRoll):
         self.tag = tag
 
     async def get_name(self, executor: AsyncIOExecutor, discord_id: str) -> str:
-        pool = await self.get_pool(executor, discord_id)
-
-        min_rank = S
-        max_rank = E
-        for group in pool:
-            rank = RANKS[group.key.rank]
-            if group.elements:
-                if rank < min_rank:
-                    min_rank = rank
-                if rank > max_rank:
-                    max_rank = rank
+        max_rank, min_rank = self.rank_span
 
         return f'{self.nb} {max_rank}-{min_rank} (all), Daily tag — {self.tag}'
 
-    async def get_price(self, executor: AsyncIOExecutor, discord_id: str) -> int:
-        price = await super().get_price(executor, discord_id)
-
-        # discount on first roll
-        redis_player_key = f'{discord_id}_{get_current_date()}'
-        if not await user_daily_roll.get(redis_player_key, tx=executor):
-            price //= 2
-
-        return price
+    def first_roll_flag(self, discord_id: str) -> tuple[BooleanValue, str]:
+        return user_daily_roll, f'{discord_id}_{get_current_date()}'
 
     async def load(self, executor: AsyncIOExecutor, force: bool = False):
         if force or not self.loaded.is_set():
-            resp = await media_select_ids_by_tag(executor, tag_name=self.tag, min_rank=60)
+            resp = await media_select_ids_by_tag(
+                executor, tag_name=self.tag, min_rank=self.MIN_TAG_RANK
+            )
             self.ids_al = [media.id_al for media in resp]
+            await self.load_rank_span()
             cls = self.__class__
             cls.daily_rolls[self.tag] = self
             self.loaded.set()
 
     async def after(self, executor: AsyncIOExecutor, discord_id: str):
-        redis_player_key = f'{discord_id}_{get_current_date()}'
-        await user_daily_roll.set(True, sub_key=redis_player_key)
+        flag, sub_key = self.first_roll_flag(discord_id)
+        await flag.set(True, sub_key=sub_key)
 
     @classmethod
     async def get_daily(cls) -> 'TagRoll':
         today = get_current_date()
         tomorrow = today + timedelta(days=1)
 
-        asyncio.create_task(cls.get_daily_tag(get_edgedb(), tag_date=tomorrow))
+        asyncio.create_task(cls.get_daily_tag(tomorrow))
 
-        return await cls.get_daily_tag(get_edgedb(), tag_date=today)
+        return await cls.get_daily_tag(today)
 
     @classmethod
-    async def get_daily_tag(cls, executor: AsyncIOExecutor, tag_date: date) -> 'TagRoll':
+    @cached(LRUCache(4), key=_roll_date_key)
+    @single_flight(key=_roll_date_key)
+    async def get_daily_tag(cls, tag_date: date) -> 'TagRoll':
+        executor = get_edgedb()
         create_roll = partial(cls, nb=cls.DAILY_NB, price=cls.DAILY_BASE_PRICE)
         tag = await daily_tag.get(str(tag_date))
 
@@ -352,22 +575,25 @@ class TagRoll(BaseMediaRoll):
         yesterday = tag_date - timedelta(days=1)
         yesterday_tag = await daily_tag.get(str(yesterday))
 
-        resp = await tag_select(executor)
-        tags = [tag.name for tag in resp]
-        if yesterday_tag:
-            with suppress(ValueError):
-                tags.remove(yesterday_tag)
-        RNG.shuffle(tags)
+        # rank histograms of every tag pool, only the chosen one is loaded
+        resp = await tag_pool_ranks(executor, min_rank=cls.MIN_TAG_RANK)
+        counts = defaultdict[str, dict[Rank, int]](dict)
+        for group in resp:
+            counts[group.tag_name][RANKS[group.rank]] = group.count
 
-        for tag in tags:
-            roll = create_roll(tag=tag)
-            await roll.load(executor, force=True)
-            _, rates = await roll._roll(executor)
-            if len(rates) > 400 and (1 / float(np.max(rates))) > 50:
-                await daily_tag.set(tag, sub_key=str(tag_date))
-                return roll
+        tags = [
+            tag
+            for tag, tag_counts in counts.items()
+            if tag != yesterday_tag and pool_eligible(tag_counts, cls.RATES)
+        ]
+        if not tags:
+            raise RuntimeError('Could not find daily roll tag')
 
-        raise RuntimeError('Could not find daily roll tag')
+        # another worker may have picked one meanwhile, the first stored wins
+        tag = await daily_tag.set_default(tags[RNG.integers(len(tags))], sub_key=str(tag_date))
+        roll = cls.daily_rolls.get(tag, create_roll(tag=tag))
+        await roll.load(executor, force=True)
+        return roll
 
 
 class SeasonalRoll(BaseMediaRoll):
@@ -391,33 +617,16 @@ class SeasonalRoll(BaseMediaRoll):
         self.season: MEDIA_SELECT_IDS_BY_SEASON_SEASON = season
 
     async def get_name(self, executor: AsyncIOExecutor, discord_id: str) -> str:
-        pool = await self.get_pool(executor, discord_id)
-
-        min_rank = S
-        max_rank = E
-        for group in pool:
-            rank = RANKS[group.key.rank]
-            if group.elements:
-                if rank < min_rank:
-                    min_rank = rank
-                if rank > max_rank:
-                    max_rank = rank
+        max_rank, min_rank = self.rank_span
 
         return (
             f'{self.nb} {max_rank}-{min_rank}, '
             f'Weekly Seasonal — {self.season.capitalize()} {self.season_year}'
         )
 
-    async def get_price(self, executor: AsyncIOExecutor, discord_id: str) -> int:
-        price = await super().get_price(executor, discord_id)
-
-        # discount on first roll
+    def first_roll_flag(self, discord_id: str) -> tuple[BooleanValue, str]:
         curr_date = get_current_date().isocalendar()
-        redis_player_key = f'{discord_id}_{(curr_date.year, curr_date.week)}'
-        if not await user_weekly_roll.get(redis_player_key, tx=executor):
-            price //= 2
-
-        return price
+        return user_weekly_roll, f'{discord_id}_{(curr_date.year, curr_date.week)}'
 
     async def load(self, executor: AsyncIOExecutor, force: bool = False) -> None:
         if force or not self.loaded.is_set():
@@ -427,14 +636,14 @@ class SeasonalRoll(BaseMediaRoll):
                 season=self.season,
             )
             self.ids_al = [media.id_al for media in resp]
+            await self.load_rank_span()
             cls = self.__class__
             cls.weekly_rolls[self.season_year, self.season] = self
             self.loaded.set()
 
     async def after(self, executor: AsyncIOExecutor, discord_id: str):
-        curr_date = get_current_date().isocalendar()
-        redis_player_key = f'{discord_id}_{(curr_date.year, curr_date.week)}'
-        await user_weekly_roll.set(True, sub_key=redis_player_key)
+        flag, sub_key = self.first_roll_flag(discord_id)
+        await flag.set(True, sub_key=sub_key)
 
     @classmethod
     async def get_weekly(cls) -> 'SeasonalRoll':
@@ -446,14 +655,15 @@ class SeasonalRoll(BaseMediaRoll):
         next_week_iso = next_week.isocalendar()
         next_week_key = next_week.year, next_week_iso.week
 
-        asyncio.create_task(cls.get_weekly_season(get_edgedb(), week_key=next_week_key))
+        asyncio.create_task(cls.get_weekly_season(next_week_key))
 
-        return await cls.get_weekly_season(get_edgedb(), week_key)
+        return await cls.get_weekly_season(week_key)
 
     @classmethod
-    async def get_weekly_season(
-        cls, executor: AsyncIOExecutor, week_key: tuple[int, int]
-    ) -> 'SeasonalRoll':
+    @cached(LRUCache(4), key=_roll_date_key)
+    @single_flight(key=_roll_date_key)
+    async def get_weekly_season(cls, week_key: tuple[int, int]) -> 'SeasonalRoll':
+        executor = get_edgedb()
         create_roll = partial(cls, nb=cls.WEEKLY_NB, price=cls.WEEKLY_BASE_PRICE)
         saved = await weekly_season.get(str(week_key))
         if saved:
@@ -469,34 +679,40 @@ class SeasonalRoll(BaseMediaRoll):
         last_week_key = (roll_year, roll_week - 1) if roll_week > 1 else (roll_year - 1, 52)
         last_week_season_saved = await weekly_season.get(str(last_week_key))
 
-        # boomer and zoomer enough ig
-        current_year = datetime.now().year
-        seasons = cast(
-            list[tuple[int, MEDIA_SELECT_IDS_BY_SEASON_SEASON]],
-            list(product(range(1990, current_year + 1), ['WINTER', 'SPRING', 'SUMMER', 'FALL'])),
-        )
-
+        last_week_season = None
         if last_week_season_saved:
-            last_week_year, last_week_season = last_week_season_saved.split('_')
-            with suppress(ValueError):
-                seasons.remove(
-                    (
-                        int(last_week_year),
-                        cast(MEDIA_SELECT_IDS_BY_SEASON_SEASON, last_week_season),
-                    )
-                )
-
-        RNG.shuffle(seasons)
-
-        for year_str, season_str in seasons:
-            roll = create_roll(season_year=year_str, season=season_str)
-            await roll.load(executor, force=True)
-            _, rates = await roll._roll(executor)
-            if len(rates) > 400 and (1 / float(np.max(rates))) > 50:
-                await weekly_season.set(f'{year_str}_{season_str}', sub_key=str(week_key))
-                return roll
+            last_week_year, last_week_season_str = last_week_season_saved.split('_')
+            last_week_season = int(last_week_year), last_week_season_str
+
+        # rank histograms of every season pool, only the chosen one is loaded
+        resp = await season_pool_ranks(executor)
+        counts = defaultdict[tuple[int, MEDIA_SELECT_IDS_BY_SEASON_SEASON], dict[Rank, int]](dict)
+        for group in resp:
+            if group.season_year is None or group.season is None:
+                continue
+            key = group.season_year, group.season.value
+            counts[key][RANKS[group.rank]] = group.count
 
-        raise RuntimeError('Could not find weekly roll season')
+        # boomer and zoomer enough ig
+        current_year = datetime.now().year
+        seasons = [
+            key
+            for key, season_counts in counts.items()
+            if 1990 <= key[0] <= current_year
+            and key != last_week_season
+            and pool_eligible(season_counts, cls.RATES)
+        ]
+        if not seasons:
+            raise RuntimeError('Could not find weekly roll season')
+
+        # another worker may have picked one meanwhile, the first stored wins
+        year, season = seasons[RNG.integers(len(seasons))]
+        saved = await weekly_season.set_default(f'{year}_{season}', sub_key=str(week_key))
+        year_str, season_str = saved.split('_')
+        year, season = int(year_str), cast(MEDIA_SELECT_IDS_BY_SEASON_SEASON, season_str)
+        roll = cls.weekly_rolls.get((year, season), create_roll(season_year=year, season=season))
+        await roll.load(executor, force=True)
+        return roll
 
 
 ROLLS: dict[str, Callable[[], Coroutine[None, None, BaseRoll]]] = {
@@ -522,6 +738,87 @@ async def get_roll(roll_id: str) -> BaseRoll | None:
 
 
 async def load_rolls():
-    rolls = {roll_id: await roll_getter() for roll_id, roll_getter in ROLLS.items()}
+    rolls = dict(zip(ROLLS, await asyncio.gather(*[getter() for getter in ROLLS.values()])))
     await asyncio.gather(*[roll.load(get_edgedb()) for roll in rolls.values()])
     return rolls
+
+
+async def get_roll_price(
+    executor: AsyncIOExecutor, roll: BaseRoll, discord_id: str, pool_discord_id: str
+) -> tuple[int, int | None]:
+    """Price of a roll for a player and generation of the pool it rolls from, in one query."""
+    values: list[tuple[BaseRedis[Any], str | int | None]] = [(pool_generation, pool_discord_id)]
+    if (flag := roll.first_roll_flag(discord_id)) is not None:
+        values.append(flag)
+    generation, *rolled = await BaseRedis[Any].get_many(values, tx=executor)
+    price = roll.price
+    if rolled and not rolled[0]:
+        # discount on first roll
+        price //= 2
+    return price, generation
+
+
+async def get_prices(
+    executor: AsyncIOExecutor, rolls: Sequence[BaseRoll], discord_id: str
+) -> list[int]:
+    """Prices of rolls for a player, their first roll discount flags fetched in one query."""
+    flags = {i: flag for i, roll in enumerate(rolls) if (flag := roll.first_roll_flag(discord_id))}
+    rolled = await BooleanValue.get_many(list(flags.values()), tx=executor)
+    prices = [roll.price for roll in rolls]
+    for i, already_rolled in zip(flags, rolled):
+        if not already_rolled:
+            # discount on first roll
+            prices[i] //= 2
+    return prices
+
+
+#############
+# Ascension #
+#############
+ASCENSION_COST = 4
+
+
+@dataclass(slots=True)
+class Ascension:
+    id: UUID
+    level: int
+    ascended_from_ids: list[UUID]
+
+
+def plan_ascensions(
+    waifus: Iterable[WaifuAscendCandidatesResultElements], once: bool = False
+) -> dict[UUID, Ascension]:
+    """Ascensions of the waifus of a character, planned in memory.
+
+    In each pass, the waifus of every level are taken by chunks of 4 from the oldest: the first one
+    of a chunk ascends to the next level by absorbing the three others, and becomes the most
+    recent waifu of its new level. Passes go on until nothing ascends, or stop after the first
+    ascension if once.
+    """
+    # level and ordering key of the remaining waifus, ascended ones sort after the others
+    remaining = {w.id: (w.level, (0, w.timestamp.timestamp())) for w in waifus}
+    plan: dict[UUID, Ascension] = {}
+    seq = 0
+    while True:
+        levels = defaultdict[int, list[UUID]](list)
+        for id, (level, _) in remaining.items():
+            levels[level].append(id)
+        for ids in levels.values():
+            ids.sort(key=lambda id: remaining[id][1])
+
+        ascended = False
+        for level, ids in levels.items():
+            for i in range(0, len(ids) - ASCENSION_COST + 1, ASCENSION_COST):
+                to_ascend, *to_absorb = ids[i : i + ASCENSION_COST]
+                seq += 1
+                remaining[to_ascend] = level + 1, (1, seq)
+                for id in to_absorb:
+                    del remaining[id]
+                ascension = plan.setdefault(to_ascend, Ascension(to_ascend, level, []))
+                ascension.level = level + 1
+                ascension.ascended_from_ids += to_absorb
+                ascended = True
+                if once:
+                    return plan
+        if not ascended:
+            return plan